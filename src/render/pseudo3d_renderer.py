@@ -120,6 +120,15 @@ class Renderer:
         bottom = HEIGHT
         return bottom - (bottom - self.horizon) * depth
 
+    @staticmethod
+    def _curvatures(track, xs: list[float]) -> list[float]:
+        """Return curvature at each ``xs`` using the track LUT when available."""
+
+        lut = getattr(track, "lut", None)
+        if callable(lut):
+            return lut().curvature_at(xs).tolist()
+        return [track.curvature_at(x) for x in xs]
+
     # ------------------------------------------------------------------
     def draw(self, env) -> None:
         """Draw the environment to ``self.surface``."""
@@ -132,33 +141,22 @@ class Renderer:
         road_half_prev = BASE_ROAD_HALF
         cx_prev = base_x
         y_prev = bottom
+        slice_curv = self._curvatures(
+            env.track, [player.x + (i / 64.0) * 100 for i in range(65)]
+        )
         for i in range(64):
             depth_prev = i / 64.0
             depth = (i + 1) / 64.0
-            curv_prev = env.track.curvature_at(player.x + depth_prev * 100)
-            curv = env.track.curvature_at(player.x + depth * 100)
+            curv_prev = slice_curv[i]
+            curv = slice_curv[i + 1]
             scale_prev = self.perspective_scale(depth_prev)
             scale = self.perspective_scale(depth)
             road_half_curr = scale * (1 + curv * (i + 1)) * BASE_ROAD_HALF
             road_half_prev = scale_prev * (1 + curv_prev * i) * BASE_ROAD_HALF
             y = self.depth_to_y(depth)
             y_prev = self.depth_to_y(depth_prev)
-            cx = (
-                base_x
-                + sum(
-                    env.track.curvature_at(player.x + d * 100) * (d**2)
-                    for d in (0.0, depth)
-                )
-                * HORIZON_GAIN
-            )
-            cx_prev = (
-                base_x
-                + sum(
-                    env.track.curvature_at(player.x + d * 100) * (d**2)
-                    for d in (0.0, depth_prev)
-                )
-                * HORIZON_GAIN
-            )
+            cx = base_x + curv * depth**2 * HORIZON_GAIN
+            cx_prev = base_x + curv_prev * depth_prev**2 * HORIZON_GAIN
             shade = int(60 + 70 * depth)
             road_color = (shade, shade, shade)
             pygame.draw.polygon(
@@ -206,7 +204,10 @@ class Renderer:
 
         sprites = getattr(env, "sprites", [])
         sprites_sorted = sorted(sprites, key=lambda s: s[1], reverse=True)
-        for name, depth, lateral in sprites_sorted:
+        sprite_curv = self._curvatures(
+            env.track, [player.x + s[1] * 100 for s in sprites_sorted]
+        )
+        for (name, depth, lateral), curv in zip(sprites_sorted, sprite_curv):
             frame = name
             steer = getattr(env, "last_steer", 0.0)
             if name == "player_car" and abs(steer) > BANK_THRESHOLD:
@@ -218,14 +219,7 @@ class Renderer:
             w, h = img.get_size()
             img_scaled = pygame.transform.scale(img, (int(w * scale), int(h * scale)))
             img_scaled = self._apply_horizon_fade(img_scaled, depth)
-            cx = (
-                base_x
-                + sum(
-                    env.track.curvature_at(player.x + d * 100) * (d**2)
-                    for d in (0.0, depth)
-                )
-                * HORIZON_GAIN
-            )
+            cx = base_x + curv * depth**2 * HORIZON_GAIN
             slice_y = self.depth_to_y(depth)
             screen_x = int(cx + lateral - img_scaled.get_width() // 2)
             screen_y = int(slice_y - img_scaled.get_height())
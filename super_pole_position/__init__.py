@@ -21,25 +21,63 @@ if os.name != "nt" and "DISPLAY" not in os.environ:
 
 
 
-from .physics.car import Car
-from .physics.track import Track
-from .physics.track_curve import TrackCurve
-from .envs.pole_position import PolePositionEnv
-from .agents.controllers import (
-    GPTPlanner,
-    LowLevelController,
-    LearningAgent,
-)
-from .agents.base_llm_agent import BaseLLMAgent, NullAgent
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - static imports for type checkers
+    from .physics.car import Car
+    from .physics.track import Track
+    from .physics.track_curve import TrackCurve
+    from .envs.pole_position import PolePositionEnv
+    from .envs.vector_env import VectorPolePositionEnv
+    from .agents.controllers import (
+        AsyncPlanner,
+        GPTPlanner,
+        LowLevelController,
+        LearningAgent,
+    )
+    from .agents.base_llm_agent import BaseLLMAgent, NullAgent
+
+# Public name -> defining module, imported on first attribute access
+_LAZY = {
+    "Car": ".physics.car",
+    "Track": ".physics.track",
+    "TrackCurve": ".physics.track_curve",
+    "PolePositionEnv": ".envs.pole_position",
+    "VectorPolePositionEnv": ".envs.vector_env",
+    "GPTPlanner": ".agents.controllers",
+    "AsyncPlanner": ".agents.controllers",
+    "LowLevelController": ".agents.controllers",
+    "LearningAgent": ".agents.controllers",
+    "BaseLLMAgent": ".agents.base_llm_agent",
+    "NullAgent": ".agents.base_llm_agent",
+}
 
 __all__ = [
     "Car",
     "Track",
     "TrackCurve",
     "PolePositionEnv",
+    "VectorPolePositionEnv",
     "GPTPlanner",
+    "AsyncPlanner",
     "LowLevelController",
     "LearningAgent",
     "BaseLLMAgent",
     "NullAgent",
 ]
+
+
+def __getattr__(name: str):
+    """Import public classes on first use to keep package import cheap."""
+
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
@@ -5,8 +5,26 @@
 
 """Agent implementations and controller helpers."""
 
-from .keyboard_agent import KeyboardAgent
-from .joystick_agent import JoystickAgent
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - static imports for type checkers
+    from .keyboard_agent import KeyboardAgent
+    from .joystick_agent import JoystickAgent
+
+# Input agents import pygame, so load them only when requested
+_LAZY = {
+    "KeyboardAgent": ".keyboard_agent",
+    "JoystickAgent": ".joystick_agent",
+}
 
 __all__ = ["KeyboardAgent", "JoystickAgent"]
 
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
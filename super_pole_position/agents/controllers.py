@@ -9,11 +9,18 @@ controllers.py
  
 Houses:
 - GPTPlanner: High-level strategy using a GPT model.
+- AsyncPlanner: Runs a planner on a background thread.
 - LowLevelController: Basic speed/steering control.
 - LearningAgent: Placeholder for real-time learning / RL logic.
 """
 
-from typing import Any, Dict, Iterable, Tuple, cast
+import threading
+import time
+from typing import Any, Dict, Hashable, Iterable, Tuple, cast
+
+import numpy as np
+
+from ..telemetry import RingBuffer, experience_dtype
 
 torch: Any | None = None
 AutoTokenizer: Any | None = None
@@ -82,6 +89,177 @@ class GPTPlanner:
         plan_text = cast(str, self.tokenizer.decode(outputs[0], skip_special_tokens=True))
         return plan_text
 
+class AsyncPlanner:
+    """Run a planner's ``generate_plan`` on a background thread.
+
+    :meth:`generate_plan` hands the state to the worker and returns the
+    most recent finished plan for ``key`` without waiting, so a slow model
+    never stalls the simulation. States the worker has not picked up yet
+    are replaced by newer ones. Until the first plan for a key finishes,
+    ``initial_plan`` is returned. A planner without a loaded model answers
+    instantly, so it is called inline and results stay deterministic.
+
+    :meth:`stats` reports generation latency and how stale the plans in
+    use are, in calls and seconds since their input state was submitted.
+    """
+
+    def __init__(
+        self,
+        planner: Any = None,
+        initial_plan: str = "target_speed 10",
+        latency_capacity: int = 1024,
+    ) -> None:
+        self.planner = planner if planner is not None else GPTPlanner()
+        self.initial_plan = initial_plan
+        self.latencies = RingBuffer(np.float64, latency_capacity, name="plan_latency")
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.dropped = 0
+        # key -> (state, call number, submit time) waiting for the worker
+        self._pending: Dict[Hashable, Tuple[Dict[str, Any], int, float]] = {}
+        # key -> (plan, call number, submit time) of the latest finished plan
+        self._plans: Dict[Hashable, Tuple[str, int, float]] = {}
+        # key -> (calls so far, time of the first call)
+        self._calls: Dict[Hashable, Tuple[int, float]] = {}
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        # Set by ``close``; each worker gets its own so a late one can't revive
+        self._stop = threading.Event()
+        self._busy = False
+
+    @property
+    def tokenizer(self) -> Any:
+        return self.planner.tokenizer
+
+    @property
+    def model(self) -> Any:
+        return self.planner.model
+
+    def load_model(self) -> None:
+        """Load the wrapped planner's model."""
+
+        self.planner.load_model()
+
+    def generate_plan(self, state_dict: Dict[str, Any], key: Hashable = 0) -> str:
+        """Submit ``state_dict`` and return the latest plan for ``key``."""
+
+        now = time.perf_counter()
+        with self._cond:
+            call, first = self._calls.get(key, (0, now))
+            call += 1
+            self._calls[key] = (call, first)
+            if self.planner.tokenizer is None or self.planner.model is None:
+                plan = self.planner.generate_plan(state_dict)
+                self._plans[key] = (plan, call, now)
+                return plan
+            if key in self._pending:
+                self.dropped += 1
+            self._pending[key] = (dict(state_dict), call, now)
+            self.submitted += 1
+            self._ensure_thread()
+            self._cond.notify()
+            return self._plans.get(key, (self.initial_plan,))[0]
+
+    def staleness(self, key: Hashable = 0) -> Tuple[int, float]:
+        """Return ``(calls, seconds)`` since the state behind ``key``'s plan."""
+
+        now = time.perf_counter()
+        with self._cond:
+            calls, first = self._calls.get(key, (0, now))
+            # No plan yet: stale since the first call
+            _, call, submitted = self._plans.get(key, (None, 0, first))
+        return calls - call, now - submitted
+
+    def stats(self) -> Dict[str, float]:
+        """Return counters, latency in ms and the worst plan staleness."""
+
+        with self._cond:
+            lat = np.array(self.latencies.view(), dtype=float)
+            keys = list(self._calls)
+            pending = len(self._pending)
+        stale = [self.staleness(k) for k in keys] or [(0, 0.0)]
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "pending": pending,
+            "latency_ms": 1000.0 * float(lat[-1]) if len(lat) else 0.0,
+            "latency_mean_ms": 1000.0 * float(lat.mean()) if len(lat) else 0.0,
+            "latency_max_ms": 1000.0 * float(lat.max()) if len(lat) else 0.0,
+            "staleness_steps": max(s[0] for s in stale),
+            "staleness_s": max(s[1] for s in stale),
+        }
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until no state is pending; ``False`` if ``timeout`` expires."""
+
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self._pending and not self._busy, timeout
+            )
+
+    def close(self, timeout: float | None = None) -> None:
+        """Stop the worker thread; pending states are discarded.
+
+        A worker still inside ``generate_plan`` when ``timeout`` expires
+        exits once the call returns and its plan is dropped; a later
+        :meth:`generate_plan` starts a new worker meanwhile.
+        """
+
+        with self._cond:
+            self._pending.clear()
+            thread, self._thread = self._thread, None
+            stop, self._stop = self._stop, threading.Event()
+            stop.set()
+            self._busy = False
+            self._cond.notify_all()
+        if thread is not None:
+            thread.join(timeout)
+
+    # ------------------------------------------------------------------
+    def _ensure_thread(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._loop,
+                args=(self._stop,),
+                name="spp-planner",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _loop(self, stop: threading.Event) -> None:
+        cond = self._cond
+        while True:
+            with cond:
+                cond.wait_for(lambda: self._pending or stop.is_set())
+                if stop.is_set():
+                    return
+                # Oldest waiting key first so every race gets updated
+                key = next(iter(self._pending))
+                state, call, submitted = self._pending.pop(key)
+                self._busy = True
+            start = time.perf_counter()
+            try:
+                plan = self.planner.generate_plan(state)
+            except Exception:
+                plan = None
+            elapsed = time.perf_counter() - start
+            with cond:
+                if stop.is_set():
+                    return
+                self._busy = False
+                if plan is None:
+                    self.failed += 1
+                else:
+                    self.completed += 1
+                    self.latencies.append(elapsed)
+                    # An inline call may have produced a newer plan meanwhile
+                    if self._plans.get(key, ("", 0))[1] < call:
+                        self._plans[key] = (plan, call, submitted)
+                cond.notify_all()
+
 class LowLevelController:
     """
     A simple controller that tries to match a target speed and minimal steering logic.
@@ -116,12 +294,64 @@ class LearningAgent:
     Placeholder for real-time learning (RL) approach.
     In a real system, you'd manage experience buffers, do forward/backprop, etc.
     """
-    def __init__(self) -> None:
-        # Simple experience buffer for demonstration purposes
-        self.buffer: list[Tuple[Any, Any, float, Any]] = []
+    def __init__(
+        self,
+        capacity: int = 10000,
+        overflow: str = "drop",
+        spill_dir: str | None = None,
+    ) -> None:
+        """
+        :param capacity: Experiences kept in :attr:`buffer`.
+        :param overflow: ``drop`` overwrites the oldest experience when
+            full; ``spill`` saves full buffers under ``spill_dir``.
+        """
+        # Experience ring buffer, allocated once the observation shape is known
+        self.capacity = capacity
+        self.overflow = overflow
+        self.spill_dir = spill_dir
+        self.buffer: RingBuffer | list = []
+        self.count = 0
         self.total_reward = 0.0
         self.avg_reward = 0.0
 
+    @staticmethod
+    def _action_row(action: Any) -> Tuple[float, float, float, float]:
+        """Return ``action`` as ``(throttle, brake, steer, gear)``."""
+
+        if isinstance(action, dict):
+            return (
+                float(action.get("throttle", 0.0)),
+                float(action.get("brake", 0.0)),
+                float(action.get("steer", 0.0)),
+                float(action.get("gear", 0)),
+            )
+        if isinstance(action, (tuple, list, np.ndarray)):
+            vals = [float(a) for a in list(action)[:4]]
+            vals += [0.0] * (4 - len(vals))
+            return cast(Tuple[float, float, float, float], tuple(vals))
+        # Discrete form: 0=throttle, 1=brake, other=no-op
+        return (float(action == 0), float(action == 1), 0.0, 0.0)
+
+    def record(self, prev_obs: Any, action: Any, reward: float, obs: Any) -> None:
+        """Store one experience in place without building a tuple."""
+
+        if not isinstance(self.buffer, RingBuffer):
+            shape = np.shape(obs)
+            self.buffer = RingBuffer(
+                experience_dtype(shape),
+                capacity=self.capacity,
+                overflow=self.overflow,
+                spill_dir=self.spill_dir,
+                name="experience",
+            )
+        if prev_obs is None:
+            prev_obs = np.nan
+        self.buffer.append((prev_obs, self._action_row(action), reward, obs))
+        # Track running reward statistics for basic learning diagnostics
+        self.count += 1
+        self.total_reward += reward
+        self.avg_reward = self.total_reward / self.count
+
     def update_on_experience(
         self, experience_batch: Iterable[Tuple[Any, Any, float, Any]]
     ) -> None:
@@ -131,10 +361,5 @@ class LearningAgent:
         """
         # A real agent would perform gradient updates here.  We simply
         # accumulate the experiences so they can be inspected later.
-        self.buffer.extend(experience_batch)
-
-        # Track running reward statistics for basic learning diagnostics
-        batch_reward = sum(exp[2] for exp in experience_batch)
-        self.total_reward += batch_reward
-        if self.buffer:
-            self.avg_reward = self.total_reward / len(self.buffer)
+        for prev_obs, action, reward, obs in experience_batch:
+            self.record(prev_obs, action, reward, obs)
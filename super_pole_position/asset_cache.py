@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 MIND INTERFACES, INC. All rights reserved.
+# Licensed under the MIT License.
+
+"""
+asset_cache.py
+Description: Content-hashed disk cache for generated placeholder assets.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import os
+import tempfile
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
+#: Environment variable overriding the cache directory
+CACHE_ENV = "SPP_ASSET_CACHE"
+
+# (path, mtime_ns, size) -> sha256 of the file contents
+_SOURCE_HASHES: dict[tuple[str, int, int], str] = {}
+# generator source hash -> executed module
+_MODULES: dict[str, ModuleType] = {}
+# (generator, name, params) -> cached asset path
+_RESOLVED: dict[tuple[str, str, str], Path] = {}
+
+
+def cache_dir() -> Path:
+    """Return the directory holding generated assets."""
+
+    base = os.getenv(CACHE_ENV)
+    if base:
+        return Path(base)
+    root = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(root) / "super_pole_position" / "assets"
+
+
+def source_hash(path: Path) -> str | None:
+    """Return the SHA-256 of ``path``, memoized on its mtime and size."""
+
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    digest = _SOURCE_HASHES.get(key)
+    if digest is None:
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        _SOURCE_HASHES[key] = digest
+    return digest
+
+
+def load_generator(path: Path) -> ModuleType | None:
+    """Import the generator script at ``path`` once per source version."""
+
+    digest = source_hash(path)
+    if digest is None:
+        return None
+    mod = _MODULES.get(digest)
+    if mod is None:
+        spec = importlib.util.spec_from_file_location(f"_spp_gen_{digest[:12]}", path)
+        if not spec or not spec.loader:
+            return None
+        mod = importlib.util.module_from_spec(spec)
+        try:
+            spec.loader.exec_module(mod)
+        except Exception:
+            return None
+        _MODULES[digest] = mod
+    return mod
+
+
+def cached_asset(
+    generator: Path,
+    name: str,
+    build: Callable[[ModuleType, Path], None],
+    params: Any = None,
+) -> Path | None:
+    """Return the cached file for ``name``, generating it on first use.
+
+    The file name embeds a hash of the generator source, ``name`` and
+    ``repr(params)``, so editing the generator or the parameters yields a
+    fresh asset. ``build(module, path)`` must write the asset to ``path``;
+    it runs at most once per machine for each key and results are
+    published atomically. Returns ``None`` when generation fails.
+    """
+
+    key = (str(generator), name, repr(params))
+    hit = _RESOLVED.get(key)
+    if hit is not None:
+        return hit
+    digest = source_hash(generator)
+    if digest is None:
+        return None
+    blob = "\0".join((digest, name, repr(params))).encode()
+    stem, suffix = os.path.splitext(name)
+    out = cache_dir() / f"{stem}-{hashlib.sha256(blob).hexdigest()[:20]}{suffix}"
+    if not _nonempty(out):
+        mod = load_generator(generator)
+        if mod is None:
+            return None
+        tmp: Path | None = None
+        try:
+            out.parent.mkdir(parents=True, exist_ok=True)
+            # Unique per call so concurrent builders never share a file
+            fd, name_tmp = tempfile.mkstemp(
+                prefix=f".{stem}-", suffix=f".tmp{suffix}", dir=out.parent
+            )
+            os.close(fd)
+            tmp = Path(name_tmp)
+            build(mod, tmp)
+            if _nonempty(tmp):
+                os.replace(tmp, out)
+        except Exception:
+            pass
+        finally:
+            if tmp is not None:
+                try:
+                    tmp.unlink()
+                except OSError:
+                    pass
+        if not _nonempty(out):
+            return None
+    _RESOLVED[key] = out
+    return out
+
+
+def _nonempty(path: Path) -> bool:
+    try:
+        return path.stat().st_size > 0
+    except OSError:
+        return False
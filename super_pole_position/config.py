@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import copy
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Any
 
@@ -21,69 +23,199 @@ DEFAULTS = {
 }
 
 CONFIG_PATH = Path(__file__).resolve().parent.parent / "config.arcade_parity.yaml"
+PACKAGE_CONFIG_PATH = Path(__file__).resolve().parent / "config.arcade_parity.yaml"
 
 CONFIG_DIR = Path(__file__).resolve().parents[1] / "config"
 
 
-def load_parity_config() -> dict[str, Any]:
-    """Return arcade parity parameters from YAML or defaults."""
-    data: dict[str, Any] = {}
-    if yaml and CONFIG_PATH.exists():
-        try:
-            with CONFIG_PATH.open() as fh:
-                loaded = yaml.safe_load(fh)
-                if isinstance(loaded, dict):
-                    data = loaded
-        except Exception:
-            data = {}
-    cfg = DEFAULTS | data
-    if "puddle" in data:
-        puddle = data.get("puddle", {})
-        if isinstance(puddle, dict):
-            cfg["puddle"] = DEFAULTS["puddle"] | puddle
-        else:
-            cfg["puddle"] = DEFAULTS["puddle"]
-    if "audio_volume" in data:
-        try:
-            cfg["audio_volume"] = float(data["audio_volume"])
-        except (TypeError, ValueError):
-            cfg["audio_volume"] = DEFAULTS["audio_volume"]
-    for key in ("engine_volume", "voice_volume", "effects_volume"):
-        if key in data:
+@dataclass
+class ParityConfig:
+    """Typed view of ``config.arcade_parity.yaml`` shared by all modules.
+
+    :func:`get_parity_config` returns one process-wide instance that
+    :meth:`reload` updates in place, so modules may keep a reference to it
+    and read attributes in hot paths without touching the disk.
+    """
+
+    puddle_speed_factor: float = 0.65
+    puddle_angle_jitter: float = 0.2
+    offroad_factor: float = 0.5
+    offroad_speed_factor: float = 0.5
+    audio_volume: float = 0.8
+    engine_volume: float = 0.8
+    voice_volume: float = 1.0
+    effects_volume: float = 0.8
+    engine_pan_spread: float = 0.8
+    engine_base_freq: float = 400.0
+    engine_pitch_factor: float = 3000.0
+    turn_rate: float = 2.5
+    scanline_step: int = 2
+    scanline_spacing: int = 2
+    scanline_alpha: int = 60
+    horizon_sway: float = 0.1
+    #: Merged mapping of defaults and file contents
+    data: dict[str, Any] = field(default_factory=dict, repr=False)
+    #: Flattened numeric values as parsed from the file
+    numeric: dict[str, float] = field(default_factory=dict, repr=False)
+    path: Path | None = None
+    mtime: float | None = None
+
+    def reload(self) -> "ParityConfig":
+        """Re-read the config file and update this instance in place."""
+
+        path = _parity_path()
+        raw = _read_parity_file(path) if path else {}
+        data = DEFAULTS | raw
+        puddle = raw.get("puddle", {})
+        data["puddle"] = DEFAULTS["puddle"] | (puddle if isinstance(puddle, dict) else {})
+        defaults = ParityConfig()
+        for f in fields(self):
+            if f.name not in _TYPED_KEYS:
+                continue
+            section, key = _TYPED_KEYS[f.name]
+            source = data[section] if section else data
+            default = getattr(defaults, f.name)
             try:
-                cfg[key] = float(data[key])
-            except (TypeError, ValueError):
-                cfg[key] = DEFAULTS[key]
-    if "engine_pan_spread" in data:
+                value = type(default)(source[key])
+            except (KeyError, TypeError, ValueError):
+                value = default
+            setattr(self, f.name, value)
+            if f.name in _COERCED_KEYS:
+                data[key] = value
+        self.data = data
+        self.numeric = _flatten_numeric(raw)
+        self.path = path
+        self.mtime = _mtime(path)
+        return self
+
+    def refresh(self) -> bool:
+        """Reload when the file changed on disk; return ``True`` if it did."""
+
+        path = _parity_path()
+        if path == self.path and _mtime(path) == self.mtime:
+            return False
+        self.reload()
+        return True
+
+
+# Typed attribute -> (section, key) in the YAML mapping
+_TYPED_KEYS: dict[str, tuple[str | None, str]] = {
+    "puddle_speed_factor": ("puddle", "speed_factor"),
+    "puddle_angle_jitter": ("puddle", "angle_jitter"),
+    **{
+        name: (None, name)
+        for name in (
+            "offroad_factor",
+            "offroad_speed_factor",
+            "audio_volume",
+            "engine_volume",
+            "voice_volume",
+            "effects_volume",
+            "engine_pan_spread",
+            "engine_base_freq",
+            "engine_pitch_factor",
+            "turn_rate",
+            "scanline_step",
+            "scanline_spacing",
+            "scanline_alpha",
+            "horizon_sway",
+        )
+    },
+}
+
+# Keys ``load_parity_config`` has always returned as validated floats
+_COERCED_KEYS = {
+    "offroad_factor",
+    "audio_volume",
+    "engine_volume",
+    "voice_volume",
+    "effects_volume",
+    "engine_pan_spread",
+}
+
+
+def _parity_path() -> Path | None:
+    """Return the repo config file, falling back to the packaged copy."""
+
+    for path in (CONFIG_PATH, PACKAGE_CONFIG_PATH):
+        if path.exists():
+            return path
+    return None
+
+
+def _mtime(path: Path | None) -> float | None:
+    try:
+        return path.stat().st_mtime if path else None
+    except OSError:
+        return None
+
+
+def _read_parity_file(path: Path) -> dict[str, Any]:
+    """Parse ``path`` with PyYAML, or a minimal ``key: value`` reader."""
+
+    try:
+        text = path.read_text()
+    except OSError:
+        return {}
+    if yaml:
         try:
-            cfg["engine_pan_spread"] = float(data["engine_pan_spread"])
-        except (TypeError, ValueError):
-            cfg["engine_pan_spread"] = DEFAULTS["engine_pan_spread"]
-    if "offroad_factor" in data:
+            loaded = yaml.safe_load(text)
+        except Exception:
+            return {}
+        return loaded if isinstance(loaded, dict) else {}
+    data: dict[str, Any] = {}
+    section: dict[str, Any] | None = None
+    for line in text.splitlines():
+        if ":" not in line or line.lstrip().startswith("#"):
+            continue
+        key, val = (part.strip() for part in line.split(":", 1))
+        target = section if line[:1].isspace() and section is not None else data
+        if not val:
+            section = data.setdefault(key, {})
+            continue
+        if target is data:
+            section = None
         try:
-            cfg["offroad_factor"] = float(data["offroad_factor"])
-        except (TypeError, ValueError):
-            cfg["offroad_factor"] = DEFAULTS["offroad_factor"]
-    return cfg
+            target[key] = float(val) if "." in val else int(val)
+        except ValueError:
+            target[key] = val.strip("'\"")
+    return data
+
+
+def _flatten_numeric(data: dict[str, Any]) -> dict[str, float]:
+    out: dict[str, float] = {}
+    for key, val in data.items():
+        if isinstance(val, dict):
+            out.update(_flatten_numeric(val))
+        elif isinstance(val, (int, float)) and not isinstance(val, bool):
+            out[key] = float(val)
+    return out
+
+
+_PARITY = ParityConfig()
+
+
+def get_parity_config() -> ParityConfig:
+    """Return the shared :class:`ParityConfig`, reloading if the file changed.
+
+    Call this at setup time (module import, env construction or reset);
+    per-step code should read attributes of an already obtained instance.
+    """
+
+    _PARITY.refresh()
+    return _PARITY
+
+
+def load_parity_config() -> dict[str, Any]:
+    """Return arcade parity parameters from YAML or defaults."""
+
+    return copy.deepcopy(get_parity_config().data)
+
 
 def load_arcade_parity() -> dict[str, float]:
-    """Load arcade parity config from YAML file if present."""
-
-    path = Path(__file__).resolve().parent.parent / "config.arcade_parity.yaml"
-    if not path.exists():
-        alt = Path(__file__).resolve().parent / "config.arcade_parity.yaml"
-        if alt.exists():
-            path = alt
-    data: dict[str, float] = {}
-    if path.exists():
-        for line in path.read_text().splitlines():
-            if ":" in line:
-                key, val = line.split(":", 1)
-                try:
-                    data[key.strip()] = float(val.strip())
-                except ValueError:
-                    continue
-    return data
+    """Return numeric arcade parity values with nested keys flattened."""
+
+    return dict(get_parity_config().numeric)
 
 
 def load_default_config() -> dict[str, Any]:
@@ -17,54 +17,105 @@ import numpy as np
 import gymnasium as gym
 import time
 from pathlib import Path
-import importlib.util
 import json
 import platform
 import subprocess
 import sys
 
-try:
-    import pygame  # optional dependency for graphics
-    from pygame import mixer as pg_mixer  # audio via pygame
-except Exception:  # pragma: no cover - optional dependency may be missing
-    pygame = None
-    pg_mixer = None
-
 from ..physics.car import Car
 from ..physics.track import Track
 from ..physics.traffic_car import TrafficCar
+from ..physics.broadphase import SweepAndPrune
 import random
 from random import Random
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from ..ai_cpu import CPUCar
-from ..agents.controllers import GPTPlanner, LowLevelController, LearningAgent
-from ..ui.arcade import Pseudo3DRenderer
+from ..agents.controllers import (
+    AsyncPlanner,
+    GPTPlanner,
+    LowLevelController,
+    LearningAgent,
+)
 
 from ..config import (
-    load_parity_config,
-    load_arcade_parity,
+    get_parity_config,
     load_default_config,
     load_release_config,
 )
-from ..evaluation import submit_score_http, submit_lap_time_http
+from ..evaluation import BATCHER
+from ..asset_cache import cached_asset
+from ..resources import POOL, ResourceHandles
+from ..profiling import FrameProfiler
+from ..telemetry import STEP_DTYPE, RingBuffer
+from ..io_worker import WORKER
+from ..snapshot import clone_env, get_state, set_state
+
+if TYPE_CHECKING:  # pragma: no cover - imported lazily at runtime
+    from ..ui.engine_audio import EngineSynth
+    from ..replay import Trace, TraceRecorder
+
+# Optional pygame modules, imported by ``_load_pygame`` once an env needs them
+pygame = None
+pg_mixer = None
+_PYGAME_LOADED = False
+
+
+def _load_pygame() -> Any:
+    """Import pygame and its mixer on first call and return ``pygame``.
+
+    Headless and training code never pays for the import. Returns ``None``
+    when pygame is unavailable.
+    """
 
-_PARITY_CONFIG = load_arcade_parity()
-ENGINE_BASE_FREQ = _PARITY_CONFIG.get("engine_base_freq", 400.0)
-ENGINE_PITCH_FACTOR = _PARITY_CONFIG.get("engine_pitch_factor", 3000.0)
+    global pygame, pg_mixer, _PYGAME_LOADED
+    if not _PYGAME_LOADED:
+        _PYGAME_LOADED = True
+        try:
+            import pygame as _pygame  # optional dependency for graphics
+            from pygame import mixer as _mixer  # audio via pygame
+        except Exception:  # pragma: no cover - optional dependency may be missing
+            _pygame = _mixer = None
+        pygame, pg_mixer = _pygame, _mixer
+    return pygame
+
+PARITY = get_parity_config()
+ENGINE_BASE_FREQ = PARITY.engine_base_freq
+ENGINE_PITCH_FACTOR = PARITY.engine_pitch_factor
 
 
 def engine_pitch(rpm: float, gear: int = 0) -> float:
     """Return engine frequency in Hz for ``rpm`` and ``gear``."""
 
     gear_factor = 1.0 + 0.1 * max(0, gear)
-    return ENGINE_BASE_FREQ + ENGINE_PITCH_FACTOR * rpm * gear_factor
+    return PARITY.engine_base_freq + PARITY.engine_pitch_factor * rpm * gear_factor
 
 FAST_TEST = bool(int(os.getenv("FAST_TEST", "0")))
-PARITY_CFG = load_parity_config()
 RELEASE_MODE = os.getenv("SPP_RELEASE", "0") == "1"
 CONFIG = load_release_config() if RELEASE_MODE else load_default_config()
 
 
+def _write_play_log(path: Path, data: dict, url: str | None) -> None:
+    """Write a play log to ``path`` and POST it to ``url`` if given."""
+
+    from urllib import request
+
+    try:
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(json.dumps(data, indent=2))
+    except Exception:
+        return
+    if url:
+        try:
+            req = request.Request(
+                url,
+                data=json.dumps(data).encode(),
+                headers={"Content-Type": "application/json"},
+            )
+            request.urlopen(req, timeout=1)
+        except Exception:
+            pass
+
+
 def _seed_all(seed: int) -> None:
     """Seed all random generators used by the environment."""
 
@@ -120,6 +171,14 @@ class PolePositionEnv(gym.Env):
         start_position: int | None = None,
         seed: int | None = None,
         mode_2600: bool = False,
+        training: bool = False,
+        copy_obs: bool = True,
+        profile: bool = False,
+        telemetry_capacity: int = 4096,
+        telemetry_spill: str | None = None,
+        fixed_dt: float | None = None,
+        frame_skip: int = 1,
+        async_planner: bool = False,
     ) -> None:
         """Create a Pole Position environment.
 
@@ -130,9 +189,32 @@ class PolePositionEnv(gym.Env):
         :param hyper: If ``True`` doubles gear limits for extreme speed.
         :param player_name: Name recorded in the high-score table.
         :param start_position: Optional grid position shown at race start.
+        :param training: Headless RL mode. Skips audio assets, console
+            output, per-step logs and score uploads. Implied when
+            ``render_mode`` is ``None``.
+        :param copy_obs: If ``False``, ``reset`` and ``step`` return a view
+            of an internal buffer that the next call overwrites.
+        :param profile: Record per-phase step and render timings in
+            :attr:`profiler` and report each step's under ``info["perf"]``.
+        :param telemetry_capacity: Rows kept in each telemetry ring buffer
+            (``step_log``, durations and the learning agent's experience).
+        :param telemetry_spill: Directory to spill full telemetry buffers to
+            as ``.npy`` chunks. By default the oldest rows are dropped.
+        :param fixed_dt: Advance physics by exactly this many seconds per
+            ``step()`` regardless of frame rate or ``FAST_TEST``. Use
+            :meth:`frame` to run as many steps as real time requires and
+            render an interpolated frame.
+        :param frame_skip: Repeat each action for this many physics frames
+            per ``step()``. Rewards are summed, the call stops early when
+            the episode ends and the observation is built once.
+        :param async_planner: Run the GPT planner on a background thread
+            (see :class:`AsyncPlanner`) so a loaded model never blocks
+            ``step()``; the rival follows the latest finished plan.
         """
 
         super().__init__()
+        if frame_skip < 1:
+            raise ValueError("frame_skip must be at least 1")
         _seed_all(seed)
         self.seed = seed
         self.rng = Random(seed)
@@ -140,6 +222,8 @@ class PolePositionEnv(gym.Env):
 
 
         self.render_mode = render_mode
+        self.training = training or render_mode is None
+        self.copy_obs = copy_obs
         self.mode = mode
         self.hyper = hyper
         self.player_name = player_name
@@ -149,6 +233,7 @@ class PolePositionEnv(gym.Env):
         self.mode_2600 = mode_2600
         self.upload = os.getenv("SPP_UPLOAD", "0") == "1"
         self._start_pos_shown = False
+        self.track_name = track_name
         self.track_file = track_file
 
         limits = {
@@ -181,6 +266,8 @@ class PolePositionEnv(gym.Env):
             self._2600_offsets = [-2.0, 0.0, 2.0, -1.0, 1.0]
             self._next_spawn_step = 150
         self.traffic: list[Car] = []
+        # Traffic sorted along x, refreshed whenever traffic moves
+        self._sweep = SweepAndPrune(self.track.width)
         if self.mode == "race":
             for i in range(self.traffic_count):
                 x = (100 + (i + 1) * 10) % self.track.width
@@ -198,14 +285,20 @@ class PolePositionEnv(gym.Env):
 
         # AI components for second car
         # Load GPT model lazily to avoid startup hiccups
-        self.planner = GPTPlanner(autoload=False)  # High-level
+        self.planner: GPTPlanner | AsyncPlanner = GPTPlanner(autoload=False)  # High-level
+        if async_planner:
+            self.planner = AsyncPlanner(self.planner)
         self.low_level = LowLevelController()
-        self.learning_agent = LearningAgent()
-        self.audio_volume = float(PARITY_CFG.get("audio_volume", 0.8))
-        self.engine_volume = float(PARITY_CFG.get("engine_volume", self.audio_volume))
-        self.voice_volume = float(PARITY_CFG.get("voice_volume", 1.0))
-        self.effects_volume = float(PARITY_CFG.get("effects_volume", self.audio_volume))
-        self.engine_pan_spread = float(PARITY_CFG.get("engine_pan_spread", 0.8))
+        overflow = "spill" if telemetry_spill else "drop"
+        self.learning_agent = LearningAgent(
+            telemetry_capacity, overflow, telemetry_spill
+        )
+        get_parity_config()  # reload if the YAML changed on disk
+        self.audio_volume = PARITY.audio_volume
+        self.engine_volume = PARITY.engine_volume
+        self.voice_volume = PARITY.voice_volume
+        self.effects_volume = PARITY.effects_volume
+        self.engine_pan_spread = PARITY.engine_pan_spread
 
         # Action space for Car 0 when controlled by a human or AI.
         # throttle: 0..1, brake: 0..1, steer: [-1,1]
@@ -234,6 +327,7 @@ class PolePositionEnv(gym.Env):
         low = np.array([0.0] * (7 + 10), dtype=np.float32)
         self.k_traffic = 5
         self.observation_space = gym.spaces.Box(low, high, shape=(7 + 10,), dtype=np.float32)
+        self._obs = np.zeros(7 + 2 * self.k_traffic, dtype=np.float32)
 
         self.remaining_time = self.time_limit
         self.qualifying_time = None
@@ -272,33 +366,85 @@ class PolePositionEnv(gym.Env):
         self.message_timer = 60.0
         self.invulnerable_timer = 0.0
 
-        # Performance metrics
-        self.plan_durations: list[float] = []
-        self.plan_tokens: list[int] = []
-        self.step_durations: list[float] = []
+        # Performance metrics, bounded by ``telemetry_capacity``
+        def ring(dtype: Any, name: str) -> RingBuffer:
+            return RingBuffer(
+                dtype, telemetry_capacity, overflow, telemetry_spill, name
+            )
+
+        self.plan_durations = ring(np.float64, "plan_durations")
+        self.plan_tokens = ring(np.int32, "plan_tokens")
+        self.step_durations = ring(np.float64, "step_durations")
         self.ai_offtrack = 0
         # Per-step metrics for benchmarking
-        self.step_log: list[dict] = []
+        self.step_log = ring(STEP_DTYPE, "step_log")
+        # Log writes and scoreboard requests run on the background worker
+        self._io = WORKER
+        self._batcher = BATCHER
+        # Opt-in per-phase frame timings, see ``profiling.FrameProfiler``
+        self.profiler: FrameProfiler | None = FrameProfiler() if profile else None
+        # Action trace capture, see ``start_recording``
+        self.recorder: "TraceRecorder | None" = None
+        # Frame time forced by ``replay.replay`` instead of the clock
+        self._dt_override: float | None = None
+        # Fixed-timestep loop: unsimulated time, last ``frame()`` call and
+        # the car poses before the latest step for render interpolation
+        self.fixed_dt = fixed_dt
+        self.render_alpha: float | None = None
+        self._accumulator = 0.0
+        self._last_frame: float | None = None
+        self._prev_poses: list[tuple[float, float, float]] | None = None
+        self.frame_skip = int(frame_skip)
 
         self.audio_stream = None
-        self.engine_channel = None
+        self.engine_synth: "EngineSynth | None" = None
+        self.current_step = 0
+        self.max_steps = 500  # limit episode length
+        if FAST_TEST:
+            self.max_steps = 50
+
+        # pygame-related attributes (initialized lazily)
+        self.screen = None
+        self.clock = None
+        self._scale = 3  # pixels per track unit
+        self.renderer = None
+        # Sounds borrowed from the process-wide resource pool
+        self._resources = ResourceHandles()
+
+        if self.training:
+            for name in self._AUDIO_WAVES:
+                setattr(self, name, None)
+            return
+        _load_pygame()
+        self._load_audio_assets()
+
+    # Sound effect attributes populated by ``_load_audio_assets``
+    _AUDIO_WAVES = (
+        "crash_wave",
+        "skid_wave",
+        "prepare_qualify_wave",
+        "prepare_race_wave",
+        "final_lap_wave",
+        "goal_wave",
+        "checkpoint_wave",
+        "shift_wave",
+        "bgm_wave",
+    )
+
+    def _load_audio_assets(self) -> None:
+        """Load all sound effects, sharing decoded sounds across envs."""
+
         base = Path(__file__).resolve().parent.parent.parent / "assets" / "audio"
         gen_path = base / "generate_placeholders.py"
-        gen_mod = None
-        if gen_path.exists():
-            spec = importlib.util.spec_from_file_location("audio_gen", gen_path)
-            if spec and spec.loader:
-                gen_mod = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(gen_mod)
-                if hasattr(gen_mod, "generate_all"):
-                    try:
-                        gen_mod.generate_all(base)
-                    except Exception:
-                        pass
-        def _load_audio(name: str, func_name: str | None, volume: float) -> "pg_mixer.Sound | None":
-            if pg_mixer is None:
-                return None
+
+        def _decode(name: str, func_name: str | None, volume: float) -> "pg_mixer.Sound | None":
             path = base / name
+            if not (path.exists() and path.stat().st_size > 0) and func_name:
+                path = cached_asset(
+                    gen_path,
+                    name,
+                    lambda mod, out: mod.write_wav(out, getattr(mod, func_name)()),
+                ) or path
             if path.exists() and path.stat().st_size > 0:
                 try:
                     snd = pg_mixer.Sound(str(path))
@@ -306,26 +452,20 @@ class PolePositionEnv(gym.Env):
                     return snd
                 except Exception:
                     pass
-            if gen_mod and func_name and hasattr(gen_mod, func_name):
-                try:
-                    if not pg_mixer.get_init():
-                        pg_mixer.init(frequency=gen_mod.SAMPLE_RATE)
-                    data = getattr(gen_mod, func_name)()
-                    arr = np.ascontiguousarray(data * 32767, dtype=np.int16)
-                    snd = pygame.sndarray.make_sound(arr)
-                    snd.set_volume(volume)
-                    return snd
-                except Exception:
-                    return None
-            if pg_mixer is not None:
-                try:
-                    snd = pg_mixer.Sound(buffer=b"\x00\x00")
-                    snd.set_volume(volume)
-                    return snd
-                except Exception:
-                    pass
+            try:
+                snd = pg_mixer.Sound(buffer=b"\x00\x00")
+                snd.set_volume(volume)
+                return snd
+            except Exception:
+                pass
             return None
 
+        def _load_audio(name: str, func_name: str | None, volume: float) -> "pg_mixer.Sound | None":
+            if pg_mixer is None:
+                return None
+            key = ("sound", name, volume, pg_mixer.get_init())
+            return self._resources.get(key, lambda: _decode(name, func_name, volume))
+
         if pg_mixer is not None:
             try:
                 if not pg_mixer.get_init():
@@ -343,16 +483,12 @@ class PolePositionEnv(gym.Env):
         self.checkpoint_wave = _load_audio("checkpoint.wav", "checkpoint", self.effects_volume)
         self.shift_wave = _load_audio("shift.wav", "shift_click", self.effects_volume)
         self.bgm_wave = _load_audio("bgm.wav", "bgm_theme", self.effects_volume)
-        self.current_step = 0
-        self.max_steps = 500  # limit episode length
-        if FAST_TEST:
-            self.max_steps = 50
 
-        # pygame-related attributes (initialized lazily)
-        self.screen = None
-        self.clock = None
-        self._scale = 3  # pixels per track unit
-        self.renderer = None
+    def _announce(self, message: str) -> None:
+        """Print an ``[ENV]`` status line unless in training mode."""
+
+        if not self.training:
+            print(f"[ENV] {message}", flush=True)
 
     def configure_planner(self) -> None:
         """Prompt the player to load the GPT planner on demand."""
@@ -367,12 +503,60 @@ class PolePositionEnv(gym.Env):
                 print(f"Load failed: {exc}", flush=True)
 
 
+    def start_recording(
+        self, checkpoint_every: int = 100, snapshot: bool = False
+    ) -> "TraceRecorder":
+        """Record each following episode as a replayable action trace.
+
+        Recording starts with the next :meth:`reset`. Finished episodes are
+        collected in ``recorder.traces``; with ``snapshot`` each trace also
+        holds :meth:`get_state` from before its reset. See
+        :mod:`super_pole_position.replay`.
+        """
+
+        from ..replay import TraceRecorder
+
+        self.recorder = TraceRecorder(checkpoint_every, snapshot)
+        return self.recorder
+
+    def stop_recording(self) -> "Trace | None":
+        """Stop recording and return the trace of the current episode."""
+
+        if self.recorder is None:
+            return None
+        trace = self.recorder.finish(self)
+        self.recorder = None
+        return trace
+
+    def get_state(self) -> np.ndarray:
+        """Return the simulation state as a flat float64 array.
+
+        See :func:`super_pole_position.snapshot.get_state` for what is
+        included. Pass the result to :meth:`set_state` to rewind.
+        """
+
+        return get_state(self)
+
+    def set_state(self, state: np.ndarray) -> None:
+        """Restore a state returned by :meth:`get_state`."""
+
+        set_state(self, state)
+
+    def clone(self) -> "PolePositionEnv":
+        """Return an independent headless copy for look-ahead search."""
+
+        return clone_env(self)
+
     def reset(
         self, seed: int | None = None, options: dict | None = None
     ) -> tuple[np.ndarray, dict]:
+        if self.recorder is not None:
+            seed = self.recorder.begin(self, seed)
         super().reset(seed=seed)
         _seed_all(seed)
-        print("[ENV] Resetting environment", flush=True)
+        # Config edits apply from the next episode; step() never reads disk
+        get_parity_config()
+        self._announce("Resetting environment")
         self.rng = Random(seed)
         self.np_rng = np.random.default_rng(seed)
         # Keep track hash deterministic after resets
@@ -380,7 +564,12 @@ class PolePositionEnv(gym.Env):
         self.current_step = 0
         self.remaining_time = self.time_limit
         self.qualifying_time = None
+        self.qualifying_rank = None
+        self.passes = 0
+        self.crashes = 0
         self.crash_timer = 0.0
+        self.invulnerable_timer = 0.0
+        self.ai_offtrack = 0
         self.offroad_frames = 0
         self.slipstream_frames = 0
         self.slipstream_timer = 0.0
@@ -404,25 +593,37 @@ class PolePositionEnv(gym.Env):
         self.grid_order = []
         self.lap_extended = False
         self._start_pos_shown = False
+        self._accumulator = 0.0
+        self._last_frame = None
+        self._prev_poses = None
         self.game_message = ""
         self.message_timer = 0.0
 
         # Reset cars to start positions
+        for car in self.cars:
+            car.angle = 0.0
+            car.speed = 0.0
+            car.gear = 0
+            car.shift_count = 0
         self.cars[0].x = 50.0
         self.cars[0].y = self.track.y_at(self.cars[0].x)
-        self.cars[0].angle = 0.0
-        self.cars[0].speed = 0.0
         self.track.start_x = self.cars[0].x
         self.safe_point = (self.cars[0].x, self.cars[0].y)
 
         self.cars[1].x = 150.0
         self.cars[1].y = self.track.y_at(self.cars[1].x)
-        self.cars[1].angle = 0.0
-        self.cars[1].speed = 0.0
 
+        # Restore knocked-down billboards and forget per-car progress hints
+        # so the episode starts exactly like a freshly built env
+        self.track.reset_obstacles()
+        self.track._progress_hints.clear()
         # Recompute track hash after state reset for determinism
         self.track._hash = self.track._compute_hash()
 
+        if self.mode_2600:
+            self._next_spawn_step = 150
+        # Drop cars spawned during the last episode
+        del self.traffic[self.traffic_count :]
         if self.mode == "race":
             for i, t in enumerate(self.traffic):
                 t.x = (100 + (i + 1) * 10) % self.track.width
@@ -433,8 +634,13 @@ class PolePositionEnv(gym.Env):
                 else:
                     t.target_speed = self.rng.uniform(12.0, 15.0)
                 t.y = self.track.height / 2 + self.rng.uniform(-1.0, 1.0)
+                t.angle = 0.0
                 t.speed = 0.0
+                t.gear = 0
+                t.shift_count = 0
                 t.prev_x = t.x
+                if isinstance(t, CPUCar):
+                    self._reset_cpu(t, seed)
 
         self.prev_x = self.cars[0].x
         self.prev_y = self.cars[0].y
@@ -444,13 +650,34 @@ class PolePositionEnv(gym.Env):
         self._play_bgm_loop()
 
         # Clear per-step log
-        self.step_log = []
+        self.step_log.clear()
 
         # Return initial observation
+        self._sweep.update(self.traffic, self.track.width)
         obs = self._get_obs()
         info = {"track_hash": self.track.track_hash}
         return obs, info
 
+    def _reset_cpu(self, cpu: CPUCar, seed: int | None) -> None:
+        """Put ``cpu`` back in the state a fresh env seeded ``seed`` builds.
+
+        The CPU car draws its lane changes from the generator the traffic
+        was built with, so that generator is rebuilt and advanced past the
+        construction draws: two per car plus the CPU car's lane timer.
+        """
+
+        rng = Random(seed)
+        for i in range(len(self.traffic)):
+            rng.random()
+            rng.random()
+            if self.traffic[i] is cpu:
+                cpu._lane_timer = rng.uniform(2.0, 4.0)
+        cpu.rng = rng
+        cpu.preferred_lane = cpu.y
+        cpu.state = "CRUISE"
+        cpu._block_time = 0.0
+        cpu._block_cooldown = 0.0
+
     def step(self, action: Any) -> tuple[np.ndarray, float, bool, bool, dict]:
         """
         Step the environment.
@@ -460,44 +687,97 @@ class PolePositionEnv(gym.Env):
         ``steer`` values.  This keeps backwards compatibility while enabling
         richer human control.
         Car 1 is AI-driven using GPT plan + LowLevelController.
+        With ``frame_skip`` > 1 the action is held for that many frames and
+        the returned reward is their sum.
         """
         step_start = time.perf_counter()
-        if FAST_TEST:
-            self.time_limit = min(self.time_limit, 20.0)
-            self.traffic_count = 2
-            if len(self.traffic) > self.traffic_count:
-                self.traffic = self.traffic[: self.traffic_count]
-        self.current_step += 1
-        if getattr(self, "mode_2600", False) and self.current_step >= getattr(self, "_next_spawn_step", 0):
-            idx = ((self.current_step - self._next_spawn_step) // 150) % len(self._2600_offsets)
-            y = self.track.height / 2 + self._2600_offsets[idx]
-            x = (100 + self.current_step) % self.track.width
-            self.traffic.append(TrafficCar(x=x, y=y, target_speed=8.0))
-            self._next_spawn_step += 150
+        prof = self.profiler
+        if prof is not None:
+            prof.start()
+        throttle, brake, steer, gear_cmd = self._parse_action(action)
         dt = 1.0 / self.metadata.get("render_fps", 60)
         if FAST_TEST:
             dt = 1.0
-        if self.clock is not None:
+        if self.fixed_dt is not None:
+            dt = self.fixed_dt
+            if not self.training:
+                self._prev_poses = [
+                    (c.x, c.y, c.angle) for c in (*self.cars, *self.traffic)
+                ]
+                self.render_alpha = 1.0
+        elif self.clock is not None:
             try:
                 ms = self.clock.get_time()
                 dt = ms / 1000.0 if ms > 0 else dt
             except Exception:
                 pass
-        self.remaining_time = max(self.remaining_time - dt, 0.0)
+        if self._dt_override is not None:
+            dt = self._dt_override
+        prev_obs = None if self.training else self._write_obs().copy()
+        if prof is not None:
+            prof.lap("observation")
 
-        # Reset lap extension flag each frame
-        self.lap_extended = False
-        self.lap_timer += dt
-        if self.lap_flash > 0.0:
-            self.lap_flash = max(self.lap_flash - dt, 0.0)
-        if self.time_extend_flash > 0.0:
-            self.time_extend_flash = max(self.time_extend_flash - dt, 0.0)
-        if self.skid_timer > 0:
-            self.skid_timer = max(self.skid_timer - dt, 0.0)
-        if self.invulnerable_timer > 0:
-            self.invulnerable_timer = max(self.invulnerable_timer - dt, 0.0)
-        prev_obs = self._get_obs()
         reward = 0.0
+        done = crashed = False
+        for _ in range(self.frame_skip):
+            frame_reward, done, crashed = self._tick(throttle, brake, steer, gear_cmd, dt)
+            reward += frame_reward
+            if done or crashed:
+                break
+        if crashed:
+            return self._get_obs(), reward, False, False, self._perf_info({})
+
+        if self.training:
+            if done:
+                self.score += int(self.remaining_time * 5)
+            obs = self._get_obs()
+            if prof is not None:
+                prof.lap("observation")
+            return obs, reward, done, False, self._perf_info({"track_hash": self.track._hash})
+
+        # Record per-step metrics (fields follow ``telemetry.STEP_DTYPE``)
+        self.step_log.append(
+            (
+                self.current_step,
+                self.cars[0].x,
+                self.cars[0].y,
+                self.cars[0].speed,
+                self.cars[1].x,
+                self.cars[1].y,
+                self.cars[1].speed,
+                reward,
+                self.remaining_time,
+                self.lap,
+            )
+        )
+        if done:
+            try:
+                from ..evaluation.logger import log_episode
+
+                log_episode(self, worker=self._io)
+            except Exception:
+                pass
+            self.score += int(self.remaining_time * 5)
+            self._batcher.add_score(self.player_name, int(self.score))
+            self._announce("Race finished")
+        if prof is not None:
+            prof.lap("logging")
+
+        obs = self._get_obs()
+        if prof is not None:
+            prof.lap("observation")
+        self.learning_agent.record(
+            prev_obs, (throttle, brake, steer, gear_cmd), reward, obs
+        )
+        if prof is not None:
+            prof.lap("learning")
+        self.step_durations.append(time.perf_counter() - step_start)
+        info = {"track_hash": self.track.track_hash}
+        return obs, reward, done, False, self._perf_info(info)
+
+    @staticmethod
+    def _parse_action(action: Any) -> tuple[float, float, float, int]:
+        """Return ``(throttle, brake, steer, gear)`` for any accepted action."""
 
         throttle, brake, steer, gear_cmd = 0.0, 0.0, 0.0, 0
         if isinstance(action, (tuple, list)):
@@ -520,17 +800,64 @@ class PolePositionEnv(gym.Env):
             elif action == 1:
                 brake = True
             # else action==2 => no action
+        return throttle, brake, steer, gear_cmd
+
+    def _tick(
+        self, throttle: float, brake: float, steer: float, gear_cmd: int, dt: float
+    ) -> tuple[float, bool, bool]:
+        """Advance the simulation by one frame of ``dt`` seconds.
+
+        Returns ``(reward, done, crashed)``; a crash into traffic ends the
+        frame early with a ``-10`` reward.
+        """
+
+        prof = self.profiler
+        if self.recorder is not None:
+            self.recorder.checkpoint(self)
+        if FAST_TEST:
+            self.time_limit = min(self.time_limit, 20.0)
+            self.traffic_count = 2
+            if len(self.traffic) > self.traffic_count:
+                self.traffic = self.traffic[: self.traffic_count]
+        self.current_step += 1
+        if getattr(self, "mode_2600", False) and self.current_step >= getattr(self, "_next_spawn_step", 0):
+            idx = ((self.current_step - self._next_spawn_step) // 150) % len(self._2600_offsets)
+            y = self.track.height / 2 + self._2600_offsets[idx]
+            x = (100 + self.current_step) % self.track.width
+            self.traffic.append(TrafficCar(x=x, y=y, target_speed=8.0))
+            self._next_spawn_step += 150
+        self.remaining_time = max(self.remaining_time - dt, 0.0)
+
+        # Reset lap extension flag each frame
+        self.lap_extended = False
+        self.lap_timer += dt
+        if self.lap_flash > 0.0:
+            self.lap_flash = max(self.lap_flash - dt, 0.0)
+        if self.time_extend_flash > 0.0:
+            self.time_extend_flash = max(self.time_extend_flash - dt, 0.0)
+        if self.skid_timer > 0:
+            self.skid_timer = max(self.skid_timer - dt, 0.0)
+        if self.invulnerable_timer > 0:
+            self.invulnerable_timer = max(self.invulnerable_timer - dt, 0.0)
+        reward = 0.0
+        if self.recorder is not None:
+            self.recorder.record(throttle, brake, steer, gear_cmd, dt)
+        if prof is not None:
+            prof.lap("timers")
 
         control_active = bool(throttle) or bool(brake)
 
+        self._sweep.update(self.traffic, self.track.width)
         if self.crash_timer <= 0:
-            for t in self.traffic:
+            reach = Car.length * 0.75
+            for i in self._sweep.within(self.cars[0].x, -reach, reach):
+                t = self.traffic[i]
                 dx = (
                     (t.x - self.cars[0].x + self.track.width / 2) % self.track.width
                     - self.track.width / 2
                 )
                 if (
-                    abs(dx) <= Car.length * 0.75
+                    abs(dx) <= reach
                     and abs(t.y - self.cars[0].y) <= Car.width / 2
                     and (control_active or abs(dx) < 0.1)
                 ):
@@ -539,8 +866,10 @@ class PolePositionEnv(gym.Env):
                     self.crash_timer = 2.5
                     self._play_crash_audio()
                     self.cars[0].crash()
-                    print("[ENV] Crash!", flush=True)
-                    return self._get_obs(), -10.0, False, False, {}
+                    self._announce("Crash!")
+                    return -10.0, False, True
+        if prof is not None:
+            prof.lap("collisions")
 
         # Start light sequence (does not block motion in tests)
         if self.start_timer > 0:
@@ -551,7 +880,7 @@ class PolePositionEnv(gym.Env):
                 self.start_phase = "SET"
             else:
                 self.start_phase = "GO"
-                print("[ENV] GO!", flush=True)
+                self._announce("GO!")
         elif (
             self.mode == "race"
             and self.start_position is not None
@@ -570,6 +899,8 @@ class PolePositionEnv(gym.Env):
             self.message_timer = 1.0
         self.cars[0].apply_controls(throttle, brake, steer, dt=dt, track=self.track)
         self.last_steer = steer
+        if prof is not None:
+            prof.lap("physics")
 
         if self.mode == "race":
             # ---- Car 1 (AI) ----
@@ -580,8 +911,11 @@ class PolePositionEnv(gym.Env):
             }
             plan_start = time.perf_counter()
             plan_text = self.planner.generate_plan(state_dict)
-            self.plan_durations.append(time.perf_counter() - plan_start)
-            self.plan_tokens.append(len(plan_text.strip().split()))
+            if not self.training:
+                self.plan_durations.append(time.perf_counter() - plan_start)
+                self.plan_tokens.append(len(plan_text.strip().split()))
+            if prof is not None:
+                prof.lap("planning")
 
             tokens = plan_text.strip().split()
             try:
@@ -614,6 +948,8 @@ class PolePositionEnv(gym.Env):
             )
             if self.cars[1].y < 5 or self.cars[1].y > self.track.height - 5:
                 self.ai_offtrack += 1
+            if prof is not None:
+                prof.lap("physics")
 
             for t in self.traffic:
                 if isinstance(t, CPUCar):
@@ -623,10 +959,15 @@ class PolePositionEnv(gym.Env):
                     th, br, steer_ai = t.policy(track=self.track)
                 t.apply_controls(th, br, steer_ai, dt=dt, track=self.track)
                 self.track.wrap_position(t)
+            if prof is not None:
+                prof.lap("traffic")
 
         # Wrap positions on the track
         for c in self.cars:
             self.track.wrap_position(c)
+        if prof is not None:
+            prof.lap("physics")
+        self._sweep.update(self.traffic, self.track.width)
         if self.cars[0].y < 0.0 or self.cars[0].y > self.track.height:
             if self.crash_timer <= 0:
                 self.crashes += 1
@@ -651,7 +992,7 @@ class PolePositionEnv(gym.Env):
 
         if self.track.in_puddle(self.cars[0]):
             factor = self.track.get_puddle_factor()
-            jitter = PARITY_CFG["puddle"].get("angle_jitter", 0.2)
+            jitter = PARITY.puddle_angle_jitter
             self.cars[0].speed *= factor
             self.cars[0].angle += self.np_rng.uniform(-jitter, jitter)
 
@@ -667,16 +1008,16 @@ class PolePositionEnv(gym.Env):
         if abs(steer) > 0.7 and self.cars[0].speed > 5:
             self.cars[0].speed *= 0.95
             self.skid_timer = 1.0
-            self._play_skid_audio()
+            if not self.training:
+                self._play_skid_audio()
 
         if self.slipstream_enabled:
-            slip = False
-            for other in [self.cars[1]] + self.traffic:
-                dx = (other.x - self.cars[0].x + self.track.width) % self.track.width
-                dy = abs(other.y - self.cars[0].y)
-                if 0 < dx <= 3.0 and dy < 1.0:
-                    slip = True
-                    break
+            slip = self._drafting(self.cars[1])
+            if not slip:
+                for i in self._sweep.within(self.cars[0].x, 0.0, 3.0):
+                    if self._drafting(self.traffic[i]):
+                        slip = True
+                        break
             if slip:
                 self.slipstream_timer += dt
                 if self.slipstream_timer >= 0.5:
@@ -702,8 +1043,14 @@ class PolePositionEnv(gym.Env):
             if self.invulnerable_timer <= 0:
                 pass
 
+        if prof is not None:
+            prof.lap("collisions")
+
         # Binaural audio: generate waveform based on each car's speed
-        self._play_binaural_audio()
+        if not self.training:
+            self._play_binaural_audio()
+        if prof is not None:
+            prof.lap("audio")
 
         # Scoring distance and overtakes
         dist = float(
@@ -711,15 +1058,23 @@ class PolePositionEnv(gym.Env):
             ** 0.5
         )
         self.score += dist * 50
-        for t in self.traffic:
-            if (
-                hasattr(t, "prev_x")
-                and self.prev_x < t.prev_x <= self.cars[0].x
-                and abs(self.cars[0].y - t.y) < 1.0
-            ):
-                self.overtakes += 1
-                self.score += 50
-            t.prev_x = t.x
+        if self.traffic:
+            prev = np.fromiter(
+                (getattr(t, "prev_x", np.nan) for t in self.traffic),
+                dtype=float,
+                count=len(self.traffic),
+            )
+            passed = int(
+                np.count_nonzero(
+                    (self.prev_x < prev)
+                    & (prev <= self.cars[0].x)
+                    & (np.abs(self.cars[0].y - self._sweep.y) < 1.0)
+                )
+            )
+            self.overtakes += passed
+            self.score += 50 * passed
+            for t in self.traffic:
+                t.prev_x = t.x
 
         progress = self.track.progress(self.cars[0])
         if progress < self.prev_progress:
@@ -733,13 +1088,9 @@ class PolePositionEnv(gym.Env):
             self.lap_extended = True
             self.time_extend_flash = 2.0
             self._play_checkpoint_audio()
-            print(f"[ENV] Completed lap {self.lap} in {self.last_lap_time:.2f}s", flush=True)
-            try:
-                submit_lap_time_http(
-                    self.player_name, int(self.last_lap_time * 1000)
-                )
-            except Exception:
-                pass
+            self._announce(f"Completed lap {self.lap} in {self.last_lap_time:.2f}s")
+            if not self.training:
+                self._batcher.add_lap(self.player_name, int(self.last_lap_time * 1000))
             if self.mode == "qualify":
                 self.grid_order = sorted(
                     range(len(self.cars)),
@@ -786,49 +1137,71 @@ class PolePositionEnv(gym.Env):
             self.game_message = "TIME UP!"
             self.message_timer = 90.0
         done = done or (self.current_step >= self.max_steps)
+        if prof is not None:
+            prof.lap("scoring")
+        return reward, done, False
+
+    def frame(
+        self, action: Any, elapsed: float | None = None, max_substeps: int = 8
+    ) -> tuple[np.ndarray, float, bool, bool, dict]:
+        """Simulate the real time since the last frame, then render once.
+
+        Requires ``fixed_dt``. ``elapsed`` (default: wall time since the
+        previous call) is added to an accumulator and ``step(action)`` runs
+        once per whole ``fixed_dt * frame_skip`` in it, at most
+        ``max_substeps`` times so
+        a slow frame cannot snowball. The leftover fraction becomes
+        :attr:`render_alpha`, which the renderer uses to draw cars between
+        their previous and current poses. Rewards of the substeps are
+        summed and ``info["substeps"]`` reports how many ran.
+        """
 
-        # Record per-step metrics
-        self.step_log.append(
-            {
-                "step": self.current_step,
-                "car0_x": self.cars[0].x,
-                "car0_y": self.cars[0].y,
-                "car0_speed": self.cars[0].speed,
-                "car1_x": self.cars[1].x,
-                "car1_y": self.cars[1].y,
-                "car1_speed": self.cars[1].speed,
-                "reward": reward,
-                "remaining_time": self.remaining_time,
-                "lap": self.lap,
-            }
-        )
-        if done:
-            try:
-                from ..evaluation.logger import log_episode
-
-                log_episode(self)
-            except Exception:
-                pass
-            self.score += int(self.remaining_time * 5)
-            try:
-                submit_score_http(self.player_name, int(self.score))
-            except Exception:
-                pass
-            print("[ENV] Race finished", flush=True)
-
-        obs = self._get_obs()
-        experience = (prev_obs, action, reward, obs)
-        self.learning_agent.update_on_experience([experience])
-        self.step_durations.append(time.perf_counter() - step_start)
-        info = {"track_hash": self.track.track_hash}
-        return obs, reward, done, False, info
+        if self.fixed_dt is None:
+            raise ValueError("frame() requires fixed_dt")
+        span = self.fixed_dt * self.frame_skip
+        now = time.perf_counter()
+        if elapsed is None:
+            elapsed = span if self._last_frame is None else now - self._last_frame
+        self._last_frame = now
+        self._accumulator = min(self._accumulator + elapsed, max_substeps * span)
+        total, substeps = 0.0, 0
+        done = truncated = False
+        info: dict = {}
+        obs = None
+        # Tolerate rounding so e.g. 2.5 + 0.5 steps of time run three steps
+        eps = 1e-9 * span
+        while self._accumulator + eps >= span:
+            self._accumulator = max(self._accumulator - span, 0.0)
+            obs, reward, done, truncated, info = self.step(action)
+            total += reward
+            substeps += 1
+            if done or truncated:
+                self._accumulator = 0.0
+                break
+        self.render_alpha = self._accumulator / span
+        if obs is None:
+            obs = self._get_obs()
+        self.render()
+        info["substeps"] = substeps
+        return obs, total, done, truncated, info
 
     def render(self) -> None:
         """Render the environment."""
+        if self.profiler is None:
+            self._render()
+            return
+        start = time.perf_counter()
+        try:
+            self._render()
+        finally:
+            self.profiler.add("render", time.perf_counter() - start)
+
+    def _render(self) -> None:
         global pygame
         if self.render_mode != "human":
             return
 
+        _load_pygame()
         if pygame is None:
             # Fallback textual render
             print(
@@ -840,6 +1213,8 @@ class PolePositionEnv(gym.Env):
             return
 
         if self.screen is None:
+            from ..ui.arcade import Pseudo3DRenderer
+
             try:
                 pygame.init()
                 w = int(CONFIG.get("window_width", 256))
@@ -889,7 +1264,7 @@ class PolePositionEnv(gym.Env):
 
         try:
             if self.renderer:
-                self.renderer.draw(self)
+                self.renderer.draw(self, alpha=self.render_alpha)
             else:
                 self._render_fallback()
             pygame.display.flip()
@@ -899,6 +1274,16 @@ class PolePositionEnv(gym.Env):
             print(f"render failure: {exc}", flush=True)
             self.close()
 
+    def _perf_info(self, info: dict) -> dict:
+        """Close the profiled frame and add its timings to ``info``.
+
+        Render time measured since the previous step is included.
+        """
+
+        if self.profiler is not None:
+            info["perf"] = self.profiler.end_frame()
+        return info
+
     def _render_fallback(self) -> None:
         """Draw a simple top-down view if arcade renderer is unavailable."""
 
@@ -925,57 +1310,32 @@ class PolePositionEnv(gym.Env):
             y = int(car.y * self._scale)
             pygame.draw.circle(self.screen, color, (x, y), 5)
 
-    def _play_binaural_audio(self, duration=0.1, sample_rate=44100):
-        """Generate stereo engine audio with per-player panning."""
+    def _play_binaural_audio(self, sample_rate=44100):
+        """Update the looping stereo engine voices with per-player panning."""
         if pg_mixer is None or pygame is None:
             return
 
-        t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
+        if self.engine_synth is None:
+            if not pg_mixer.get_init():
+                try:
+                    pg_mixer.init(frequency=sample_rate, channels=2)
+                except Exception:
+                    return
+            init = pg_mixer.get_init()
+            rate = init[0] if isinstance(init, tuple) else sample_rate
+            from ..ui.engine_audio import EngineSynth
 
-        def engine_wave(freq):
-            wobble = 0.02 * np.sin(2 * np.pi * 8 * t)
-            mod_freq = freq * (1.0 + wobble)
-            base = 0.3 * np.sin(2 * np.pi * mod_freq * t)
-            harm2 = 0.2 * np.sin(2 * np.pi * mod_freq * 2 * t)
-            harm3 = 0.1 * np.sin(2 * np.pi * mod_freq * 3 * t)
-            rumble = 0.05 * self.np_rng.uniform(-1.0, 1.0, len(t))
-            return base + harm2 + harm3 + rumble
+            self.engine_synth = EngineSynth(sample_rate=rate)
 
         freq0 = engine_pitch(self.cars[0].rpm(), self.cars[0].gear)
         freq1 = engine_pitch(self.cars[1].rpm(), self.cars[1].gear)
 
-        wave0 = engine_wave(freq0)
-        wave1 = engine_wave(freq1)
-
         spread = max(0.0, min(1.0, self.engine_pan_spread))
-        left0_gain = 0.5 + 0.5 * spread
-        right0_gain = 0.5 - 0.5 * spread
-        left1_gain = 0.5 - 0.5 * spread
-        right1_gain = 0.5 + 0.5 * spread
-
-        left = wave0 * left0_gain + wave1 * left1_gain
-        right = wave0 * right0_gain + wave1 * right1_gain
-
-        waveform = np.vstack((left, right)).T
-        waveform = np.clip(waveform, -1.0, 1.0)
-        waveform_int16 = np.ascontiguousarray(waveform * 32767, dtype=np.int16)
-
-        if self.engine_channel is not None:
-            try:
-                self.engine_channel.stop()
-            except Exception:
-                pass
-
-        if not pg_mixer.get_init():
-            try:
-                pg_mixer.init(frequency=sample_rate, channels=2)
-            except Exception:
-                return
-        sound = pygame.sndarray.make_sound(waveform_int16)
-        channel = sound.play()
-        if channel:
-            channel.set_volume(self.engine_volume, self.engine_volume)
-        self.engine_channel = channel
+        near = 0.5 + 0.5 * spread
+        far = 0.5 - 0.5 * spread
+        self.engine_synth.update(
+            [(freq0, near, far), (freq1, far, near)], self.engine_volume
+        )
 
     def _play_crash_audio(self) -> None:
         """Play crash sound effect once."""
@@ -1124,70 +1484,96 @@ class PolePositionEnv(gym.Env):
 
     def close(self) -> None:
         """Clean up resources like audio streams."""
+        if isinstance(self.planner, AsyncPlanner):
+            self.planner.close()
+        if self.training:
+            # No audio or logs in training mode, but render() may have
+            # opened a window
+            self._close_display()
+            return
         if self.audio_stream is not None:
             try:
                 self.audio_stream.stop()
             except Exception:
                 pass
             self.audio_stream = None
-        if self.engine_channel is not None:
-            try:
-                self.engine_channel.stop()
-            except Exception:
-                pass
-            self.engine_channel = None
+        if self.engine_synth is not None:
+            self.engine_synth.stop()
+            self.engine_synth = None
+        self._resources.release()
 
-        if pg_mixer is not None:
+        # Other envs may still be playing pooled sounds
+        if pg_mixer is not None and not POOL.in_use("sound"):
             try:
                 pg_mixer.quit()
             except Exception:
                 pass
 
+        self._close_display()
+        self._dump_play_log()
+        # Barrier: episode logs and submissions are on disk or sent
+        self._batcher.flush()
+        self._io.flush()
+
+    def _close_display(self) -> None:
+        """Release the renderer and quit pygame if a window was opened."""
+
+        if self.renderer is not None and hasattr(self.renderer, "close"):
+            self.renderer.close()
+        self.renderer = None
         if pygame is not None and self.screen is not None:
             pygame.quit()
             self.screen = None
-        self._dump_play_log()
 
-    def _get_obs(self):
-        """Return observation array including nearest traffic cars."""
-        base = [
-            self.cars[0].x,
-            self.cars[0].y,
-            self.cars[0].speed,
-            self.cars[1].x,
-            self.cars[1].y,
-            self.cars[1].speed,
-            self.remaining_time,
-        ]
-        traffic_rel = []
+    def _drafting(self, other) -> bool:
+        """Return ``True`` if ``other`` is just ahead of the player."""
+
+        dx = (other.x - self.cars[0].x + self.track.width) % self.track.width
+        dy = abs(other.y - self.cars[0].y)
+        return 0 < dx <= 3.0 and dy < 1.0
+
+    def _get_obs(self) -> np.ndarray:
+        """Return the observation, copied unless ``copy_obs`` is ``False``."""
+
+        obs = self._write_obs()
+        return obs.copy() if self.copy_obs else obs
+
+    def _write_obs(self) -> np.ndarray:
+        """Fill the observation buffer including nearest traffic cars."""
+
+        obs = self._obs
+        car, rival = self.cars[0], self.cars[1]
+        obs[0] = car.x
+        obs[1] = car.y
+        obs[2] = car.speed
+        obs[3] = rival.x
+        obs[4] = rival.y
+        obs[5] = rival.speed
+        obs[6] = self.remaining_time
+        obs[7:] = 0.0
         if self.traffic:
-            dists = [self.track.distance(self.cars[0], t) for t in self.traffic]
-            ordered = [
-                t for _, t in sorted(zip(dists, self.traffic), key=lambda p: p[0])
-            ]
-            for t in ordered[: self.k_traffic]:
-                dx = t.x - self.cars[0].x
-                dy = t.y - self.cars[0].y
-                traffic_rel.extend([dx, dy])
-        while len(traffic_rel) < 2 * self.k_traffic:
-            traffic_rel.extend([0.0, 0.0])
-        return np.array(base + traffic_rel, dtype=np.float32)
+            if self._sweep.cars is not self.traffic or len(self._sweep) != len(self.traffic):
+                self._sweep.update(self.traffic, self.track.width)
+            nearest = self._sweep.nearest(
+                car.x, self.k_traffic, lambda t: self.track.distance(car, t)
+            )
+            for j, i in enumerate(nearest):
+                t = self.traffic[i]
+                obs[7 + 2 * j] = t.x - car.x
+                obs[8 + 2 * j] = t.y - car.y
+        return obs
 
     def _dump_play_log(self) -> None:
-        """Write play session metrics to ``logs``."""
+        """Queue play session metrics for ``logs`` and optional upload."""
 
         from datetime import datetime
-        import json
-        from urllib import request
 
-        log_dir = Path("logs")
-        log_dir.mkdir(exist_ok=True)
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-        path = log_dir / f"play_{ts}.json"
+        path = Path("logs").resolve() / f"play_{ts}.json"
         best = min(self.lap_times) if self.lap_times else 0.0
         fps = 0.0
         if self.step_durations:
-            avg = sum(self.step_durations) / len(self.step_durations)
+            avg = float(np.mean(self.step_durations))
             if avg:
                 fps = 1.0 / avg
         data = {
@@ -1198,22 +1584,10 @@ class PolePositionEnv(gym.Env):
             "fps_avg": round(fps, 1),
             "seed": self.seed,
         }
-        try:
-            path.write_text(json.dumps(data, indent=2))
-        except Exception:
-            return
-        if self.upload:
+        url = None
+        if self.upload and os.getenv("ALLOW_NET") == "1":
             url = os.getenv("SCOREBOARD_URL", "http://127.0.0.1:8000") + "/telemetry"
-            if os.getenv("ALLOW_NET") == "1":
-                try:
-                    req = request.Request(
-                        url,
-                        data=json.dumps(data).encode(),
-                        headers={"Content-Type": "application/json"},
-                    )
-                    request.urlopen(req, timeout=1)
-                except Exception:
-                    pass
+        self._io.submit(_write_play_log, path, data, url)
 
     def _dump_bug_report(self) -> None:
         """Save screenshot and recent log lines."""
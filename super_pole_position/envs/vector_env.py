@@ -0,0 +1,799 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 MIND INTERFACES, INC. All rights reserved.
+# Licensed under the MIT License.
+
+"""
+vector_env.py
+Description: Batched Pole Position races simulated in lockstep with NumPy.
+"""
+
+from __future__ import annotations
+
+from random import Random
+from typing import Any, Sequence
+
+import numpy as np
+import gymnasium as gym
+
+from ..physics.car import Car, apply_controls_array
+from ..physics.track import Track
+from ..agents.controllers import AsyncPlanner, GPTPlanner
+from ..config import get_parity_config
+from .pole_position import FAST_TEST, PARITY
+
+# CPUCar state machine codes
+_CRUISE, _BLOCK, _RECOVER = 0, 1, 2
+
+
+def _k_smallest(dist: np.ndarray, k: int) -> np.ndarray:
+    """Return per-row indices of the ``k`` smallest values.
+
+    Equivalent to ``np.argsort(dist, axis=1, kind="stable")[:, :k]`` but
+    selects with ``np.partition`` and only sorts the ``k`` winners. Ties at
+    the cut-off keep the lowest indices, as the stable sort would.
+    """
+
+    n, m = dist.shape
+    if k >= m:
+        return np.argsort(dist, axis=1, kind="stable")
+    if k <= 0:
+        return np.empty((n, 0), dtype=np.intp)
+    kth = np.partition(dist, k - 1, axis=1)[:, k - 1 : k]
+    below = dist < kth
+    tied = dist == kth
+    need = k - below.sum(axis=1, keepdims=True)
+    chosen = below | (tied & (np.cumsum(tied, axis=1) <= need))
+    idx = np.nonzero(chosen)[1].reshape(n, k)
+    picked = np.take_along_axis(dist, idx, axis=1)
+    return np.take_along_axis(idx, np.lexsort((idx, picked), axis=1), axis=1)
+
+
+class VectorPolePositionEnv:
+    """Run ``num_envs`` Pole Position races as struct-of-arrays NumPy state.
+
+    Every race shares one :class:`Track` but owns its own cars, timers and
+    random generators.  Column ``0`` of the car arrays is the player, column
+    ``1`` the AI rival and the remaining columns are traffic (column ``2``
+    being the :class:`~super_pole_position.ai_cpu.CPUCar` in race mode).
+
+    ``reset(seed=s)`` gives env ``i`` the same initial state as
+    ``PolePositionEnv(seed=s + i).reset(seed=s + i)`` and ``step`` reproduces
+    the single-env physics, so trajectories match for the same seeds.
+    Audio, logging and score submission are skipped.  Finished races are
+    reset automatically; their last observation is returned in
+    ``info["final_observation"]``.
+    """
+
+    metadata = {"render_modes": [], "render_fps": 60}
+
+    # Per-env state arrays restored for races a crash or frame skip holds still
+    _STATE_FIELDS = (
+        "x",
+        "y",
+        "angle",
+        "speed",
+        "gear",
+        "traffic_prev_x",
+        "cpu_state",
+        "cpu_block_time",
+        "cpu_block_cooldown",
+        "cpu_lane_timer",
+        "cpu_lane",
+        "billboards",
+        "remaining_time",
+        "lap_timer",
+        "lap_flash",
+        "time_extend_flash",
+        "skid_timer",
+        "invulnerable_timer",
+        "crash_timer",
+        "start_timer",
+        "offroad_frames",
+        "slipstream_timer",
+        "slipstream_frames",
+        "crashes",
+        "lap",
+        "last_lap_time",
+        "score",
+        "overtakes",
+        "prev_progress",
+        "prev_x",
+        "prev_y",
+        "safe_x",
+        "safe_y",
+        "ai_offtrack",
+        "shift_count",
+        "last_steer",
+        "lap_extended",
+    )
+
+    def __init__(
+        self,
+        num_envs: int = 8,
+        mode: str = "race",
+        track_name: str | None = None,
+        track_file: str | None = None,
+        hyper: bool = False,
+        slipstream: bool = True,
+        difficulty: str = "beginner",
+        seed: int | None = None,
+        copy_obs: bool = True,
+        frame_skip: int = 1,
+        async_planner: bool = False,
+    ) -> None:
+        """Create ``num_envs`` races sharing one track.
+
+        :param num_envs: Number of races simulated in lockstep.
+        :param mode: ``race`` or ``qualify``.
+        :param track_name: Optional built-in track to load.
+        :param track_file: Path to a custom track JSON file.
+        :param hyper: If ``True`` doubles gear limits for the two main cars.
+        :param slipstream: Enable the slipstream speed boost.
+        :param difficulty: ``beginner`` or ``expert`` time limits.
+        :param seed: Base seed; env ``i`` uses ``seed + i``.
+        :param copy_obs: If ``False``, ``reset`` and ``step`` return a view
+            of an internal buffer that the next call overwrites.
+        :param frame_skip: Repeat each action for this many frames per
+            ``step()``, summing rewards. A race that finishes or crashes
+            stops advancing for the rest of the call.
+        :param async_planner: Plan on a background thread with one
+            :class:`AsyncPlanner` key per race instead of blocking ``step``.
+        """
+
+        if frame_skip < 1:
+            raise ValueError("frame_skip must be at least 1")
+        self.num_envs = int(num_envs)
+        self.mode = mode
+        self.hyper = hyper
+        self.slipstream_enabled = slipstream
+        self.difficulty = difficulty
+        self.seed = seed
+        self.copy_obs = copy_obs
+        self.frame_skip = int(frame_skip)
+        self._seed_rng = np.random.default_rng(seed)
+
+        limits = {
+            "beginner": {"race": 90.0, "qualify": 73.0},
+            "expert": {"race": 75.0, "qualify": 60.0},
+        }
+        self.time_limit = limits.get(difficulty, limits["beginner"])[mode]
+        self.traffic_count = 7 if mode == "race" else 0
+        self.max_steps = 500
+        self.dt = 1.0 / self.metadata["render_fps"]
+        if FAST_TEST:
+            self.time_limit = min(self.time_limit, 3.0)
+            self.traffic_count = 1 if mode == "race" else 0
+            self.max_steps = 50
+            self.dt = 1.0
+
+        if track_file:
+            self.track = Track.from_file(track_file)
+        else:
+            self.track = (
+                Track.load(track_name) if track_name else Track(width=200.0, height=200.0)
+            )
+        self.track.start_x = 50.0
+        self.planner: GPTPlanner | AsyncPlanner = GPTPlanner(autoload=False)
+        if async_planner:
+            self.planner = AsyncPlanner(self.planner)
+        self.k_traffic = 5
+
+        n, t = self.num_envs, self.traffic_count
+        c = 2 + t
+        proto = Car()
+        self.gear_max = np.tile(np.asarray(proto.gear_max, dtype=float), (c, 1))
+        self.unlimited = np.zeros(c, dtype=bool)
+        self.turn_rate = np.full(c, proto.turn_rate)
+        if t:
+            # TrafficCar steers slowly; the CPUCar keeps the default rate
+            self.turn_rate[3:] = 1.0
+        if hyper:
+            self.gear_max[:2] *= 2
+            self.unlimited[:2] = True
+        self.acceleration = proto.acceleration
+
+        self._billboards = [o for o in self.track.obstacles if o.billboard]
+        self._bb = np.array(
+            [(o.x, o.y, o.width / 2, o.height / 2) for o in self._billboards],
+            dtype=float,
+        ).reshape(-1, 4)
+
+        self.x = np.zeros((n, c))
+        self.y = np.zeros((n, c))
+        self.angle = np.zeros((n, c))
+        self.speed = np.zeros((n, c))
+        self.gear = np.zeros((n, c), dtype=np.int64)
+        self.target_speed = np.zeros((n, t))
+        self.traffic_prev_x = np.zeros((n, t))
+        self.cpu_state = np.zeros(n, dtype=np.int64)
+        self.cpu_block_time = np.zeros(n)
+        self.cpu_block_cooldown = np.zeros(n)
+        self.cpu_lane_timer = np.zeros(n)
+        self.cpu_lane = np.zeros(n)
+        self.billboards = np.ones((n, len(self._billboards)), dtype=bool)
+        for name in (
+            "remaining_time",
+            "lap_timer",
+            "lap_flash",
+            "time_extend_flash",
+            "skid_timer",
+            "invulnerable_timer",
+            "crash_timer",
+            "start_timer",
+            "slipstream_timer",
+            "score",
+            "prev_progress",
+            "prev_x",
+            "prev_y",
+            "safe_x",
+            "safe_y",
+            "last_steer",
+        ):
+            setattr(self, name, np.zeros(n))
+        self.last_lap_time = np.full(n, np.nan)
+        for name in (
+            "current_step",
+            "offroad_frames",
+            "slipstream_frames",
+            "crashes",
+            "lap",
+            "overtakes",
+            "ai_offtrack",
+            "shift_count",
+        ):
+            setattr(self, name, np.zeros(n, dtype=np.int64))
+        self.lap_extended = np.zeros(n, dtype=bool)
+        self.seeds: list[int | None] = [None] * n
+        self._np_rngs: list[np.random.Generator] = [np.random.default_rng()] * n
+        self._cpu_rngs: list[Random] = [Random()] * n
+
+        self.single_action_space = gym.spaces.Box(
+            low=np.array([0.0, 0.0, -1.0, -1.0], dtype=np.float32),
+            high=np.array([1.0, 1.0, 1.0, 1.0], dtype=np.float32),
+            shape=(4,),
+        )
+        high = np.array(
+            [
+                self.track.width,
+                self.track.height,
+                self.gear_max[0, -1],
+                self.track.width,
+                self.track.height,
+                self.gear_max[1, -1],
+                999.0,
+            ]
+            + [self.track.width, self.track.height] * self.k_traffic,
+            dtype=np.float32,
+        )
+        low = np.zeros(7 + 2 * self.k_traffic, dtype=np.float32)
+        self.single_observation_space = gym.spaces.Box(
+            low, high, shape=(7 + 2 * self.k_traffic,), dtype=np.float32
+        )
+        self._obs = np.zeros((n, 7 + 2 * self.k_traffic), dtype=np.float32)
+        self.observation_space = gym.spaces.Box(
+            np.tile(low, (n, 1)),
+            np.tile(high, (n, 1)),
+            shape=(n, 7 + 2 * self.k_traffic),
+            dtype=np.float32,
+        )
+        self.action_space = gym.spaces.Box(
+            np.tile(self.single_action_space.low, (n, 1)),
+            np.tile(self.single_action_space.high, (n, 1)),
+            shape=(n, 4),
+        )
+
+    # ------------------------------------------------------------------
+    def _seed_list(self, seed: int | Sequence[int] | None) -> list[int]:
+        if seed is None:
+            return [int(s) for s in self._seed_rng.integers(0, 2**31 - 1, self.num_envs)]
+        if isinstance(seed, (int, np.integer)):
+            return [int(seed) + i for i in range(self.num_envs)]
+        seeds = [int(s) for s in seed]
+        if len(seeds) != self.num_envs:
+            raise ValueError(f"expected {self.num_envs} seeds, got {len(seeds)}")
+        return seeds
+
+    def _reset_env(self, i: int, seed: int) -> None:
+        """Reset race ``i`` to the state of a freshly constructed env."""
+
+        track = self.track
+        t = self.traffic_count
+        self.seeds[i] = seed
+        self._np_rngs[i] = np.random.default_rng(seed)
+
+        # Replicate the draws made by ``PolePositionEnv.__init__``; the CPU
+        # car keeps that generator for its lane changes.
+        init_rng = Random(seed)
+        for j in range(t):
+            init_rng.uniform(*self._speed_band(j))
+            lane = track.height / 2 + init_rng.uniform(-1.0, 1.0)
+            if j == 0:
+                self.cpu_lane[i] = lane
+                self.cpu_lane_timer[i] = init_rng.uniform(2.0, 4.0)
+        self._cpu_rngs[i] = init_rng
+
+        rng = Random(seed)
+        for j in range(t):
+            self.target_speed[i, j] = rng.uniform(*self._speed_band(j))
+            self.y[i, 2 + j] = track.height / 2 + rng.uniform(-1.0, 1.0)
+            self.x[i, 2 + j] = (100 + (j + 1) * 10) % track.width
+        self.traffic_prev_x[i] = self.x[i, 2:]
+        self.cpu_state[i] = _CRUISE
+        self.cpu_block_time[i] = 0.0
+        self.cpu_block_cooldown[i] = 0.0
+
+        self.x[i, 0] = 50.0
+        self.y[i, 0] = track.y_at(50.0)
+        self.x[i, 1] = 150.0
+        self.y[i, 1] = track.y_at(150.0)
+        self.angle[i] = 0.0
+        self.speed[i] = 0.0
+        self.gear[i] = 0
+        self.billboards[i] = True
+
+        self.remaining_time[i] = self.time_limit
+        self.start_timer[i] = 5.0 if self.mode == "race" else 0.0
+        for name in (
+            "lap_timer",
+            "lap_flash",
+            "time_extend_flash",
+            "skid_timer",
+            "invulnerable_timer",
+            "crash_timer",
+            "slipstream_timer",
+            "score",
+            "last_steer",
+            "current_step",
+            "offroad_frames",
+            "slipstream_frames",
+            "crashes",
+            "lap",
+            "overtakes",
+            "ai_offtrack",
+            "shift_count",
+        ):
+            getattr(self, name)[i] = 0
+        self.last_lap_time[i] = np.nan
+        self.lap_extended[i] = False
+        self.safe_x[i] = self.prev_x[i] = self.x[i, 0]
+        self.safe_y[i] = self.prev_y[i] = self.y[i, 0]
+        self.prev_progress[i] = track.progress(Car(x=self.x[i, 0], y=self.y[i, 0]))
+
+    @staticmethod
+    def _speed_band(j: int) -> tuple[float, float]:
+        if j < 3:
+            return 5.0, 7.0
+        if j < 5:
+            return 8.0, 10.0
+        return 12.0, 15.0
+
+    def reset(
+        self, seed: int | Sequence[int] | None = None, options: dict | None = None
+    ) -> tuple[np.ndarray, dict]:
+        """Reset every race and return ``(N, 17)`` observations."""
+
+        get_parity_config()
+        for i, s in enumerate(self._seed_list(seed)):
+            self._reset_env(i, s)
+        return self._get_obs(), {"track_hash": self.track.track_hash}
+
+    # ------------------------------------------------------------------
+    def _parse_actions(self, actions: Any) -> tuple[np.ndarray, ...]:
+        n = self.num_envs
+        if isinstance(actions, dict):
+            throttle = np.broadcast_to(np.asarray(actions.get("throttle", 0.0), dtype=float), (n,))
+            brake = np.broadcast_to(np.asarray(actions.get("brake", 0.0), dtype=float), (n,))
+            steer = np.broadcast_to(np.asarray(actions.get("steer", 0.0), dtype=float), (n,))
+            gear = np.broadcast_to(np.asarray(actions.get("gear", 0), dtype=np.int64), (n,))
+            return throttle, brake, steer, gear
+        arr = np.asarray(actions, dtype=float).reshape(n, -1)
+        if arr.shape[1] < 3:
+            raise ValueError("actions must have throttle, brake and steer columns")
+        gear = arr[:, 3].astype(np.int64) if arr.shape[1] >= 4 else np.zeros(n, dtype=np.int64)
+        return arr[:, 0], arr[:, 1], arr[:, 2], gear
+
+    def _plan_targets(self) -> np.ndarray:
+        """Return the AI rival's target speed for every race."""
+
+        planner = self.planner
+        if planner.tokenizer is None or planner.model is None:
+            texts = [planner.generate_plan({})] * self.num_envs
+        else:
+            states = [
+                {"x": self.x[i, 1], "y": self.y[i, 1], "speed": self.speed[i, 1]}
+                for i in range(self.num_envs)
+            ]
+            if isinstance(planner, AsyncPlanner):
+                texts = [planner.generate_plan(st, key=i) for i, st in enumerate(states)]
+            else:
+                texts = [planner.generate_plan(st) for st in states]
+        targets = self.speed[:, 1].copy()
+        for i, text in enumerate(texts):
+            try:
+                targets[i] = float(text.strip().split()[-1])
+            except (ValueError, IndexError):
+                pass
+        return targets
+
+    def _wrap(self, cols: slice) -> None:
+        track = self.track
+        x = self.x[:, cols]
+        y = self.y[:, cols]
+        if track.curve:
+            self.x[:, cols] = np.clip(x, 0.0, track.width)
+            self.y[:, cols] = np.clip(y, 0.0, track.height)
+        else:
+            x = np.where(x < 0.0, x + track.width, x)
+            self.x[:, cols] = np.where(x >= track.width, x - track.width, x)
+
+    def _crash(self, mask: np.ndarray) -> None:
+        """Apply ``Car.crash`` and start the crash timer where ``mask``."""
+
+        self.crashes += mask
+        self.crash_timer = np.where(mask, 2.5, self.crash_timer)
+        self.speed[:, 0] = np.where(mask, 0.0, self.speed[:, 0])
+        self.gear[:, 0] = np.where(mask, 0, self.gear[:, 0])
+
+    def _update_cpu(self, dt: float, live: np.ndarray) -> None:
+        """Advance the CPUCar state machine held in traffic column 0."""
+
+        track = self.track
+        px, py = self.x[:, 0], self.y[:, 0]
+        cx = self.x[:, 2]
+        cy = self.y[:, 2].copy()
+        state = self.cpu_state
+        self.cpu_block_cooldown = np.maximum(self.cpu_block_cooldown - dt, 0.0)
+
+        behind = (cx - px) % track.width
+        blocking = (0 < behind) & (behind <= 7.0) & (np.abs(cy - py) < 0.5)
+        start = (state == _CRUISE) & (self.cpu_block_cooldown <= 0.0) & blocking
+        state = np.where(start, _BLOCK, state)
+        self.cpu_block_time = np.where(start, 1.0, self.cpu_block_time)
+        self.cpu_block_cooldown = np.where(start, 2.0, self.cpu_block_cooldown)
+
+        cruise = state == _CRUISE
+        self.cpu_lane_timer = np.where(cruise, self.cpu_lane_timer - dt, self.cpu_lane_timer)
+        for i in np.flatnonzero(cruise & (self.cpu_lane_timer <= 0.0) & live):
+            rng = self._cpu_rngs[i]
+            offset = rng.choice([-1.0, 0.0, 1.0])
+            self.cpu_lane[i] = track.y_at(cx[i]) + offset
+            self.cpu_lane_timer[i] = rng.uniform(2.0, 4.0)
+        cy = np.where(cruise, cy + (self.cpu_lane - cy) * dt * 0.5, cy)
+
+        block = state == _BLOCK
+        direction = np.where(py > cy, -1.0, 1.0)
+        cy = np.where(block, cy + direction * dt, cy)
+        self.cpu_block_time = np.where(block, self.cpu_block_time - dt, self.cpu_block_time)
+        state = np.where(block & (self.cpu_block_time <= 0), _RECOVER, state)
+
+        recover = state == _RECOVER
+        diff = self.cpu_lane - cy
+        settled = np.abs(diff) < 0.1
+        state = np.where(recover & settled, _CRUISE, state)
+        cy = np.where(recover & ~settled, cy + diff * dt, cy)
+
+        self.cpu_state = state
+        self.y[:, 2] = np.maximum(0.0, np.minimum(track.height, cy))
+
+    def step(
+        self, actions: Any
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, dict]:
+        """Advance every race by ``frame_skip`` frames.
+
+        ``actions`` is an ``(N, 3)`` or ``(N, 4)`` array of
+        ``throttle, brake, steer[, gear]`` or a dict of per-env arrays.
+        Returns ``(obs, rewards, terminated, truncated, info)``.
+        """
+
+        n = self.num_envs
+        throttle, brake, steer, gear_cmd = self._parse_actions(actions)
+        reward = np.zeros(n)
+        done = np.zeros(n, dtype=bool)
+        held = np.zeros(n, dtype=bool)
+        for _ in range(self.frame_skip):
+            frame_reward, finished, crashed = self._tick(
+                throttle, brake, steer, gear_cmd, held
+            )
+            reward += frame_reward
+            done |= finished
+            held |= finished | crashed
+            if held.all():
+                break
+
+        obs = self._write_obs()
+        info: dict = {}
+        if done.any():
+            info["final_observation"] = obs.copy()
+            info["_final_observation"] = done.copy()
+            info["final_score"] = np.where(done, self.score, np.nan)
+            for i, s in zip(np.flatnonzero(done), self._seed_list(None)):
+                self._reset_env(int(i), s)
+            # Rows still running are unchanged by the rewrite
+            self._write_obs()
+        obs = obs.copy() if self.copy_obs else obs
+        return obs, reward, done, np.zeros(n, dtype=bool), info
+
+    def _tick(
+        self,
+        throttle: np.ndarray,
+        brake: np.ndarray,
+        steer: np.ndarray,
+        gear_cmd: np.ndarray,
+        held: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Advance every race not in ``held`` by one frame.
+
+        Returns per-env ``(reward, done, crashed)``. Held races keep their
+        state and get a zero reward.
+        """
+
+        track = self.track
+        dt = self.dt
+        n = self.num_envs
+
+        self.current_step += ~held
+        # Held races are saved before this frame touches any of their state
+        held_state = self._save_rows(held)
+        self.remaining_time = np.maximum(self.remaining_time - dt, 0.0)
+        self.lap_extended[:] = False
+        self.lap_timer += dt
+        for name in ("lap_flash", "time_extend_flash", "skid_timer", "invulnerable_timer"):
+            val = getattr(self, name)
+            setattr(self, name, np.where(val > 0, np.maximum(val - dt, 0.0), val))
+
+        # Player vs traffic crash ends the step early for that race
+        crashed = np.zeros(n, dtype=bool)
+        if self.traffic_count:
+            half = track.width / 2
+            dx = (self.x[:, 2:] - self.x[:, :1] + half) % track.width - half
+            active = (throttle != 0) | (brake != 0)
+            hit = (
+                (np.abs(dx) <= Car.length * 0.75)
+                & (np.abs(self.y[:, 2:] - self.y[:, :1]) <= Car.width / 2)
+                & (active[:, None] | (np.abs(dx) < 0.1))
+            )
+            crashed = (self.crash_timer <= 0) & hit.any(axis=1) & ~held
+            self._crash(crashed)
+        live = ~(crashed | held)
+        crashed_state = self._save_rows(crashed)
+
+        starting = self.start_timer > 0
+        self.start_timer = np.where(starting, self.start_timer - dt, self.start_timer)
+
+        new_gear = np.clip(self.gear[:, 0] + gear_cmd, 0, self.gear_max.shape[1] - 1)
+        self.shift_count += (gear_cmd != 0) & (new_gear != self.gear[:, 0])
+        self.gear[:, 0] = np.where(gear_cmd != 0, new_gear, self.gear[:, 0])
+
+        p = slice(0, 1)
+        x, y, ang, spd = apply_controls_array(
+            self.x[:, p],
+            self.y[:, p],
+            self.angle[:, p],
+            self.speed[:, p],
+            self.gear[:, p],
+            self.gear_max[p],
+            self.turn_rate[p],
+            self.unlimited[p],
+            throttle[:, None],
+            brake[:, None],
+            steer[:, None],
+            dt=dt,
+            track=track,
+            acceleration=self.acceleration,
+        )
+        self.x[:, p], self.y[:, p], self.angle[:, p], self.speed[:, p] = x, y, ang, spd
+        self.last_steer = steer.astype(float)
+
+        if self.mode == "race":
+            target = self._plan_targets()
+            dx = self.x[:, 0] - self.x[:, 1]
+            dy = self.y[:, 0] - self.y[:, 1]
+            dx = (dx + track.width / 2) % track.width - track.width / 2
+            dy = (dy + track.height / 2) % track.height - track.height / 2
+            target_angle = np.arctan2(dy, dx)
+            heading_error = ((target_angle - self.angle[:, 1] + np.pi) % (2 * np.pi)) - np.pi
+            ai_steer = np.where(
+                np.abs(heading_error) > 0.01, np.where(heading_error > 0, 0.1, -0.1), 0.0
+            )
+            c_throttle = [(self.speed[:, 1] < target)[:, None]]
+            c_brake = [(self.speed[:, 1] > target)[:, None]]
+            c_steer = [ai_steer[:, None]]
+
+            if self.traffic_count:
+                self._update_cpu(dt, live)
+                tx, ty = self.x[:, 2:], self.y[:, 2:]
+                tspeed = self.speed[:, 2:]
+                c_throttle.append(tspeed < self.target_speed)
+                c_brake.append(tspeed > self.target_speed)
+                offset = track.y_at_array(tx) - ty
+                c_steer.append(np.maximum(-1.0, np.minimum(1.0, offset * 0.05)))
+
+            o = slice(1, None)
+            x, y, ang, spd = apply_controls_array(
+                self.x[:, o],
+                self.y[:, o],
+                self.angle[:, o],
+                self.speed[:, o],
+                self.gear[:, o],
+                self.gear_max[o],
+                self.turn_rate[o],
+                self.unlimited[o],
+                np.concatenate(c_throttle, axis=1).astype(float),
+                np.concatenate(c_brake, axis=1).astype(float),
+                np.concatenate(c_steer, axis=1),
+                dt=dt,
+                track=track,
+                acceleration=self.acceleration,
+            )
+            self.x[:, o], self.y[:, o], self.angle[:, o], self.speed[:, o] = x, y, ang, spd
+            self.ai_offtrack += (self.y[:, 1] < 5) | (self.y[:, 1] > track.height - 5)
+            self._wrap(slice(2, None))
+
+        self._wrap(slice(0, 2))
+        out = (self.y[:, 0] < 0.0) | (self.y[:, 0] > track.height)
+        self._crash(out & (self.crash_timer <= 0))
+
+        # Off-road slowdown and crash after lingering on the grass
+        off = ~track.on_road_array(self.x[:, 0], self.y[:, 0])
+        cap = 36.0
+        slowed = np.maximum(cap, self.speed[:, 0] - self.acceleration * dt)
+        self.speed[:, 0] = np.where(off & (self.speed[:, 0] > cap), slowed, self.speed[:, 0])
+        self.offroad_frames = np.where(off, self.offroad_frames + 1, 0)
+        self._crash((self.offroad_frames > 30) & (self.crash_timer <= 0))
+
+        puddle = track.in_puddle_array(self.x[:, 0], self.y[:, 0])
+        if puddle.any():
+            factor = track.get_puddle_factor()
+            jitter = PARITY.puddle_angle_jitter
+            self.speed[:, 0] = np.where(puddle, self.speed[:, 0] * factor, self.speed[:, 0])
+            for i in np.flatnonzero(puddle & live):
+                self.angle[i, 0] += self._np_rngs[i].uniform(-jitter, jitter)
+
+        if len(self._billboards):
+            bb = self._bb
+            hit = (
+                self.billboards
+                & (np.abs(self.x[:, :1] - bb[:, 0]) <= bb[:, 2])
+                & (np.abs(self.y[:, :1] - bb[:, 1]) <= bb[:, 3])
+            )
+            struck = hit.any(axis=1)
+            first = np.argmax(hit, axis=1)
+            self.billboards[np.flatnonzero(struck), first[struck]] = False
+            self.remaining_time = np.where(
+                struck, np.maximum(self.remaining_time - 5.0, 0.0), self.remaining_time
+            )
+            self._crash(struck & (self.crash_timer <= 0))
+
+        skid = (np.abs(steer) > 0.7) & (self.speed[:, 0] > 5)
+        self.speed[:, 0] = np.where(skid, self.speed[:, 0] * 0.95, self.speed[:, 0])
+        self.skid_timer = np.where(skid, 1.0, self.skid_timer)
+
+        if self.slipstream_enabled:
+            sdx = (self.x[:, 1:] - self.x[:, :1] + track.width) % track.width
+            sdy = np.abs(self.y[:, 1:] - self.y[:, :1])
+            slip = ((0 < sdx) & (sdx <= 3.0) & (sdy < 1.0)).any(axis=1)
+            timer = np.where(slip, self.slipstream_timer + dt, 0.0)
+            boost = slip & (timer >= 0.5)
+            limit = self.gear_max[0][self.gear[:, 0]] + 5
+            self.speed[:, 0] = np.where(
+                boost, np.minimum(self.speed[:, 0] * 1.05, limit), self.speed[:, 0]
+            )
+            self.slipstream_frames += boost
+            self.slipstream_timer = np.where(boost, 0.0, timer)
+        else:
+            self.slipstream_timer = np.zeros(n)
+
+        recovering = self.crash_timer > 0
+        self.crash_timer = np.where(recovering, self.crash_timer - dt, self.crash_timer)
+        respawn = recovering & (self.crash_timer <= 0)
+        self.x[:, 0] = np.where(respawn, self.safe_x, self.x[:, 0])
+        self.y[:, 0] = np.where(respawn, self.safe_y, self.y[:, 0])
+        self.speed[:, 0] = np.where(respawn, 0.0, self.speed[:, 0])
+        self.invulnerable_timer = np.where(respawn, 0.5, self.invulnerable_timer)
+        self.safe_x = np.where(recovering, self.safe_x, self.x[:, 0])
+        self.safe_y = np.where(recovering, self.safe_y, self.y[:, 0])
+
+        # Scoring distance and overtakes
+        dist = ((self.x[:, 0] - self.prev_x) ** 2 + (self.y[:, 0] - self.prev_y) ** 2) ** 0.5
+        self.score = self.score + dist * 50
+        if self.traffic_count:
+            passed = (
+                (self.prev_x[:, None] < self.traffic_prev_x)
+                & (self.traffic_prev_x <= self.x[:, :1])
+                & (np.abs(self.y[:, :1] - self.y[:, 2:]) < 1.0)
+            )
+            count = passed.sum(axis=1)
+            self.overtakes += count
+            for k in range(int(count.max())):
+                self.score = np.where(count > k, self.score + 50, self.score)
+            self.traffic_prev_x = self.x[:, 2:].copy()
+
+        progress = track.progress_array(self.x[:, 0], self.y[:, 0])
+        new_lap = progress < self.prev_progress
+        self.lap += new_lap
+        self.score = np.where(new_lap, self.score + 2000, self.score)
+        self.last_lap_time = np.where(new_lap, self.lap_timer, self.last_lap_time)
+        self.lap_timer = np.where(new_lap, 0.0, self.lap_timer)
+        self.lap_flash = np.where(new_lap, 2.0, self.lap_flash)
+        self.remaining_time = np.where(new_lap, self.remaining_time + 30.0, self.remaining_time)
+        self.lap_extended = new_lap
+        self.time_extend_flash = np.where(new_lap, 2.0, self.time_extend_flash)
+
+        self.prev_progress = progress
+        self.prev_x = self.x[:, 0].copy()
+        self.prev_y = self.y[:, 0].copy()
+
+        done = np.zeros(n, dtype=bool)
+        if self.mode == "qualify":
+            elapsed = self.time_limit - self.remaining_time
+            reward = progress - 0.1 * elapsed
+            done |= progress >= 1.0
+        else:
+            reward = self.speed[:, 0] * 0.05
+            ddx = np.abs(self.x[:, 0] - self.x[:, 1])
+            ddy = np.abs(self.y[:, 0] - self.y[:, 1])
+            if not track.curve:
+                ddx = np.minimum(ddx, track.width - ddx)
+            reward = np.where(np.sqrt(ddx * ddx + ddy * ddy) < 5.0, reward - 1.0, reward)
+            done |= self.lap >= 4
+        done |= (self.remaining_time <= 0) & ~self.lap_extended
+        done |= self.current_step >= self.max_steps
+        self.score = np.where(done, self.score + np.trunc(self.remaining_time * 5), self.score)
+
+        for mask, saved in ((crashed, crashed_state), (held, held_state)):
+            if saved is not None:
+                for name, values in saved.items():
+                    getattr(self, name)[mask] = values
+        reward = np.where(crashed, -10.0, np.where(held, 0.0, reward))
+        done &= live
+        return reward.astype(float), done, crashed
+
+    def _save_rows(self, mask: np.ndarray) -> dict[str, np.ndarray] | None:
+        """Copy the :attr:`_STATE_FIELDS` rows selected by ``mask``."""
+
+        if not mask.any():
+            return None
+        return {name: getattr(self, name)[mask].copy() for name in self._STATE_FIELDS}
+
+    # ------------------------------------------------------------------
+    def _get_obs(self) -> np.ndarray:
+        """Return ``(N, 17)`` observations, copied unless ``copy_obs`` is ``False``."""
+
+        obs = self._write_obs()
+        return obs.copy() if self.copy_obs else obs
+
+    def _write_obs(self) -> np.ndarray:
+        """Fill the observation buffer including nearest traffic cars."""
+
+        k = self.k_traffic
+        obs = self._obs
+        obs[:, 0] = self.x[:, 0]
+        obs[:, 1] = self.y[:, 0]
+        obs[:, 2] = self.speed[:, 0]
+        obs[:, 3] = self.x[:, 1]
+        obs[:, 4] = self.y[:, 1]
+        obs[:, 5] = self.speed[:, 1]
+        obs[:, 6] = self.remaining_time
+        obs[:, 7:] = 0.0
+        if self.traffic_count:
+            rel_x = self.x[:, 2:] - self.x[:, :1]
+            rel_y = self.y[:, 2:] - self.y[:, :1]
+            dx = np.abs(rel_x)
+            dy = np.abs(rel_y)
+            if not self.track.curve:
+                dx = np.minimum(dx, self.track.width - dx)
+            order = _k_smallest(np.sqrt(dx * dx + dy * dy), k)
+            m = order.shape[1]
+            obs[:, 7 : 7 + 2 * m : 2] = np.take_along_axis(rel_x, order, axis=1)
+            obs[:, 8 : 8 + 2 * m : 2] = np.take_along_axis(rel_y, order, axis=1)
+        return obs
+
+    def render(self) -> None:
+        """Batched races are headless; rendering is a no-op."""
+
+    def close(self) -> None:
+        """Release resources; only the async planner thread needs stopping."""
+
+        if isinstance(self.planner, AsyncPlanner):
+            self.planner.close()
@@ -14,25 +14,36 @@ from .metrics import summary, lap_time
 from .scores import (
     load_scores,
     update_scores,
+    merge_scores,
     reset_scores,
     submit_score_http,
+    submit_scores_http,
 )
 from .lap_times import (
     load_lap_times,
     update_lap_times,
+    merge_lap_times,
     reset_lap_times,
     submit_lap_time_http,
+    submit_lap_times_http,
 )
+from .batching import BATCHER, SubmissionBatcher
 
 __all__ = [
     "summary",
     "lap_time",
     "load_scores",
     "update_scores",
+    "merge_scores",
     "reset_scores",
     "submit_score_http",
+    "submit_scores_http",
     "load_lap_times",
     "update_lap_times",
+    "merge_lap_times",
     "reset_lap_times",
     "submit_lap_time_http",
+    "submit_lap_times_http",
+    "BATCHER",
+    "SubmissionBatcher",
 ]
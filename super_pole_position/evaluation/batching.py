@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 MIND INTERFACES, INC. All rights reserved.
+# Licensed under the MIT License.
+
+"""
+batching.py
+Description: Coalesce score and lap submissions into batch requests.
+"""
+
+from __future__ import annotations
+
+import atexit
+import threading
+import time
+from typing import Any, List, Tuple
+
+from ..io_worker import WORKER
+from .lap_times import submit_lap_times_http
+from .scores import submit_scores_http
+
+
+class SubmissionBatcher:
+    """Collect scoreboard submissions and send them in batches.
+
+    Entries are sent to ``/scores/batch`` and ``/laps/batch`` on ``worker``
+    once ``max_batch`` are pending or the oldest has waited ``max_delay``
+    seconds. A timer armed by the first pending entry enforces the delay
+    even if nothing else is added. :meth:`flush` sends whatever is
+    pending.
+    """
+
+    def __init__(
+        self,
+        max_batch: int = 256,
+        max_delay: float = 2.0,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        worker: Any = None,
+    ) -> None:
+        self.max_batch = max(1, int(max_batch))
+        self.max_delay = float(max_delay)
+        self.host = host
+        self.port = port
+        self.worker = worker if worker is not None else WORKER
+        self._scores: List[Tuple[str, int]] = []
+        self._laps: List[Tuple[str, int]] = []
+        self._oldest: float | None = None
+        self._timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+
+    def add_score(self, name: str, score: int) -> None:
+        """Queue a final ``score`` for ``name``."""
+
+        self._add(self._scores, (name, int(score)))
+
+    def add_lap(self, name: str, lap_ms: int) -> None:
+        """Queue a lap time in milliseconds for ``name``."""
+
+        self._add(self._laps, (name, int(lap_ms)))
+
+    def _add(self, pending: List[Tuple[str, int]], entry: Tuple[str, int]) -> None:
+        now = time.monotonic()
+        with self._lock:
+            pending.append(entry)
+            if self._oldest is None:
+                self._oldest = now
+                self._timer = threading.Timer(self.max_delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+            due = (
+                len(self._scores) + len(self._laps) >= self.max_batch
+                or now - self._oldest >= self.max_delay
+            )
+        if due:
+            self.flush()
+
+    def pending(self) -> int:
+        """Return the number of entries not yet handed to the worker."""
+
+        return len(self._scores) + len(self._laps)
+
+    def flush(self) -> None:
+        """Hand all pending entries to the worker as batch requests."""
+
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            scores, self._scores = self._scores, []
+            laps, self._laps = self._laps, []
+            self._oldest = None
+        if scores:
+            self.worker.submit(submit_scores_http, scores, self.host, self.port)
+        if laps:
+            self.worker.submit(submit_lap_times_http, laps, self.host, self.port)
+
+
+#: Batcher shared by all environments in the process
+BATCHER = SubmissionBatcher()
+atexit.register(BATCHER.flush)
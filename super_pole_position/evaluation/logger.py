@@ -13,52 +13,220 @@ from __future__ import annotations
 
 import csv
 import json
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 
+import numpy as np
+
 from .metrics import summary
-from typing import Any
+from typing import Any, Dict, Iterable, Iterator, Mapping, Tuple
 
 # Root directory for benchmark files (can be patched in tests)
 BENCH_ROOT = Path("benchmarks")
 
+#: Step log formats accepted by :func:`log_episode` and their file suffix
+STEP_FORMATS = {
+    "csv": ".csv",
+    "npy": ".npy",
+    "npz": ".npz",
+    "parquet": ".parquet",
+}
+
+
+def _default_format() -> str:
+    """Return the step log format from ``SPP_LOG_FORMAT`` (``csv``)."""
+
+    fmt = os.getenv("SPP_LOG_FORMAT", "csv").lower()
+    return fmt if fmt in STEP_FORMATS else "csv"
+
 
-def log_episode(env: Any, file: Path | None = None, step_file: Path | None = None) -> Path:
-    """Write a JSON summary and step CSV for ``env``.
+def log_episode(
+    env: Any,
+    file: Path | None = None,
+    step_file: Path | None = None,
+    fmt: str | None = None,
+    worker: Any = None,
+) -> Path:
+    """Write a JSON summary and step log for ``env``.
 
     :param env: Environment with metrics attributes.
     :param file: Optional explicit path for the summary JSON. Defaults to
         ``benchmarks/YYYY-MM-DD/<timestamp>.json``.
-    :param step_file: Optional explicit path for per-step CSV. Defaults to
-        ``benchmarks/YYYY-MM-DD/<timestamp>-steps.csv``.
-    :return: Path to the file written.
+    :param step_file: Optional explicit path for the per-step log. Defaults
+        to ``benchmarks/YYYY-MM-DD/<timestamp>-steps.<fmt>``.
+    :param fmt: ``csv`` (row by row), ``npy`` (one structured array that
+        :func:`load_steps` memory-maps), ``npz`` (compressed columns) or
+        ``parquet`` (needs ``pyarrow``). Defaults to ``SPP_LOG_FORMAT``.
+    :param worker: Optional :class:`~super_pole_position.io_worker.IOWorker`.
+        Metrics are copied now and the files are written on the worker.
+    :return: Path to the summary file.
     """
+    fmt = fmt or _default_format()
+    if fmt not in STEP_FORMATS:
+        raise ValueError(f"unknown step log format {fmt!r}")
     date_dir = BENCH_ROOT / datetime.now(timezone.utc).strftime("%Y-%m-%d")
     date_dir.mkdir(parents=True, exist_ok=True)
     if file is None:
         timestamp = datetime.now(timezone.utc).strftime("%H%M%S")
         file = date_dir / f"{timestamp}.json"
     if step_file is None:
-        step_file = date_dir / f"{file.stem}-steps.csv"
+        step_file = date_dir / f"{file.stem}-steps{STEP_FORMATS[fmt]}"
 
     data = summary(env)
     data["timestamp"] = datetime.now(timezone.utc).isoformat()
+    # Snapshot steps so the env may reset while a worker writes them
+    steps: Any = None
+    if getattr(env, "step_log", None):
+        if fmt == "csv":
+            log = env.step_log
+            steps = log.to_dicts() if hasattr(log, "to_dicts") else list(log)
+        else:
+            steps = np.array(step_array(env.step_log))
+    if worker is None:
+        _write_episode(data, steps, file, step_file, fmt)
+    else:
+        worker.submit(_write_episode, data, steps, file, step_file, fmt)
+    return file
+
+
+def _write_episode(
+    data: dict, steps: Any, file: Path, step_file: Path, fmt: str
+) -> None:
     try:
         file.write_text(json.dumps(data, indent=2))
     except Exception as exc:  # pragma: no cover - file error
         print(f"log_episode write error: {exc}", flush=True)
-        return file
+        return
 
-    # Per-step CSV log if env provides ``step_log``
-    if getattr(env, "step_log", None):
-        fields = list(env.step_log[0].keys()) if env.step_log else []
+    # Per-step log if env provided ``step_log``
+    if steps is not None:
         try:
-            with step_file.open("w", newline="") as fh:
-                writer = csv.DictWriter(fh, fieldnames=fields)
-                writer.writeheader()
-                for row in env.step_log:
-                    writer.writerow(row)
-        except Exception as exc:  # pragma: no cover - csv error
+            if fmt == "csv":
+                _write_csv(steps, step_file)
+            else:
+                write_steps(steps, step_file, fmt)
+        except Exception as exc:  # pragma: no cover - write error
             print(f"step log write error: {exc}", flush=True)
 
-    return file
+
+def _write_csv(rows: list, step_file: Path) -> None:
+    fields = list(rows[0].keys())
+    with step_file.open("w", newline="") as fh:
+        writer = csv.DictWriter(fh, fieldnames=fields)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+
+
+def step_array(step_log: Any) -> np.ndarray:
+    """Return ``step_log`` as a structured array, oldest step first.
+
+    Accepts a :class:`~super_pole_position.telemetry.RingBuffer` (exported
+    without copying when possible) or a list of dicts with equal keys.
+    """
+
+    if hasattr(step_log, "view"):
+        return step_log.view()
+    rows = list(step_log)
+    if not rows:
+        return np.zeros(0, dtype=[("step", np.int64)])
+    keys = list(rows[0].keys())
+    dtype = [(k, np.asarray(rows[0][k]).dtype) for k in keys]
+    return np.array([tuple(r[k] for k in keys) for r in rows], dtype=dtype)
+
+
+def write_steps(steps: np.ndarray, path: Path, fmt: str = "npy") -> Path:
+    """Write the structured array ``steps`` to ``path`` in one call."""
+
+    path = Path(path)
+    if fmt == "parquet":
+        try:
+            import pyarrow as pa  # optional dependency
+            import pyarrow.parquet as pq
+        except Exception:
+            print("pyarrow not installed; writing .npz instead", flush=True)
+            fmt, path = "npz", path.with_suffix(".npz")
+        else:
+            table = pa.table({name: steps[name] for name in steps.dtype.names})
+            pq.write_table(table, str(path), compression="zstd")
+            return path
+    if fmt == "npz":
+        with path.open("wb") as fh:
+            np.savez_compressed(fh, **{n: steps[n] for n in steps.dtype.names})
+    elif fmt == "npy":
+        with path.open("wb") as fh:
+            np.save(fh, np.ascontiguousarray(steps))
+    else:
+        raise ValueError(f"unsupported columnar format {fmt!r}")
+    return path
+
+
+def load_steps(path: Path, mmap: bool = True) -> Mapping[str, np.ndarray]:
+    """Return the columns of one step log written by :func:`log_episode`.
+
+    ``.npy`` logs are memory-mapped when ``mmap`` is true so only the
+    columns that are read are paged in; ``.npz`` columns decompress on
+    access and Parquet files are read through a memory map. The result is
+    indexable by field name in every case.
+    """
+
+    path = Path(path)
+    suffix = path.suffix
+    if suffix == ".npy":
+        return np.load(path, mmap_mode="r" if mmap else None)
+    if suffix == ".npz":
+        return np.load(path)
+    if suffix == ".parquet":
+        import pyarrow.parquet as pq  # optional dependency
+
+        table = pq.read_table(str(path), memory_map=mmap)
+        return {name: table[name].to_numpy() for name in table.column_names}
+    if suffix == ".csv":
+        return np.genfromtxt(path, delimiter=",", names=True, dtype=None)
+    raise ValueError(f"unknown step log {path}")
+
+
+def iter_step_logs(
+    root: Path | None = None, formats: Iterable[str] = ("npy", "npz", "parquet")
+) -> Iterator[Tuple[Path, Mapping[str, np.ndarray]]]:
+    """Yield ``(path, columns)`` for step logs under ``root`` in path order."""
+
+    root = Path(root) if root is not None else BENCH_ROOT
+    suffixes = {STEP_FORMATS[f] for f in formats}
+    for path in sorted(root.rglob("*-steps.*")):
+        if path.suffix in suffixes:
+            yield path, load_steps(path)
+
+
+def concat_steps(
+    root: Path | None = None, fields: Iterable[str] | None = None
+) -> Dict[str, np.ndarray]:
+    """Concatenate columns of all columnar step logs under ``root``.
+
+    An ``episode`` column numbers the source files so per-run aggregates
+    are a ``np.bincount``/``np.add.reduceat`` away.
+    """
+
+    parts: Dict[str, list] = {}
+    episodes = []
+    for i, (_, cols) in enumerate(iter_step_logs(root)):
+        names = list(fields) if fields is not None else _names(cols)
+        n = 0
+        for name in names:
+            col = np.asarray(cols[name])
+            parts.setdefault(name, []).append(col)
+            n = len(col)
+        episodes.append(np.full(n, i, dtype=np.int32))
+    out = {name: np.concatenate(chunks) for name, chunks in parts.items()}
+    out["episode"] = (
+        np.concatenate(episodes) if episodes else np.zeros(0, dtype=np.int32)
+    )
+    return out
+
+
+def _names(cols: Mapping[str, np.ndarray]) -> list:
+    dtype = getattr(cols, "dtype", None)
+    if dtype is not None and dtype.names:
+        return list(dtype.names)
+    return list(getattr(cols, "files", None) or cols.keys())
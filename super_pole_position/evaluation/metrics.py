@@ -24,16 +24,16 @@ def summary(env: Any) -> Dict[str, float | int | str | None]:
         "gear_shifts": env.cars[0].shift_count if env.cars else 0,
         "ai_offtrack": getattr(env, "ai_offtrack", 0),
         "avg_plan_ms": (
-            1000.0 * sum(env.plan_durations) / len(env.plan_durations)
+            1000.0 * float(sum(env.plan_durations)) / len(env.plan_durations)
             if getattr(env, "plan_durations", [])
             else 0.0
         ),
         "avg_step_ms": (
-            1000.0 * sum(env.step_durations) / len(env.step_durations)
+            1000.0 * float(sum(env.step_durations)) / len(env.step_durations)
             if getattr(env, "step_durations", [])
             else 0.0
         ),
-        "tokens": sum(getattr(env, "plan_tokens", [])),
+        "tokens": int(sum(getattr(env, "plan_tokens", []))),
     }
 
 
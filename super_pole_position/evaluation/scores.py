@@ -13,8 +13,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, List
-from urllib import request
+from typing import Any, Iterable, List, Tuple
 import logging
 import os
 
@@ -39,15 +38,21 @@ def load_scores(file: Path | None = None) -> List[dict[str, Any]]:
 def update_scores(file: Path | None, name: str, score: int) -> None:
     """Record ``score`` for ``name`` in ``file``."""
 
+    merge_scores(file, [(name, score)])
+
+
+def merge_scores(file: Path | None, entries: Iterable[Tuple[str, int]]) -> None:
+    """Record many ``(name, score)`` pairs with one read and one write."""
+
     file = file or _DEFAULT_FILE
     scores = load_scores(file)
-    scores.append({"name": name, "score": int(score)})
+    scores.extend({"name": name, "score": int(score)} for name, score in entries)
     scores = sorted(scores, key=lambda s: -s["score"])[:10]
     try:
         file.parent.mkdir(parents=True, exist_ok=True)
         file.write_text(json.dumps({"scores": scores}, indent=2))
     except Exception as exc:  # pragma: no cover - file error
-        logger.debug("update_scores error: %s", exc)
+        logger.debug("merge_scores error: %s", exc)
 
 
 def reset_scores(file: Path | None = None) -> None:
@@ -71,6 +76,8 @@ def submit_score_http(
 
     if os.getenv("ALLOW_NET") != "1":
         return False
+    from urllib import request  # deferred: only needed when networking
+
     url = f"http://{host}:{port}/scores"
     data = json.dumps({"name": name, "score": int(score)}).encode()
     req = request.Request(url, data=data, headers={"Content-Type": "application/json"})
@@ -79,3 +86,26 @@ def submit_score_http(
             return 200 <= resp.status < 300
     except Exception:  # pragma: no cover - network failure
         return False
+
+
+def submit_scores_http(
+    entries: Iterable[Tuple[str, int]], host: str = "127.0.0.1", port: int = 8000
+) -> bool:
+    """POST many ``(name, score)`` pairs to ``/scores/batch`` at once.
+
+    Returns ``True`` on success.
+    """
+
+    if os.getenv("ALLOW_NET") != "1":
+        return False
+    from urllib import request  # deferred: only needed when networking
+
+    url = f"http://{host}:{port}/scores/batch"
+    payload = [{"name": name, "score": int(score)} for name, score in entries]
+    data = json.dumps(payload).encode()
+    req = request.Request(url, data=data, headers={"Content-Type": "application/json"})
+    try:
+        with request.urlopen(req, timeout=1) as resp:  # pragma: no cover - network
+            return 200 <= resp.status < 300
+    except Exception:  # pragma: no cover - network failure
+        return False
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 MIND INTERFACES, INC. All rights reserved.
+# Licensed under the MIT License.
+
+"""
+io_worker.py
+Description: Background thread for log writes and scoreboard requests.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+# Queue sentinel waking the worker thread to check its stop event
+_STOP = object()
+
+
+class IOWorker:
+    """Run file writes and HTTP requests off the simulation thread.
+
+    :meth:`submit` enqueues a call on a bounded queue and never blocks;
+    when the queue is full the call is dropped and counted. A daemon
+    thread starts on first use and drains up to ``batch`` jobs per wakeup.
+    :meth:`flush` waits until everything submitted so far has run and
+    :meth:`close` also stops the thread; both give up after ``timeout``. With ``sync=True`` (or
+    ``SPP_SYNC_IO=1``) jobs run inline, which helps when debugging.
+    """
+
+    def __init__(
+        self, maxsize: int = 256, batch: int = 32, sync: bool | None = None
+    ) -> None:
+        self.maxsize = int(maxsize)
+        self.batch = max(1, int(batch))
+        self.sync = os.getenv("SPP_SYNC_IO", "0") == "1" if sync is None else sync
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.dropped = 0
+        self._queue: queue.Queue = queue.Queue(self.maxsize)
+        self._thread: threading.Thread | None = None
+        # Set by ``close`` for the running thread; each thread has its own
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    def submit(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> bool:
+        """Queue ``func(*args, **kwargs)``; return ``False`` if dropped."""
+
+        if self.sync:
+            self.submitted += 1
+            self._run_job((func, args, kwargs))
+            return True
+        self._ensure_thread()
+        try:
+            self._queue.put_nowait((func, args, kwargs))
+        except queue.Full:
+            self.dropped += 1
+            logger.debug("io queue full, dropped %s", getattr(func, "__name__", func))
+            return False
+        self.submitted += 1
+        return True
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until queued jobs finish; ``False`` if ``timeout`` expires."""
+
+        q = self._queue
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with q.all_tasks_done:
+            while q.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                q.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: float | None = None) -> bool:
+        """Flush pending jobs and stop the worker thread.
+
+        Returns ``False`` if ``timeout`` expired first. A thread stuck in a
+        job is then left to exit after its current batch.
+        """
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        done = self.flush(timeout)
+        with self._lock:
+            thread, self._thread = self._thread, None
+            stop, self._stop = self._stop, threading.Event()
+        if thread is not None:
+            stop.set()
+            try:
+                self._queue.put_nowait(_STOP)  # wake an idle thread
+            except queue.Full:
+                pass  # busy; it sees the event after its batch
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+            thread.join(remaining)
+        return done
+
+    def stats(self) -> Dict[str, int]:
+        """Return job counters, including ``pending`` queued jobs."""
+
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "pending": self._queue.unfinished_tasks,
+        }
+
+    # ------------------------------------------------------------------
+    def _ensure_thread(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._loop, args=(self._stop,), name="spp-io", daemon=True
+                )
+                self._thread.start()
+
+    def _loop(self, stop: threading.Event) -> None:
+        q = self._queue
+        while not stop.is_set():
+            jobs = [q.get()]
+            while len(jobs) < self.batch:
+                try:
+                    jobs.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            for job in jobs:
+                if job is not _STOP:
+                    self._run_job(job)
+                q.task_done()
+
+    def _run_job(self, job: tuple) -> None:
+        func, args, kwargs = job
+        try:
+            func(*args, **kwargs)
+            self.completed += 1
+        except Exception as exc:  # pragma: no cover - logged, not raised
+            self.failed += 1
+            logger.debug("io job %s failed: %s", getattr(func, "__name__", func), exc)
+
+
+#: Worker shared by all environments in the process
+WORKER = IOWorker()
+atexit.register(WORKER.close, 5.0)
@@ -12,18 +12,32 @@ Description: Module for Super Pole Position.
 from __future__ import annotations
 
 import json
+import multiprocessing as mp
+import os
+from dataclasses import dataclass
+from multiprocessing import shared_memory
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+import numpy as np
 
 from ..envs.pole_position import PolePositionEnv
-from ..agents.base_llm_agent import BaseLLMAgent
+from ..agents.base_llm_agent import BaseLLMAgent, NullAgent
+from ..evaluation.metrics import summary
 
 
 def run_episode(
-    env: PolePositionEnv, agents: Tuple[BaseLLMAgent, BaseLLMAgent]
+    env: PolePositionEnv,
+    agents: Tuple[BaseLLMAgent, BaseLLMAgent],
+    seed: int | None = None,
+    on_step: Callable[[Any, float], None] | None = None,
 ) -> float:
-    """Run one episode and return cumulative reward for agent 0."""
-    obs, _ = env.reset()
+    """Run one episode and return cumulative reward for agent 0.
+
+    :param seed: Optional seed forwarded to ``env.reset``.
+    :param on_step: Optional callback receiving ``(obs, reward)`` after each step.
+    """
+    obs, _ = env.reset(seed=seed)
     if env.render_mode == "human":
         try:
             env.render()
@@ -31,8 +45,9 @@ def run_episode(
             print(f"render error: {exc}", flush=True)
     done = False
     total = 0.0
+    fixed = env.render_mode == "human" and getattr(env, "fixed_dt", None) is not None
     while not done:
-        if env.render_mode == "human":
+        if env.render_mode == "human" and not fixed:
             try:
                 env.render()
             except Exception as exc:
@@ -49,12 +64,18 @@ def run_episode(
             action0.get("gear", 0),
         )
         try:
-            obs, reward, done, _, _ = env.step(action0_tuple)
+            if fixed:
+                # Real-time substeps plus one interpolated render per frame
+                obs, reward, done, _, _ = env.frame(action0_tuple)
+            else:
+                obs, reward, done, _, _ = env.step(action0_tuple)
         except Exception as exc:
             print(f"step error: {exc}", flush=True)
             break
         total += reward
-        if env.render_mode == "human":
+        if on_step is not None:
+            on_step(obs, reward)
+        if env.render_mode == "human" and not fixed:
             try:
                 env.render()
             except Exception as exc:
@@ -79,3 +100,184 @@ def update_leaderboard(
     results.append(entry)
     data["results"] = sorted(results, key=lambda r: -float(r.get("reward", 0)))[:10]
     file.write_text(json.dumps(data, indent=2))
+
+
+# ---------------------------------------------------------------------------
+# Parallel rollouts
+# ---------------------------------------------------------------------------
+
+def _obs_dim() -> int:
+    """Return the length of a :class:`PolePositionEnv` observation."""
+
+    env = PolePositionEnv(render_mode=None)
+    try:
+        return int(np.prod(env.observation_space.shape))
+    finally:
+        env.close()
+
+
+@dataclass
+class EpisodeSpec:
+    """Parameters of one arena episode run by :class:`ParallelArena`.
+
+    ``agent`` is either a name from ``cli.AGENT_MAP`` or a picklable
+    zero-argument factory such as an agent class.
+    """
+
+    seed: int
+    track_name: str | None = None
+    agent: str | Callable[[], BaseLLMAgent] = NullAgent
+    mode: str = "race"
+    difficulty: str = "beginner"
+
+
+def _make_agent(agent: str | Callable[[], BaseLLMAgent]) -> BaseLLMAgent:
+    if isinstance(agent, str):
+        from ..cli import AGENT_MAP
+
+        return AGENT_MAP[agent]()
+    return agent()
+
+
+def _ring_views(
+    buf: Any, episodes: int, ring_size: int, obs_dim: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return ``(counts, ring)`` arrays backed by shared memory ``buf``.
+
+    ``ring[i, j]`` holds the observation of a step followed by its reward.
+    """
+
+    counts = np.ndarray((episodes,), dtype=np.int64, buffer=buf)
+    ring = np.ndarray(
+        (episodes, ring_size, obs_dim + 1),
+        dtype=np.float32,
+        buffer=buf,
+        offset=counts.nbytes,
+    )
+    return counts, ring
+
+
+#: ``metrics.summary`` fields that training-mode envs never record
+_UNTIMED = ("avg_plan_ms", "avg_step_ms", "tokens")
+
+
+def _record_episode(
+    buf: Any, index: int, spec: EpisodeSpec, episodes: int, ring_size: int, obs_dim: int
+) -> Dict[str, Any]:
+    counts, ring = _ring_views(buf, episodes, ring_size, obs_dim)
+    slot = ring[index]
+
+    def record(obs: Any, reward: float) -> None:
+        n = int(counts[index])
+        row = slot[n % ring_size]
+        row[:obs_dim] = obs
+        row[obs_dim] = reward
+        counts[index] = n + 1
+
+    env = PolePositionEnv(
+        render_mode=None,
+        mode=spec.mode,
+        track_name=spec.track_name,
+        difficulty=spec.difficulty,
+        seed=spec.seed,
+    )
+    agent = _make_agent(spec.agent)
+    total = run_episode(env, (agent, agent), seed=spec.seed, on_step=record)
+    env.close()
+    result: Dict[str, Any] = dict(summary(env))
+    # Headless envs skip the timing rings, so these would only read zero
+    for key in _UNTIMED:
+        result.pop(key, None)
+    result.update(
+        reward=total, seed=spec.seed, track=spec.track_name, steps=int(counts[index])
+    )
+    return result
+
+
+def _arena_worker(task: Tuple[int, EpisodeSpec, str, int, int, int]) -> Dict[str, Any]:
+    """Pool entry point: attach to the shared ring and run one episode."""
+
+    index, spec, shm_name, episodes, ring_size, obs_dim = task
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        return _record_episode(shm.buf, index, spec, episodes, ring_size, obs_dim)
+    finally:
+        shm.close()
+
+
+class ParallelArena:
+    """Run arena episodes across a ``multiprocessing`` worker pool.
+
+    Workers run headless envs and write every ``(obs, reward)`` step into a
+    per-episode ring buffer in one ``shared_memory`` block, so nothing is
+    pickled per step. After :meth:`run` the last ``ring_size`` steps of each
+    episode are available in :attr:`observations` and :attr:`rewards`.
+    ``obs_dim`` defaults to the env's ``observation_space`` size.
+    """
+
+    def __init__(
+        self,
+        processes: int | None = None,
+        ring_size: int = 1024,
+        obs_dim: int | None = None,
+        start_method: str | None = None,
+    ) -> None:
+        if ring_size <= 0:
+            raise ValueError("ring_size must be positive")
+        self.processes = processes or os.cpu_count() or 1
+        self.ring_size = ring_size
+        self.obs_dim = obs_dim if obs_dim is not None else _obs_dim()
+        self.start_method = start_method
+        self.observations: List[np.ndarray] = []
+        self.rewards: List[np.ndarray] = []
+
+    def run(self, specs: Iterable[EpisodeSpec]) -> List[Dict[str, Any]]:
+        """Run every spec and return one ``metrics.summary`` dict per episode.
+
+        ``reward`` is the episode total returned by :func:`run_episode`.
+        Workers run headless, so the plan/step timing and token fields are
+        left out. Each result also carries ``seed``, ``track`` and ``steps``.
+        """
+
+        specs = list(specs)
+        self.observations, self.rewards = [], []
+        if not specs:
+            return []
+        episodes = len(specs)
+        size = episodes * 8 + episodes * self.ring_size * (self.obs_dim + 1) * 4
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        try:
+            tasks = [
+                (i, spec, shm.name, episodes, self.ring_size, self.obs_dim)
+                for i, spec in enumerate(specs)
+            ]
+            self._ring(shm.buf, episodes)[0][:] = 0
+            ctx = mp.get_context(self.start_method)
+            with ctx.Pool(min(self.processes, episodes)) as pool:
+                results = pool.map(_arena_worker, tasks, chunksize=1)
+            self.observations, self.rewards = self._collect(shm.buf, episodes)
+        finally:
+            shm.close()
+            shm.unlink()
+        return results
+
+    def _ring(self, buf: Any, episodes: int) -> Tuple[np.ndarray, np.ndarray]:
+        return _ring_views(buf, episodes, self.ring_size, self.obs_dim)
+
+    def _collect(
+        self, buf: Any, episodes: int
+    ) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+        """Copy each ring out of shared memory in chronological order."""
+
+        counts, ring = self._ring(buf, episodes)
+        observations: List[np.ndarray] = []
+        rewards: List[np.ndarray] = []
+        for i in range(episodes):
+            n = int(counts[i])
+            if n <= self.ring_size:
+                data = ring[i, :n].copy()
+            else:
+                data = np.roll(ring[i], -(n % self.ring_size), axis=0)
+            observations.append(data[:, : self.obs_dim])
+            rewards.append(data[:, self.obs_dim])
+        return observations, rewards
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 MIND INTERFACES, INC. All rights reserved.
+# Licensed under the MIT License.
+
+"""
+broadphase.py
+Description: Sweep-and-prune neighbour queries for cars on a wrapping track.
+"""
+
+from __future__ import annotations
+
+from heapq import heappush, heapreplace
+from typing import Any, Callable, List, Sequence
+
+import numpy as np
+
+# Padding so float rounding never prunes a car the exact test would accept
+_EPS = 1e-9
+
+
+class SweepAndPrune:
+    """Cars sorted by ``x`` modulo the track width.
+
+    :meth:`update` re-reads positions and re-sorts starting from the
+    previous order. NumPy's stable sort is near-linear on such almost
+    sorted input, so a step with coherent motion costs ``O(n)``. Queries
+    return indices into the car list last passed to :meth:`update`.
+    """
+
+    def __init__(self, period: float) -> None:
+        self.period = float(period)
+        self.cars: Sequence[Any] = ()
+        self.x = np.empty(0)
+        self.y = np.empty(0)
+        self._order = np.empty(0, dtype=np.intp)
+        self._keys = np.empty(0)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def update(self, cars: Sequence[Any], period: float | None = None) -> None:
+        """Index the current positions of ``cars``.
+
+        ``period`` replaces the track width, e.g. after a track swap.
+        """
+
+        if period is not None:
+            self.period = float(period)
+        n = len(cars)
+        self.cars = cars
+        self.x = np.fromiter((c.x for c in cars), dtype=float, count=n)
+        self.y = np.fromiter((c.y for c in cars), dtype=float, count=n)
+        order = self._order if len(self._order) == n else np.arange(n)
+        keys = self.x[order] % self.period
+        perm = np.argsort(keys, kind="stable")
+        self._order = order[perm]
+        self._keys = keys[perm]
+
+    def within(self, x: float, lo: float, hi: float) -> np.ndarray:
+        """Return ascending indices of cars whose wrapped ``x`` offset
+        from ``x`` may lie in ``[lo, hi]``."""
+
+        if not len(self._keys):
+            return self._order
+        p = self.period
+        x0 = x % p
+        pad = _EPS * (p + abs(lo) + abs(hi))
+        parts = []
+        for shift in (-p, 0.0, p):
+            a = np.searchsorted(self._keys, x0 + lo + shift - pad, side="left")
+            b = np.searchsorted(self._keys, x0 + hi + shift + pad, side="right")
+            if a < b:
+                parts.append(self._order[a:b])
+        if not parts:
+            return self._order[:0]
+        return np.unique(np.concatenate(parts))
+
+    def nearest(
+        self, x: float, k: int, distance: Callable[[Any], float]
+    ) -> List[int]:
+        """Return indices of the ``k`` cars closest by ``distance``.
+
+        Results are ordered by ``(distance, index)``, matching a stable sort
+        of all cars. ``distance`` must be at least the wrapped ``x`` offset
+        from ``x``; candidates are visited outward from ``x`` and the walk
+        stops once that offset exceeds the ``k``-th best distance.
+        """
+
+        keys = self._keys
+        n = len(keys)
+        if k <= 0 or not n:
+            return []
+        p = self.period
+        x0 = x % p
+        pad = _EPS * p
+        right = int(np.searchsorted(keys, x0))
+        left = right - 1
+        best: list[tuple[float, int]] = []  # max-heap of (-dist, -index)
+        for _ in range(n):
+            gap_r = (keys[right % n] - x0) % p
+            gap_l = (x0 - keys[left % n]) % p
+            if gap_r <= gap_l:
+                j, gap = right % n, gap_r
+                right += 1
+            else:
+                j, gap = left % n, gap_l
+                left -= 1
+            if len(best) == k and gap - pad > -best[0][0]:
+                break
+            i = int(self._order[j])
+            item = (-distance(self.cars[i]), -i)
+            if len(best) < k:
+                heappush(best, item)
+            elif item > best[0]:
+                heapreplace(best, item)
+        return [-i for _, i in sorted(best, reverse=True)]
@@ -12,10 +12,12 @@ from __future__ import annotations
 
 import math
 
-from ..config import load_arcade_parity
+import numpy as np
+
+from ..config import get_parity_config
 from .track import Track
 
-_ARC_CFG = load_arcade_parity()
+PARITY = get_parity_config()
 
 class Car:
     """A basic arcade-style car with position, speed, angle, acceleration."""
@@ -41,7 +43,7 @@ class Car:
         self.gear = 0
         self.max_speed = self.gear_max[-1]
         # Slightly quicker steering for responsive handling
-        default_turn = float(_ARC_CFG.get("turn_rate", 2.5))
+        default_turn = PARITY.turn_rate
         self.turn_rate = turn_rate if turn_rate is not None else default_turn
         self.shift_count = 0
         # If True speed is not clamped by gear ratios (Hyper mode)
@@ -115,3 +117,55 @@ class Car:
 
         self.speed = 0.0
         self.gear = 0
+
+
+def apply_controls_array(
+    x: np.ndarray,
+    y: np.ndarray,
+    angle: np.ndarray,
+    speed: np.ndarray,
+    gear: np.ndarray,
+    gear_max: np.ndarray,
+    turn_rate: np.ndarray | float,
+    unlimited: np.ndarray | bool,
+    throttle: np.ndarray,
+    brake: np.ndarray,
+    steering: np.ndarray,
+    dt: float = 1.0,
+    track: "Track | None" = None,
+    acceleration: float = 2.0,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorised :meth:`Car.apply_controls` over struct-of-arrays car state.
+
+    ``gear_max`` holds the per-gear speed limits in its last axis and is
+    broadcast against ``gear``. Returns new ``(x, y, angle, speed)`` arrays
+    computed with the same operation order as the scalar method so results
+    match per-car updates.
+    """
+
+    throttle = np.asarray(throttle, dtype=float)
+    brake = np.asarray(brake, dtype=float)
+    gear_factor = 1.0 + 0.5 * gear
+    speed = np.where(
+        throttle > 0.0, speed + acceleration * gear_factor * throttle * dt, speed
+    )
+    speed = np.where(brake > 0.0, speed - acceleration * brake * dt, speed)
+
+    limits = np.broadcast_to(gear_max, np.shape(gear) + np.shape(gear_max)[-1:])
+    max_speed = np.take_along_axis(limits, np.asarray(gear)[..., None], axis=-1)[..., 0]
+    speed = np.where(
+        speed < 0.0,
+        0.0,
+        np.where(~np.asarray(unlimited) & (speed > max_speed), max_speed, speed),
+    )
+
+    steer_factor = np.maximum(0.4, 1.0 - speed / (max_speed * 1.2))
+    angle = angle + steering * turn_rate * steer_factor * dt
+
+    x = x + speed * np.cos(angle) * dt
+    y = y + speed * np.sin(angle) * dt
+
+    if track:
+        speed = speed * track.friction_factor_array(x, y)
+        angle = angle + track.slip_angle_array(x, y, dt)
+    return x, y, angle, speed
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 MIND INTERFACES, INC. All rights reserved.
+# Licensed under the MIT License.
+
+"""
+hazard_index.py
+Description: Uniform-grid spatial hash for track hazards.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+Bounds = Tuple[float, float, float, float]
+
+# Hazards covering more cells than this are checked on every query instead
+_MAX_CELLS = 4096
+# Bounds padding so rounding never drops a hazard touching a cell edge
+_PAD = 1e-6
+
+
+class HazardGrid:
+    """Uniform grid over axis-aligned hazard bounds.
+
+    Each hazard is listed in every cell its ``(x0, y0, x1, y1)`` bounds
+    overlap. Queries return candidate indices in ascending order, so a
+    caller that tests them in turn finds the same first match as a linear
+    scan of the original list.
+    """
+
+    def __init__(self, bounds: Sequence[Bounds], cell_size: float = 10.0) -> None:
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.size = len(bounds)
+        self.cell_size = float(cell_size)
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+        self._large: List[int] = []
+        c = self.cell_size
+        for i, (x0, y0, x1, y1) in enumerate(bounds):
+            cx0 = math.floor((x0 - _PAD) / c)
+            cx1 = math.floor((x1 + _PAD) / c)
+            cy0 = math.floor((y0 - _PAD) / c)
+            cy1 = math.floor((y1 + _PAD) / c)
+            if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > _MAX_CELLS:
+                self._large.append(i)
+                continue
+            for cx in range(cx0, cx1 + 1):
+                for cy in range(cy0, cy1 + 1):
+                    self._cells.setdefault((cx, cy), []).append(i)
+
+    def query(self, x: float, y: float) -> Sequence[int]:
+        """Return indices of hazards whose bounds may contain ``(x, y)``."""
+
+        c = self.cell_size
+        try:
+            key = (math.floor(x / c), math.floor(y / c))
+        except (ValueError, OverflowError):  # NaN or infinite position
+            return self._large
+        hits = self._cells.get(key, ())
+        if self._large:
+            return sorted((*hits, *self._large))
+        return hits
+
+    def query_many(self, xs: np.ndarray, ys: np.ndarray) -> List[int]:
+        """Return indices of hazards that may contain any of the points."""
+
+        if not self.size:
+            return []
+        c = self.cell_size
+        cx = np.floor(np.asarray(xs, dtype=float) / c).astype(np.int64).ravel()
+        cy = np.floor(np.asarray(ys, dtype=float) / c).astype(np.int64).ravel()
+        found = set(self._large)
+        cells = self._cells
+        for key in set(zip(cx.tolist(), cy.tolist())):
+            found.update(cells.get(key, ()))
+        return sorted(found)
@@ -16,11 +16,15 @@ from pathlib import Path
 from dataclasses import dataclass
 from importlib import resources
 
-from ..config import load_parity_config
+import numpy as np
+
+from ..config import get_parity_config
+from .hazard_index import HazardGrid
 from .track_curve import TrackCurve
+from .track_lut import TrackLUT
 
 
-_PARITY_CFG = load_parity_config()
+PARITY = get_parity_config()
 
 
 @dataclass
@@ -64,6 +68,20 @@ class Obstacle:
     billboard: bool = False
 
 
+# Axis-aligned bounds of each hazard kind, keyed by ``Track`` attribute
+_HAZARD_BOUNDS = {
+    "puddles": lambda p: (p.x - p.radius, p.y - p.radius, p.x + p.radius, p.y + p.radius),
+    "icy_patches": lambda p: (p.x - p.radius, p.y - p.radius, p.x + p.radius, p.y + p.radius),
+    "surfaces": lambda z: (z.x, z.y, z.x + z.width, z.y + z.height),
+    "obstacles": lambda o: (
+        o.x - o.width / 2,
+        o.y - o.height / 2,
+        o.x + o.width / 2,
+        o.y + o.height / 2,
+    ),
+}
+
+
 class Track:
     """A toroidal track with optional centerline segments and road width."""
 
@@ -94,6 +112,8 @@ class Track:
         self.start_x = 0.0
         self.road_width = road_width
         self.obstacles = obstacles or []
+        # Layout restored by ``reset_obstacles`` after billboards are hit
+        self._start_obstacles = list(self.obstacles)
         self.puddles = puddles or []
         self.surfaces = surfaces or []
         self.icy_patches = icy_patches or []
@@ -102,6 +122,13 @@ class Track:
         self._curve_lengths: list[float] = []
         if self.curve:
             self._curve_lengths = list(self.curve._lengths)
+        # Last nearest-point index per car object for ``progress``
+        self._progress_hints: dict[int, int] = {}
+        # Lookup tables keyed by (track hash, resolution, interpolate)
+        self._luts: dict[tuple, TrackLUT] = {}
+        # Spatial hash per hazard list: kind -> (indexed list, grid)
+        self._hazard_grids: dict[str, tuple[list, HazardGrid]] = {}
+        self.rebuild_hazards()
 
         self._hash = self._compute_hash()
 
@@ -155,11 +182,7 @@ class Track:
     def get_puddle_factor() -> float:
         """Return slowdown factor for puddles from config."""
 
-        cfg = load_parity_config()
-        try:
-            return float(cfg["puddle"]["speed_factor"])
-        except KeyError as exc:  # pragma: no cover - misconfigured config
-            raise KeyError("Missing puddle.speed_factor in config") from exc
+        return PARITY.puddle_speed_factor
 
     # ------------------------------------------------------------------
     # Geometry helpers
@@ -214,6 +237,49 @@ class Track:
             dtheta += 2 * math.pi
         return dtheta / 2e-3
 
+    def lut(self, resolution: float = 0.25, interpolate: bool = False) -> TrackLUT:
+        """Return cached lookup tables for ``y_at``/``angle_at``/``curvature_at``.
+
+        Tables are rebuilt when the track hash changes.
+        """
+
+        key = (self._hash, resolution, interpolate)
+        table = self._luts.get(key)
+        if table is None:
+            if any(k[0] != self._hash for k in self._luts):
+                self._luts.clear()
+            table = TrackLUT(self, resolution, interpolate)
+            self._luts[key] = table
+        return table
+
+    # ------------------------------------------------------------------
+    # Hazard index
+    # ------------------------------------------------------------------
+    def rebuild_hazards(self) -> None:
+        """Re-index all hazards.
+
+        Hazard lists that are replaced or change length are re-indexed
+        automatically; call this after editing hazards in place.
+        """
+
+        for kind in _HAZARD_BOUNDS:
+            self._index_hazards(kind)
+
+    def _index_hazards(self, kind: str) -> HazardGrid:
+        items = getattr(self, kind)
+        bounds = [_HAZARD_BOUNDS[kind](h) for h in items]
+        grid = HazardGrid(bounds, cell_size=max(self.road_width, 1.0))
+        self._hazard_grids[kind] = (items, grid)
+        return grid
+
+    def _hazards(self, kind: str) -> HazardGrid:
+        """Return the grid for ``kind``, rebuilding it if the list changed."""
+
+        items, grid = self._hazard_grids[kind]
+        if items is not getattr(self, kind) or grid.size != len(items):
+            grid = self._index_hazards(kind)
+        return grid
+
     def is_on_road(self, x: float, y: float) -> bool:
         """Return ``True`` if coordinates are within the paved bounds."""
 
@@ -413,17 +479,19 @@ class Track:
     def progress(self, car) -> float:
         """Return lap progress 0..1 based on arc length or x position."""
         if self.curve:
-            x = car.x if hasattr(car, "x") else car[0]
-            y = car.y if hasattr(car, "y") else car[1]
-            best = 0.0
-            best_dist = float("inf")
-            for d, p in zip(self._curve_lengths, self.curve._points[1:]):
-                dx = x - p[0]
-                dy = y - p[1]
-                dist = dx * dx + dy * dy
-                if dist < best_dist:
-                    best_dist = dist
-                    best = d
+            if hasattr(car, "x"):
+                x, y = car.x, car.y
+                key = id(car)
+            else:
+                x, y = car[0], car[1]
+                key = None
+            hints = self._progress_hints
+            idx = self.curve.index.nearest(x, y, hints.get(key))
+            if key is not None:
+                if len(hints) > 64:
+                    hints.clear()
+                hints[key] = idx
+            best = self._curve_lengths[idx] if idx >= 0 else 0.0
             return best / self.curve.total_length
         delta = (car.x - self.start_x) % self.width
         return delta / self.width
@@ -439,7 +507,9 @@ class Track:
     def in_puddle(self, car) -> bool:
         """Return True if ``car`` is inside a puddle."""
 
-        for p in self.puddles:
+        puddles = self.puddles
+        for i in self._hazards("puddles").query(car.x, car.y):
+            p = puddles[i]
             dx = car.x - p.x
             dy = car.y - p.y
             if dx * dx + dy * dy <= p.radius * p.radius:
@@ -449,7 +519,9 @@ class Track:
     def in_icy_patch(self, car) -> IcyPatch | None:
         """Return icy patch instance if ``car`` is inside one."""
 
-        for patch in self.icy_patches:
+        patches = self.icy_patches
+        for i in self._hazards("icy_patches").query(car.x, car.y):
+            patch = patches[i]
             dx = car.x - patch.x
             dy = car.y - patch.y
             if dx * dx + dy * dy <= patch.radius * patch.radius:
@@ -478,7 +550,9 @@ class Track:
         if self.in_puddle(obj):
             factor *= self.get_puddle_factor()
 
-        for zone in self.surfaces:
+        surfaces = self.surfaces
+        for i in self._hazards("surfaces").query(obj.x, obj.y):
+            zone = surfaces[i]
             if (
                 zone.x <= obj.x <= zone.x + zone.width
                 and zone.y <= obj.y <= zone.y + zone.height
@@ -496,22 +570,147 @@ class Track:
 
         if not self.on_road(car):
             if self.in_puddle(car):
-                factor *= float(_PARITY_CFG.get("offroad_factor", 0.5))
+                factor *= PARITY.offroad_factor
             else:
-                factor *= float(_PARITY_CFG.get("offroad_speed_factor", 0.5))
+                factor *= PARITY.offroad_speed_factor
 
         return factor
 
     def billboard_hit(self, car) -> bool:
         """Remove billboard obstacle when ``car`` collides with it."""
 
-        for obs in list(self.obstacles):
+        obstacles = self.obstacles
+        for i in self._hazards("obstacles").query(car.x, car.y):
+            obs = obstacles[i]
             if not getattr(obs, "billboard", False):
                 continue
             if (
                 abs(car.x - obs.x) <= obs.width / 2
                 and abs(car.y - obs.y) <= obs.height / 2
             ):
-                self.obstacles.remove(obs)
+                del obstacles[i]
+                self._index_hazards("obstacles")
+                self._hash = self._compute_hash()
                 return True
         return False
+
+    def reset_obstacles(self) -> None:
+        """Put back billboards removed by :meth:`billboard_hit`."""
+
+        if self.obstacles != self._start_obstacles:
+            self.obstacles = list(self._start_obstacles)
+            self._hash = self._compute_hash()
+
+    # ------------------------------------------------------------------
+    # Batched helpers operating on coordinate arrays
+    # ------------------------------------------------------------------
+    def y_at_array(self, xs: np.ndarray) -> np.ndarray:
+        """Vectorised :meth:`y_at` for an array of ``x`` positions."""
+
+        xs = np.asarray(xs, dtype=float)
+        if self.curve:
+            return self.curve.points_at(xs)[..., 1]
+        if not self.segments:
+            return np.full(xs.shape, self.height / 2)
+        seg = np.asarray(self.segments, dtype=float)
+        t = (xs % self.width) / self.width
+        seg_pos = t * (len(self.segments) - 1)
+        i = seg_pos.astype(int)
+        frac = seg_pos - i
+        y0 = seg[i, 1]
+        y1 = seg[(i + 1) % len(self.segments), 1]
+        return y0 + (y1 - y0) * frac
+
+    def progress_array(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Vectorised :meth:`progress` for coordinate arrays."""
+
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        if self.curve:
+            # One grid query per point instead of an (N, points) distance matrix
+            xs, ys = np.broadcast_arrays(xs, ys)
+            index = self.curve.index
+            lengths = self._curve_lengths
+            out = np.zeros(xs.shape)
+            for j, (x, y) in enumerate(zip(xs.ravel().tolist(), ys.ravel().tolist())):
+                idx = index.nearest(x, y)
+                if idx >= 0:
+                    out.flat[j] = lengths[idx]
+            return out / self.curve.total_length
+        return ((xs - self.start_x) % self.width) / self.width
+
+    def on_road_array(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Vectorised :meth:`is_on_road` returning a boolean mask."""
+
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        if self.curve:
+            prog = self.progress_array(xs, ys) * self.curve.total_length
+            centre = self.curve.points_at(prog)
+            normal = self.curve.normals_at(prog)
+            dx = xs - centre[..., 0]
+            dy = ys - centre[..., 1]
+            offset = np.abs(dx * normal[..., 0] + dy * normal[..., 1])
+            return offset <= self.road_width / 2
+        return np.abs(ys - self.y_at_array(xs)) <= self.road_width / 2
+
+    def in_puddle_array(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Vectorised :meth:`in_puddle` returning a boolean mask."""
+
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        hit = np.zeros(xs.shape, dtype=bool)
+        for i in self._hazards("puddles").query_many(xs, ys):
+            p = self.puddles[i]
+            dx = xs - p.x
+            dy = ys - p.y
+            hit |= dx * dx + dy * dy <= p.radius * p.radius
+        return hit
+
+    def slip_angle_array(
+        self, xs: np.ndarray, ys: np.ndarray, dt: float = 1.0
+    ) -> np.ndarray:
+        """Vectorised :meth:`slip_angle` for coordinate arrays."""
+
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        drift = np.zeros(xs.shape)
+        found = np.zeros(xs.shape, dtype=bool)
+        for i in self._hazards("icy_patches").query_many(xs, ys):
+            patch = self.icy_patches[i]
+            dx = xs - patch.x
+            dy = ys - patch.y
+            inside = (dx * dx + dy * dy <= patch.radius * patch.radius) & ~found
+            drift = np.where(inside, patch.drift, drift)
+            found |= inside
+        sign = np.where(np.trunc(xs + ys).astype(np.int64) % 2 == 0, 1, -1)
+        return np.where(found, sign * drift * dt, 0.0)
+
+    def friction_factor_array(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Vectorised :meth:`friction_factor` for coordinate arrays."""
+
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        factor = np.ones(xs.shape)
+        puddle = self.in_puddle_array(xs, ys)
+        if self.puddles:
+            factor = np.where(puddle, factor * self.get_puddle_factor(), factor)
+        matched = np.zeros(xs.shape, dtype=bool)
+        for i in self._hazards("surfaces").query_many(xs, ys):
+            zone = self.surfaces[i]
+            inside = (
+                (zone.x <= xs)
+                & (xs <= zone.x + zone.width)
+                & (zone.y <= ys)
+                & (ys <= zone.y + zone.height)
+                & ~matched
+            )
+            factor = np.where(inside, factor * zone.friction, factor)
+            matched |= inside
+        off = ~self.on_road_array(xs, ys)
+        off_factor = np.where(
+            puddle,
+            PARITY.offroad_factor,
+            PARITY.offroad_speed_factor,
+        )
+        return np.where(off, factor * off_factor, factor)
@@ -5,7 +5,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 import math
 from bisect import bisect_left
-from typing import List, Tuple
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
 
 
 @dataclass
@@ -19,14 +21,23 @@ class CurveSegment:
 
 
 class TrackCurve:
-    """Continuous track centerline built from segments."""
+    """Continuous track centerline built from segments.
+
+    After construction the polyline is also available as NumPy arrays:
+
+    - ``points``: ``(M, 2)`` sampled positions
+    - ``lengths``: ``(M,)`` arc length at each point, starting at ``0``
+    - ``tangents``/``normals``: ``(M - 1, 2)`` unit vectors per polyline edge
+    """
 
     def __init__(self, segments: List[CurveSegment]):
         self.segments = segments
         self._points: List[Tuple[float, float]] = []
         self._lengths: List[float] = []
         self.total_length = 0.0
+        self._index: CurveIndex | None = None
         self._build()
+        self._build_arrays()
 
     @classmethod
     def from_tuples(cls, data: List[Tuple[float, float, float, float]]) -> "TrackCurve":
@@ -59,6 +70,31 @@ class TrackCurve:
                 self._points.append((x, y))
                 self._lengths.append(self.total_length)
 
+    def _build_arrays(self) -> None:
+        """Populate the NumPy views of the sampled polyline."""
+
+        self.points = np.asarray(self._points, dtype=float).reshape(-1, 2)
+        self.lengths = np.asarray([0.0] + self._lengths, dtype=float)
+        tangents = []
+        for (x0, y0), (x1, y1) in zip(self._points, self._points[1:]):
+            dx, dy = x1 - x0, y1 - y0
+            norm = math.hypot(dx, dy) or 1.0
+            tangents.append((dx / norm, dy / norm))
+        self.tangents = np.asarray(tangents, dtype=float).reshape(-1, 2)
+        self.normals = np.column_stack((-self.tangents[:, 1], self.tangents[:, 0]))
+
+    @property
+    def index(self) -> "CurveIndex":
+        """Spatial index over the points that carry a length.
+
+        Index ``i`` of the result refers to ``_points[i + 1]`` and
+        ``_lengths[i]``.
+        """
+
+        if self._index is None:
+            self._index = CurveIndex(self._points[1:])
+        return self._index
+
     def point_at(self, s: float) -> Tuple[float, float]:
         """Return position ``(x, y)`` at distance ``s`` along the curve."""
         if not self._points:
@@ -66,25 +102,153 @@ class TrackCurve:
         s = max(0.0, min(s, self.total_length))
         if s <= 0.0:
             return self._points[0]
-        for i, d in enumerate(self._lengths):
-            if d >= s:
-                return self._points[i + 1]
-        return self._points[-1]
+        i = bisect_left(self._lengths, s)
+        return self._points[min(i + 1, len(self._points) - 1)]
 
     def tangent_at(self, s: float) -> Tuple[float, float]:
         """Return unit tangent vector at distance ``s`` along the curve."""
 
-        if not self._points:
+        if not len(self.tangents):
             return 0.0, 0.0
         s = max(0.0, min(s, self.total_length))
-        idx = bisect_left(self._lengths, s)
-        idx = min(max(idx, 0), len(self._points) - 2)
-        x0, y0 = self._points[idx]
-        x1, y1 = self._points[idx + 1]
-        dx, dy = x1 - x0, y1 - y0
-        norm = math.hypot(dx, dy) or 1.0
-        return dx / norm, dy / norm
+        idx = min(bisect_left(self._lengths, s), len(self.tangents) - 1)
+        tx, ty = self.tangents[idx]
+        return float(tx), float(ty)
 
     def normal_at(self, s: float) -> Tuple[float, float]:
         tx, ty = self.tangent_at(s)
         return -ty, tx
+
+    # ------------------------------------------------------------------
+    # Batched sampling
+    # ------------------------------------------------------------------
+    def _edge_index(self, s: np.ndarray) -> np.ndarray:
+        s = np.clip(np.asarray(s, dtype=float), 0.0, self.total_length)
+        idx = np.searchsorted(self.lengths, s, side="left") - 1
+        return np.clip(idx, 0, max(len(self.tangents) - 1, 0))
+
+    def points_at(self, s: np.ndarray) -> np.ndarray:
+        """Return ``(..., 2)`` positions for an array of distances ``s``."""
+
+        s = np.clip(np.asarray(s, dtype=float), 0.0, self.total_length)
+        idx = np.searchsorted(self.lengths, s, side="left")
+        return self.points[np.minimum(idx, len(self.points) - 1)]
+
+    def tangents_at(self, s: np.ndarray) -> np.ndarray:
+        """Return ``(..., 2)`` unit tangents for an array of distances ``s``."""
+
+        if not len(self.tangents):
+            return np.zeros(np.shape(s) + (2,))
+        return self.tangents[self._edge_index(s)]
+
+    def normals_at(self, s: np.ndarray) -> np.ndarray:
+        """Return ``(..., 2)`` unit normals for an array of distances ``s``."""
+
+        if not len(self.normals):
+            return np.zeros(np.shape(s) + (2,))
+        return self.normals[self._edge_index(s)]
+
+
+class CurveIndex:
+    """Uniform grid over polyline points for nearest-point queries.
+
+    :meth:`nearest` returns exactly what a linear scan keeping the first
+    point with the smallest squared distance would return.
+    """
+
+    def __init__(
+        self, points: Sequence[Tuple[float, float]], cell_size: float = 4.0
+    ) -> None:
+        self.points = [(float(x), float(y)) for x, y in points]
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+        for i, (x, y) in enumerate(self.points):
+            self._cells.setdefault(self._cell(x, y), []).append(i)
+        if self._cells:
+            keys = list(self._cells)
+            self._min_cx = min(k[0] for k in keys)
+            self._max_cx = max(k[0] for k in keys)
+            self._min_cy = min(k[1] for k in keys)
+            self._max_cy = max(k[1] for k in keys)
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    def nearest(
+        self, x: float, y: float, hint: int | None = None, window: int = 4
+    ) -> int:
+        """Return the index of the point closest to ``(x, y)`` or ``-1``.
+
+        ``hint`` is the result of a previous query for the same moving
+        object. Points within ``window`` of it seed the search, so only the
+        few grid cells around the car need checking; if the closest of them
+        sits on the window's edge the object has moved further and the
+        grid is searched as without a hint.
+        """
+
+        pts = self.points
+        if not pts:
+            return -1
+        best_i = -1
+        best_d = float("inf")
+        if hint is not None and 0 <= hint < len(pts):
+            lo = max(0, hint - window)
+            hi = min(len(pts), hint + window + 1)
+            for i in range(lo, hi):
+                px, py = pts[i]
+                dx = x - px
+                dy = y - py
+                d = dx * dx + dy * dy
+                if d < best_d:
+                    best_d = d
+                    best_i = i
+            if best_i in (lo, hi - 1) and 0 < best_i < len(pts) - 1:
+                # Moved past the window: a stale candidate only widens the box
+                best_d, best_i = self._ring_search(x, y)
+        else:
+            best_d, best_i = self._ring_search(x, y)
+
+        # Every point at least as close as the candidate lies in this box.
+        r = math.sqrt(best_d) * (1.0 + 1e-9) + 1e-9
+        c = self.cell_size
+        cx0 = max(math.floor((x - r) / c), self._min_cx)
+        cx1 = min(math.floor((x + r) / c), self._max_cx)
+        cy0 = max(math.floor((y - r) / c), self._min_cy)
+        cy1 = min(math.floor((y + r) / c), self._max_cy)
+        cells = self._cells
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                for i in cells.get((cx, cy), ()):
+                    px, py = pts[i]
+                    dx = x - px
+                    dy = y - py
+                    d = dx * dx + dy * dy
+                    if d < best_d or (d == best_d and i < best_i):
+                        best_d = d
+                        best_i = i
+        return best_i
+
+    def _ring_search(self, x: float, y: float) -> Tuple[float, int]:
+        """Return a candidate ``(dist2, index)`` from the closest occupied ring."""
+
+        qx, qy = self._cell(x, y)
+        qx = min(max(qx, self._min_cx), self._max_cx)
+        qy = min(max(qy, self._min_cy), self._max_cy)
+        pts = self.points
+        best_i = -1
+        best_d = float("inf")
+        k = 0
+        while best_i < 0:
+            for cx in range(qx - k, qx + k + 1):
+                edge = cx in (qx - k, qx + k)
+                for cy in range(qy - k, qy + k + 1) if edge else (qy - k, qy + k):
+                    for i in self._cells.get((cx, cy), ()):
+                        px, py = pts[i]
+                        dx = x - px
+                        dy = y - py
+                        d = dx * dx + dy * dy
+                        if d < best_d:
+                            best_d = d
+                            best_i = i
+            k += 1
+        return best_d, best_i
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 MIND INTERFACES, INC. All rights reserved.
+# Licensed under the MIT License.
+
+"""
+track_lut.py
+Description: Fixed-resolution lookup tables for track centerline queries.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+import numpy as np
+
+
+class TrackLUT:
+    """Sampled ``y_at``/``angle_at``/``curvature_at`` for one track.
+
+    Tables hold the exact function evaluated at the centre of each
+    ``step``-sized bin. Lookups either return the bin value or, with
+    ``interpolate=True``, blend linearly between neighbouring bins. Both
+    accept scalars or arrays. Centerline ``y`` and heading wrap around the
+    track width on segment tracks and clamp to the ends on curve tracks,
+    matching :class:`Track`.
+    """
+
+    def __init__(self, track: Any, resolution: float = 0.25, interpolate: bool = False) -> None:
+        if resolution <= 0:
+            raise ValueError("resolution must be positive")
+        curve = track.curve
+        self.length = float(curve.total_length if curve else track.width) or resolution
+        bins = max(1, math.ceil(self.length / resolution))
+        self.step = self.length / bins
+        self.interpolate = interpolate
+        self._wrap_geometry = curve is None
+        xs = (np.arange(bins) + 0.5) * self.step
+        self.y = np.array([track.y_at(x) for x in xs], dtype=float)
+        self.angle = np.array([track.angle_at(x) for x in xs], dtype=float)
+        self.curvature = np.array([track.curvature_at(x) for x in xs], dtype=float)
+
+    def y_at(self, x: Any) -> Any:
+        """Return centerline ``y`` for ``x`` from the table."""
+
+        return self._lookup(self.y, x, self._wrap_geometry)
+
+    def angle_at(self, x: Any) -> Any:
+        """Return road heading in radians for ``x`` from the table."""
+
+        return self._lookup(self.angle, x, self._wrap_geometry, angular=True)
+
+    def curvature_at(self, x: Any) -> Any:
+        """Return curvature for ``x`` from the table."""
+
+        return self._lookup(self.curvature, x, True)
+
+    def _lookup(
+        self, table: np.ndarray, x: Any, wrap: bool, angular: bool = False
+    ) -> Any:
+        x = np.asarray(x, dtype=float)
+        x = x % self.length if wrap else np.clip(x, 0.0, self.length)
+        n = len(table)
+        if not self.interpolate:
+            out = table[np.minimum((x / self.step).astype(int), n - 1)]
+        else:
+            t = x / self.step - 0.5
+            i0 = np.floor(t).astype(int)
+            frac = t - i0
+            if wrap:
+                i0 %= n
+                i1 = (i0 + 1) % n
+            else:
+                i1 = np.clip(i0 + 1, 0, n - 1)
+                i0 = np.clip(i0, 0, n - 1)
+            a0 = table[i0]
+            delta = table[i1] - a0
+            if angular:
+                delta = (delta + math.pi) % (2 * math.pi) - math.pi
+            out = a0 + delta * frac
+            if angular:
+                out = np.where(
+                    np.abs(out) > math.pi, (out + math.pi) % (2 * math.pi) - math.pi, out
+                )
+        return float(out) if out.ndim == 0 else out
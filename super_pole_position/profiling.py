@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 MIND INTERFACES, INC. All rights reserved.
+# Licensed under the MIT License.
+
+"""
+profiling.py
+Description: Per-phase frame timings kept in fixed-size ring buffers.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Sequence
+
+import numpy as np
+
+#: Phases timed inside :meth:`PolePositionEnv.step` and ``render``
+PHASES = (
+    "physics",
+    "planning",
+    "traffic",
+    "collisions",
+    "audio",
+    "observation",
+    "scoring",
+    "logging",
+    "learning",
+    "timers",
+    "render",
+)
+
+
+class FrameProfiler:
+    """Accumulate phase timings per frame and keep the last ``capacity``.
+
+    Call :meth:`start` when a frame begins and :meth:`lap` after each
+    phase; ``lap`` charges the time since the previous mark to that phase,
+    so a phase may be charged several times per frame. :meth:`add` charges
+    work measured outside the ``start``/``end_frame`` window, such as a
+    ``render`` call between steps. :meth:`end_frame` stores the frame in
+    the ring buffer and returns its timings in milliseconds. Memory use is
+    fixed at ``capacity`` rows regardless of run length.
+    """
+
+    def __init__(self, capacity: int = 1024, phases: Sequence[str] = PHASES) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = int(capacity)
+        self.phases = tuple(phases)
+        self._index = {name: i for i, name in enumerate(self.phases)}
+        # One column per phase plus the frame total
+        self._samples = np.zeros((self.capacity, len(self.phases) + 1))
+        self._frame = np.zeros(len(self.phases))
+        self._outside = 0.0
+        self._pos = 0
+        self.count = 0
+        self._frame_start = self._mark = time.perf_counter()
+
+    def start(self) -> None:
+        """Begin timing a frame."""
+
+        self._frame_start = self._mark = time.perf_counter()
+
+    def lap(self, phase: str) -> None:
+        """Charge the time since the last mark to ``phase``."""
+
+        now = time.perf_counter()
+        self._frame[self._index[phase]] += now - self._mark
+        self._mark = now
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Charge ``seconds`` spent outside the frame window to ``phase``."""
+
+        self._frame[self._index[phase]] += seconds
+        self._outside += seconds
+
+    def end_frame(self) -> Dict[str, float]:
+        """Store the current frame and return its timings in milliseconds."""
+
+        row = self._samples[self._pos]
+        row[:-1] = self._frame
+        row[-1] = time.perf_counter() - self._frame_start + self._outside
+        self._pos = (self._pos + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        self._frame[:] = 0.0
+        self._outside = 0.0
+        perf = {name: row[i] * 1000.0 for i, name in enumerate(self.phases)}
+        perf["total"] = row[-1] * 1000.0
+        return perf
+
+    def samples(self) -> np.ndarray:
+        """Return stored frames oldest first, in seconds.
+
+        Columns follow :attr:`phases` with the frame total last.
+        """
+
+        if self.count < self.capacity:
+            return self._samples[: self.count].copy()
+        return np.roll(self._samples, -self._pos, axis=0)
+
+    def percentiles(
+        self, qs: Iterable[float] = (50, 95, 99)
+    ) -> Dict[str, Dict[str, float]]:
+        """Return ``{phase: {"p50": ms, ...}}`` over the stored frames."""
+
+        qs = tuple(qs)
+        names = (*self.phases, "total")
+        if not self.count:
+            return {name: {f"p{q:g}": 0.0 for q in qs} for name in names}
+        values = np.percentile(self._samples[: self.count], qs, axis=0) * 1000.0
+        return {
+            name: {f"p{q:g}": float(values[j, i]) for j, q in enumerate(qs)}
+            for i, name in enumerate(names)
+        }
+
+    def summary(self) -> str:
+        """Return a text table of p50/p95/p99 per phase."""
+
+        lines = [f"{'phase':<12}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"]
+        for name, pct in self.percentiles().items():
+            lines.append(
+                f"{name:<12}{pct['p50']:>10.3f}{pct['p95']:>10.3f}{pct['p99']:>10.3f}"
+            )
+        return "\n".join(lines)
+
+    def dump(self, path: str | Path) -> Path:
+        """Write frame count and percentiles as JSON to ``path``."""
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"frames": self.count, "percentiles_ms": self.percentiles()}
+        path.write_text(json.dumps(data, indent=2))
+        return path
+
+    def reset(self) -> None:
+        """Forget all stored frames."""
+
+        self._samples[:] = 0.0
+        self._frame[:] = 0.0
+        self._outside = 0.0
+        self._pos = 0
+        self.count = 0
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 MIND INTERFACES, INC. All rights reserved.
+# Licensed under the MIT License.
+
+"""
+replay.py
+Description: Record episodes as compact action traces and replay them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+#: Bumped whenever the trace layout changes
+TRACE_VERSION = 1
+
+#: One record per ``step()`` call: parsed controls and the ``dt`` used
+ACTION_DTYPE = np.dtype(
+    [
+        ("throttle", "<f8"),
+        ("brake", "<f8"),
+        ("steer", "<f8"),
+        ("gear", "i1"),
+        ("dt", "<f8"),
+    ]
+)
+
+#: State hash of the env after ``step`` actions
+CHECKPOINT_DTYPE = np.dtype([("step", "<u4"), ("hash", "<u8")])
+
+
+class ReplayError(RuntimeError):
+    """Raised when a replayed episode diverges from its trace."""
+
+
+def state_hash(env: Any) -> int:
+    """Return a 64-bit hash of the simulation state of ``env``."""
+
+    values = [
+        env.current_step,
+        env.remaining_time,
+        env.score,
+        env.lap,
+        env.crash_timer,
+        env.lap_timer,
+    ]
+    for car in (*env.cars, *env.traffic):
+        values += [car.x, car.y, car.angle, car.speed, car.gear]
+    data = np.asarray(values, dtype=np.float64).tobytes()
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+
+class Trace:
+    """One recorded episode.
+
+    ``header`` holds the seed, track hash and the constructor arguments
+    needed to rebuild the env; ``actions`` is an :data:`ACTION_DTYPE` array
+    and ``checkpoints`` a :data:`CHECKPOINT_DTYPE` array. ``state`` is the
+    optional :meth:`~PolePositionEnv.get_state` snapshot taken just before
+    the episode's reset. :meth:`save` writes everything to a single
+    compressed ``.npz`` file.
+    """
+
+    def __init__(
+        self,
+        header: Dict[str, Any],
+        actions: np.ndarray,
+        checkpoints: np.ndarray,
+        state: np.ndarray | None = None,
+    ) -> None:
+        self.header = header
+        self.actions = actions
+        self.checkpoints = checkpoints
+        self.state = state
+
+    @property
+    def seed(self) -> int:
+        return self.header["seed"]
+
+    @property
+    def track_hash(self) -> str:
+        return self.header["track_hash"]
+
+    def __len__(self) -> int:
+        return len(self.actions)
+
+    def save(self, path: str | Path) -> Path:
+        """Write the trace to ``path`` and return it."""
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        header = np.frombuffer(json.dumps(self.header).encode(), dtype=np.uint8)
+        arrays = {"actions": self.actions, "checkpoints": self.checkpoints}
+        if self.state is not None:
+            arrays["state"] = self.state
+        with path.open("wb") as fh:
+            np.savez_compressed(fh, header=header, **arrays)
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Trace":
+        """Read a trace written by :meth:`save`."""
+
+        with np.load(path) as data:
+            header = json.loads(data["header"].tobytes().decode())
+            if header.get("version") != TRACE_VERSION:
+                raise ReplayError(f"unsupported trace version {header.get('version')}")
+            state = data["state"] if "state" in data.files else None
+            return cls(header, data["actions"], data["checkpoints"], state)
+
+
+class TraceRecorder:
+    """Capture the actions an env receives, one :class:`Trace` per episode.
+
+    Attach with :meth:`PolePositionEnv.start_recording`. Each ``reset()``
+    closes the running trace (appending it to :attr:`traces`) and starts a
+    new one; a ``None`` seed is replaced by a fresh one so every episode
+    can be replayed. The state hash is stored every ``checkpoint_every``
+    steps and at the end of the episode.
+
+    ``reset()`` puts the env back in the state a freshly built one with
+    the same seed has, so every episode replays from the header alone.
+    With ``snapshot=True`` each trace also stores the full env state
+    (about 20 KB) from before its reset.
+    """
+
+    def __init__(self, checkpoint_every: int = 100, snapshot: bool = False) -> None:
+        self.checkpoint_every = max(1, int(checkpoint_every))
+        self.snapshot = snapshot
+        self.traces: List[Trace] = []
+        self._state: np.ndarray | None = None
+        self._header: Dict[str, Any] | None = None
+        self._actions: List[tuple] = []
+        self._checkpoints: List[tuple] = []
+
+    def begin(self, env: Any, seed: int | None) -> int:
+        """Finish the running trace and start one for ``seed``.
+
+        Returns the seed the env must reset with.
+        """
+
+        self.finish(env)
+        if seed is None:
+            seed = random.SystemRandom().randrange(2**31)
+        self._state = env.get_state() if self.snapshot else None
+        self._header = {
+            "version": TRACE_VERSION,
+            "seed": int(seed),
+            "track_hash": env.track.track_hash,
+            "fast_test": _fast_test(),
+            "env": {
+                "mode": env.mode,
+                "track_name": env.track_name,
+                "track_file": env.track_file,
+                "hyper": env.hyper,
+                "slipstream": env.slipstream_enabled,
+                "difficulty": env.difficulty,
+                "mode_2600": env.mode_2600,
+                "seed": env.seed,
+            },
+        }
+        return int(seed)
+
+    def checkpoint(self, env: Any) -> None:
+        """Store the state hash if a checkpoint is due before this step."""
+
+        step = len(self._actions)
+        if self._header is not None and step % self.checkpoint_every == 0:
+            self._checkpoints.append((step, state_hash(env)))
+
+    def record(
+        self, throttle: float, brake: float, steer: float, gear: int, dt: float
+    ) -> None:
+        """Append the controls of the current step."""
+
+        if self._header is not None:
+            self._actions.append((throttle, brake, steer, gear, dt))
+
+    def finish(self, env: Any) -> Trace | None:
+        """Close the running trace, append it to :attr:`traces` and return it."""
+
+        if self._header is None:
+            return None
+        step = len(self._actions)
+        if not self._checkpoints or self._checkpoints[-1][0] != step:
+            self._checkpoints.append((step, state_hash(env)))
+        trace = Trace(
+            dict(self._header, steps=step),
+            np.array(self._actions, dtype=ACTION_DTYPE),
+            np.array(self._checkpoints, dtype=CHECKPOINT_DTYPE),
+            self._state,
+        )
+        self.traces.append(trace)
+        self._header = None
+        self._state = None
+        self._actions = []
+        self._checkpoints = []
+        return trace
+
+
+def _fast_test() -> bool:
+    from .envs import pole_position
+
+    return pole_position.FAST_TEST
+
+
+def make_env(trace: Trace, **kwargs: Any) -> Any:
+    """Return a headless env built with the arguments stored in ``trace``."""
+
+    from .envs.pole_position import PolePositionEnv
+
+    options = dict(trace.header["env"], render_mode=None)
+    options.update(kwargs)
+    return PolePositionEnv(**options)
+
+
+def replay(
+    trace: Trace,
+    env: Any = None,
+    verify: bool = True,
+    on_step: Callable[[Any, tuple], None] | None = None,
+) -> Any:
+    """Re-simulate ``trace`` without calling any agent and return the env.
+
+    ``env`` defaults to a fresh headless env from :func:`make_env`; pass a
+    rendering or logging env to regenerate frames or telemetry, and use
+    ``on_step(env, step_result)`` to collect per-step output. With
+    ``verify`` the track hash and every stored state hash are checked and
+    :class:`ReplayError` names the first step that diverges. A trace
+    with a ``state`` snapshot is restored into ``env`` first; without one
+    the reset alone recreates the episode's starting state.
+    """
+
+    if trace.header.get("fast_test") != _fast_test():
+        raise ReplayError("trace was recorded with a different FAST_TEST setting")
+    if env is None:
+        env = make_env(trace)
+    if trace.state is not None:
+        env.set_state(trace.state)
+    _, info = env.reset(seed=trace.seed)
+    if verify and info.get("track_hash") != trace.track_hash:
+        raise ReplayError("track hash differs from the recording")
+    expected = {int(s): int(h) for s, h in trace.checkpoints} if verify else {}
+    actions = trace.actions
+    for i in range(len(actions) + 1):
+        if i in expected and state_hash(env) != expected[i]:
+            raise ReplayError(f"state diverged before step {i}")
+        if i == len(actions):
+            break
+        row = actions[i]
+        env._dt_override = float(row["dt"])
+        try:
+            result = env.step(
+                (
+                    float(row["throttle"]),
+                    float(row["brake"]),
+                    float(row["steer"]),
+                    int(row["gear"]),
+                )
+            )
+        finally:
+            env._dt_override = None
+        if on_step is not None:
+            on_step(env, result)
+    return env
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 MIND INTERFACES, INC. All rights reserved.
+# Licensed under the MIT License.
+
+"""
+resources.py
+Description: Process-wide reference-counted pool of decoded assets.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Hashable
+
+
+class ResourcePool:
+    """Share decoded assets such as sounds and sprites between owners.
+
+    :meth:`acquire` loads a key on first use and hands the same object to
+    every later caller, counting references. :meth:`release` drops the
+    object once its last owner lets go. Shared objects must be treated as
+    read-only.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[Hashable, list[Any]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Return the object for ``key``, calling ``loader`` if not cached."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry[1] += 1
+                return entry[0]
+        value = loader()
+        with self._lock:
+            entry = self._entries.setdefault(key, [value, 0])
+            entry[1] += 1
+            return entry[0]
+
+    def release(self, key: Hashable) -> None:
+        """Drop one reference to ``key``."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            entry[1] -= 1
+            if entry[1] <= 0:
+                del self._entries[key]
+
+    def refcount(self, key: Hashable) -> int:
+        """Return the number of live references to ``key``."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry[1] if entry else 0
+
+    def in_use(self, kind: str) -> bool:
+        """Return ``True`` if any tuple key starting with ``kind`` is held."""
+
+        with self._lock:
+            return any(
+                isinstance(k, tuple) and k and k[0] == kind for k in self._entries
+            )
+
+    def clear(self) -> None:
+        """Forget every cached object regardless of references."""
+
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+#: Pool shared by all environments and renderers in the process
+POOL = ResourcePool()
+
+
+class ResourceHandles:
+    """Keys one owner acquired from a :class:`ResourcePool`."""
+
+    def __init__(self, pool: ResourcePool | None = None) -> None:
+        self.pool = pool if pool is not None else POOL
+        self._keys: list[Hashable] = []
+
+    def get(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Acquire ``key`` from the pool on behalf of this owner."""
+
+        value = self.pool.acquire(key, loader)
+        self._keys.append(key)
+        return value
+
+    def release(self) -> None:
+        """Release everything this owner acquired."""
+
+        keys, self._keys = self._keys, []
+        for key in keys:
+            self.pool.release(key)
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, List
 
 from ..evaluation import scores, lap_times
+from .store import ScoreboardStore
 
 try:  # pragma: no cover - optional dependency
     from fastapi import FastAPI, HTTPException
@@ -33,44 +35,79 @@ class LapIn(BaseModel):
     lap_ms: int
 
 
+# Largest batch accepted by the ``/batch`` endpoints
+MAX_BATCH = 10000
+
 SCORES_FILE = Path(os.getenv("SPP_SCORES", scores._DEFAULT_FILE))
 LAPS_FILE = Path(os.getenv("SPP_LAPS", lap_times._DEFAULT_FILE))
 
+# Seconds between a write and its write-behind save to disk
+FLUSH_INTERVAL = float(os.getenv("SPP_FLUSH_INTERVAL", "1.0"))
+
 
 def build_app() -> "FastAPI":
-    """Return a FastAPI app serving the scoreboard."""
+    """Return a FastAPI app serving the scoreboard.
+
+    Tables are held in :class:`~.store.ScoreboardStore` objects (also on
+    ``app.state.scores`` and ``app.state.laps``), so reads are served from
+    memory and writes reach ``SPP_SCORES``/``SPP_LAPS`` within
+    ``FLUSH_INTERVAL`` seconds and on shutdown.
+    """
 
     if FastAPI is None:
         raise RuntimeError("fastapi not available")
 
-    app = FastAPI(title="SPP Scoreboard")
+    score_board = ScoreboardStore(
+        SCORES_FILE, "scores", "score", flush_interval=FLUSH_INTERVAL
+    )
+    lap_board = ScoreboardStore(
+        LAPS_FILE, "laps", "lap_ms", descending=False, flush_interval=FLUSH_INTERVAL
+    )
+
+    @asynccontextmanager
+    async def lifespan(app: Any) -> Any:
+        yield
+        score_board.close()
+        lap_board.close()
+
+    app = FastAPI(title="SPP Scoreboard", lifespan=lifespan)
+    app.state.scores = score_board
+    app.state.laps = lap_board
 
     @app.get("/scores")
     def get_scores() -> Any:
-        return {"scores": scores.load_scores(SCORES_FILE)}
+        return {"scores": score_board.entries()}
 
     @app.get("/laps")
     def get_laps() -> Any:
-        return {"laps": lap_times.load_lap_times(LAPS_FILE)}
+        return {"laps": lap_board.entries()}
 
     from fastapi import Body
 
     @app.post("/scores")
     def post_score(entry: ScoreIn = Body(...)) -> Any:
-        try:
-            scores.update_scores(SCORES_FILE, entry.name, entry.score)
-        except Exception as exc:  # pragma: no cover - file error
-            raise HTTPException(status_code=500, detail=str(exc))
+        score_board.add({"name": entry.name, "score": entry.score})
         return JSONResponse({"ok": True})
 
     @app.post("/laps")
     def post_lap(entry: LapIn = Body(...)) -> Any:
-        try:
-            lap_times.update_lap_times(LAPS_FILE, entry.name, entry.lap_ms)
-        except Exception as exc:  # pragma: no cover - file error
-            raise HTTPException(status_code=500, detail=str(exc))
+        lap_board.add({"name": entry.name, "lap_ms": entry.lap_ms})
         return JSONResponse({"ok": True})
 
+    @app.post("/scores/batch")
+    def post_scores(entries: List[ScoreIn] = Body(...)) -> Any:
+        if len(entries) > MAX_BATCH:
+            raise HTTPException(status_code=413, detail="batch too large")
+        score_board.add_many({"name": e.name, "score": e.score} for e in entries)
+        return JSONResponse({"ok": True, "count": len(entries)})
+
+    @app.post("/laps/batch")
+    def post_laps(entries: List[LapIn] = Body(...)) -> Any:
+        if len(entries) > MAX_BATCH:
+            raise HTTPException(status_code=413, detail="batch too large")
+        lap_board.add_many({"name": e.name, "lap_ms": e.lap_ms} for e in entries)
+        return JSONResponse({"ok": True, "count": len(entries)})
+
     return app
 
 
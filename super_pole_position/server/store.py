@@ -0,0 +1,207 @@
+"""In-memory scoreboard tables with write-behind JSON persistence."""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import tempfile
+import threading
+import time
+from bisect import bisect_right
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List
+
+try:  # pragma: no cover - POSIX only
+    import fcntl
+except Exception:  # pragma: no cover - Windows
+    fcntl = None
+
+
+class Board:
+    """Top-``limit`` entries kept sorted by ``field``.
+
+    Insertion is a binary search over a parallel key list, so adding an
+    entry costs ``O(log n + n)`` with ``n <= limit``. Entries that tie keep
+    arrival order, matching a stable sort of the appended list.
+    """
+
+    def __init__(self, field: str, limit: int = 10, descending: bool = True) -> None:
+        self.field = field
+        self.limit = int(limit)
+        self.descending = descending
+        self.entries: List[Dict[str, Any]] = []
+        self._keys: List[float] = []
+
+    def add(self, entry: Dict[str, Any]) -> bool:
+        """Insert ``entry``; return ``False`` if it falls outside the top."""
+
+        value = entry[self.field]
+        key = -value if self.descending else value
+        i = bisect_right(self._keys, key)
+        if i >= self.limit:
+            return False
+        self._keys.insert(i, key)
+        self.entries.insert(i, entry)
+        if len(self.entries) > self.limit:
+            self._keys.pop()
+            self.entries.pop()
+        return True
+
+    def extend(self, entries: Iterable[Dict[str, Any]]) -> None:
+        for entry in entries:
+            self.add(entry)
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self._keys.clear()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class ScoreboardStore:
+    """A :class:`Board` served from memory and persisted to ``path``.
+
+    Reads never touch the disk unless another process has replaced the
+    file since the last check. Writes update memory at once and are saved
+    by a background timer ``flush_interval`` seconds later. Saving takes
+    an exclusive lock on ``<path>.lock`` and merges new entries into the
+    file's current contents before an atomic rename. Concurrent server
+    processes therefore do not lose each other's entries.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        key: str,
+        field: str,
+        limit: int = 10,
+        descending: bool = True,
+        flush_interval: float = 1.0,
+        reload_interval: float = 1.0,
+    ) -> None:
+        self.path = Path(path)
+        self.key = key
+        self.flush_interval = float(flush_interval)
+        self.reload_interval = float(reload_interval)
+        self._board = Board(field, limit, descending)
+        # Entries added since the last flush; only their top can matter
+        self._pending = Board(field, limit, descending)
+        self._lock = threading.RLock()
+        self._timer: threading.Timer | None = None
+        self._mtime: int | None = None
+        self._checked = 0.0
+        self._synced: List[Dict[str, Any]] = []
+        with self._lock:
+            self._reload()
+        atexit.register(self.close)
+
+    # ------------------------------------------------------------------
+    def entries(self) -> List[Dict[str, Any]]:
+        """Return the current table, best first."""
+
+        now = time.monotonic()
+        if now - self._checked >= self.reload_interval:
+            self._checked = now
+            if self._file_mtime() != self._mtime:
+                with self._lock:
+                    self._reload()
+        return list(self._board.entries)
+
+    def add(self, entry: Dict[str, Any]) -> None:
+        """Record one entry."""
+
+        self.add_many([entry])
+
+    def add_many(self, entries: Iterable[Dict[str, Any]]) -> None:
+        """Record ``entries`` and schedule a write-behind flush."""
+
+        with self._lock:
+            for entry in entries:
+                self._pending.add(entry)
+                self._board.add(entry)
+            if self._pending and self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        """Merge pending entries into ``path`` now."""
+
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._pending:
+                return
+            with self._file_lock():
+                if self._file_mtime() != self._mtime:
+                    self._synced = self._load()
+                merged = Board(self._board.field, self._board.limit, self._board.descending)
+                merged.extend(self._synced)
+                merged.extend(self._pending.entries)
+                self._write(merged.entries)
+                self._synced = list(merged.entries)
+                self._mtime = self._file_mtime()
+            self._pending.clear()
+            self._board = merged
+
+    def close(self) -> None:
+        """Flush pending entries; the store stays usable."""
+
+        try:
+            self.flush()
+        except Exception:  # pragma: no cover - best effort at shutdown
+            pass
+
+    # ------------------------------------------------------------------
+    def _reload(self) -> None:
+        self._synced = self._load()
+        self._mtime = self._file_mtime()
+        board = Board(self._board.field, self._board.limit, self._board.descending)
+        board.extend(self._synced)
+        board.extend(self._pending.entries)
+        self._board = board
+
+    def _load(self) -> List[Dict[str, Any]]:
+        try:
+            return list(json.loads(self.path.read_text()).get(self.key, []))
+        except Exception:
+            return []
+
+    def _write(self, entries: List[Dict[str, Any]]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(
+            prefix=f".{self.path.name}.", suffix=".tmp", dir=self.path.parent
+        )
+        try:
+            with os.fdopen(fd, "w") as fh:
+                json.dump({self.key: entries}, fh, indent=2)
+            os.replace(tmp, self.path)
+        except Exception:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    def _file_mtime(self) -> int | None:
+        try:
+            return self.path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        if fcntl is None:  # pragma: no cover - Windows: thread lock only
+            yield
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(str(self.path) + ".lock", "a") as fh:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh, fcntl.LOCK_UN)
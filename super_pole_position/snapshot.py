@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 MIND INTERFACES, INC. All rights reserved.
+# Licensed under the MIT License.
+
+"""
+snapshot.py
+Description: Save, restore and fork the simulation state of an env.
+"""
+
+from __future__ import annotations
+
+import copy
+import math
+import random
+from random import Random
+from typing import Any, List, Sequence
+
+import numpy as np
+
+from .agents.controllers import AsyncPlanner
+from .ai_cpu import CPUCar
+from .physics.broadphase import SweepAndPrune
+from .physics.track import Obstacle
+from .physics.traffic_car import TrafficCar
+from .resources import ResourceHandles
+from .telemetry import RingBuffer
+
+#: Bumped whenever the buffer layout changes
+STATE_VERSION = 1
+
+# Environment attributes saved by ``get_state``. Kinds: ``f`` float,
+# ``i`` int, ``b`` bool; upper case may also be ``None`` (stored as NaN).
+_ENV_FIELDS = (
+    ("current_step", "i"),
+    ("remaining_time", "f"),
+    ("time_limit", "f"),
+    ("traffic_count", "i"),
+    ("passes", "i"),
+    ("crashes", "i"),
+    ("crash_timer", "f"),
+    ("offroad_frames", "i"),
+    ("slipstream_frames", "i"),
+    ("slipstream_timer", "f"),
+    ("skid_timer", "f"),
+    ("start_timer", "f"),
+    ("lap", "i"),
+    ("score", "f"),
+    ("episode_reward", "f"),
+    ("overtakes", "i"),
+    ("prev_progress", "f"),
+    ("prev_x", "f"),
+    ("prev_y", "f"),
+    ("lap_timer", "f"),
+    ("last_lap_time", "F"),
+    ("lap_flash", "f"),
+    ("time_extend_flash", "f"),
+    ("lap_extended", "b"),
+    ("message_timer", "f"),
+    ("invulnerable_timer", "f"),
+    ("last_steer", "F"),
+    ("ai_offtrack", "i"),
+    ("_start_pos_shown", "b"),
+    ("qualifying_time", "F"),
+    ("qualifying_rank", "I"),
+    ("_next_spawn_step", "I"),
+)
+
+_CAR_FIELDS = (
+    ("x", "f"),
+    ("y", "f"),
+    ("angle", "f"),
+    ("speed", "f"),
+    ("gear", "i"),
+    ("shift_count", "i"),
+    ("max_speed", "f"),
+    ("unlimited", "b"),
+    ("turn_rate", "f"),
+    ("acceleration", "f"),
+)
+
+# ``prev_x`` is NaN until the first reset, as the env's own default
+_TRAFFIC_FIELDS = (("target_speed", "f"), ("prev_x", "f"))
+
+_CPU_FIELDS = (
+    ("preferred_lane", "f"),
+    ("_block_time", "f"),
+    ("_block_cooldown", "f"),
+    ("_lane_timer", "f"),
+)
+
+# Traffic kinds, stored as their index
+_TRAFFIC_TYPES = (TrafficCar, CPUCar)
+
+# CPU car RNG owner: its own generator or the env's ``rng``
+_OWN_RNG, _ENV_RNG = 0.0, 1.0
+
+
+class _Writer:
+    """Append scalars and length-prefixed arrays to one float64 buffer."""
+
+    def __init__(self) -> None:
+        self.parts: List[np.ndarray] = []
+        self.scalars: List[float] = []
+
+    def fields(self, obj: Any, fields: Sequence[tuple]) -> None:
+        out = self.scalars
+        for name, kind in fields:
+            value = getattr(obj, name, None)
+            out.append(math.nan if value is None else float(value))
+
+    def array(self, values: Any) -> None:
+        arr = np.asarray(values, dtype=np.float64).ravel()
+        self.scalars.append(len(arr))
+        self.parts.append(np.array(self.scalars))
+        self.parts.append(arr)
+        self.scalars = []
+
+    def text(self, value: str) -> None:
+        self.array(np.frombuffer(value.encode(), dtype=np.uint8))
+
+    def random(self, state: tuple) -> None:
+        _, internal, gauss = state
+        self.array(internal)
+        self.scalars.append(math.nan if gauss is None else gauss)
+
+    def generator(self, gen: np.random.Generator) -> None:
+        state = gen.bit_generator.state
+        if state["bit_generator"] != "PCG64":
+            raise ValueError("only PCG64 generators can be saved")
+        words = []
+        for value in (state["state"]["state"], state["state"]["inc"]):
+            words += [(value >> (32 * k)) & 0xFFFFFFFF for k in range(4)]
+        self.scalars += words + [state["has_uint32"], state["uinteger"]]
+
+    def buffer(self) -> np.ndarray:
+        self.parts.append(np.array(self.scalars))
+        return np.concatenate(self.parts)
+
+
+class _Reader:
+    """Read back what :class:`_Writer` wrote, in the same order."""
+
+    def __init__(self, data: np.ndarray) -> None:
+        self.data = np.asarray(data, dtype=np.float64)
+        self.values = self.data.tolist()
+        self.pos = 0
+
+    def scalar(self) -> float:
+        value = self.values[self.pos]
+        self.pos += 1
+        return value
+
+    def fields(self, obj: Any, fields: Sequence[tuple]) -> None:
+        for name, kind in fields:
+            value: Any = self.scalar()
+            if kind.isupper() and math.isnan(value):
+                value = None
+            elif kind in "iI":
+                value = int(value)
+            elif kind == "b":
+                value = bool(value)
+            setattr(obj, name, value)
+
+    def array(self) -> np.ndarray:
+        n = int(self.scalar())
+        arr = self.data[self.pos : self.pos + n]
+        self.pos += n
+        return arr
+
+    def text(self) -> str:
+        return self.array().astype(np.uint8).tobytes().decode()
+
+    def random(self) -> tuple:
+        internal = tuple(self.array().astype(np.int64).tolist())
+        gauss = self.scalar()
+        return (3, internal, None if math.isnan(gauss) else gauss)
+
+    def generator(self, gen: np.random.Generator) -> None:
+        words = [int(self.scalar()) for _ in range(10)]
+        pack = lambda w: sum(v << (32 * k) for k, v in enumerate(w))  # noqa: E731
+        gen.bit_generator.state = {
+            "bit_generator": "PCG64",
+            "state": {"state": pack(words[0:4]), "inc": pack(words[4:8])},
+            "has_uint32": words[8],
+            "uinteger": words[9],
+        }
+
+
+def get_state(env: Any) -> np.ndarray:
+    """Return the full simulation state of ``env`` as a flat float64 array.
+
+    Covers the env counters and timers, both player cars, every traffic
+    car including CPU lane state, the track obstacles that
+    ``billboard_hit`` removes, and all RNGs: ``env.rng``, ``env.np_rng``,
+    CPU car generators and the global ``random``/``np.random`` state.
+    Rendering, audio and telemetry are not part of the state.
+    """
+
+    w = _Writer()
+    w.scalars += [STATE_VERSION, len(env.cars), len(env.traffic)]
+    w.fields(env, _ENV_FIELDS)
+    w.scalars += list(env.safe_point)
+    w.text(env.start_phase)
+    w.text(env.game_message)
+    w.array(env.lap_times)
+    w.array(env.grid_order)
+    for car in env.cars:
+        w.fields(car, _CAR_FIELDS)
+        w.array(car.gear_max)
+    for t in env.traffic:
+        cpu = isinstance(t, CPUCar)
+        w.scalars.append(_TRAFFIC_TYPES.index(CPUCar if cpu else TrafficCar))
+        w.fields(t, _CAR_FIELDS)
+        w.array(t.gear_max)
+        w.fields(t, _TRAFFIC_FIELDS)
+        if cpu:
+            w.fields(t, _CPU_FIELDS)
+            w.text(t.state)
+            if t.rng is env.rng:
+                w.scalars.append(_ENV_RNG)
+            else:
+                w.scalars.append(_OWN_RNG)
+                w.random(t.rng.getstate())
+    track = env.track
+    w.scalars.append(track.start_x)
+    w.array([(o.x, o.y, o.width, o.height, o.billboard) for o in track.obstacles])
+    w.random(env.rng.getstate())
+    w.generator(env.np_rng)
+    w.random(random.getstate())
+    _, keys, pos, has_gauss, cached = np.random.get_state()
+    w.array(keys)
+    w.scalars += [pos, has_gauss, cached]
+    return w.buffer()
+
+
+def set_state(env: Any, state: np.ndarray) -> None:
+    """Restore a state returned by :func:`get_state` into ``env``."""
+
+    r = _Reader(state)
+    version = int(r.scalar())
+    if version != STATE_VERSION:
+        raise ValueError(f"unsupported state version {version}")
+    n_cars, n_traffic = int(r.scalar()), int(r.scalar())
+    if n_cars != len(env.cars):
+        raise ValueError("state has a different number of cars")
+    r.fields(env, _ENV_FIELDS)
+    env.safe_point = (r.scalar(), r.scalar())
+    env.start_phase = r.text()
+    env.game_message = r.text()
+    env.lap_times = r.array().tolist()
+    env.grid_order = [int(i) for i in r.array()]
+    for car in env.cars:
+        r.fields(car, _CAR_FIELDS)
+        car.gear_max = r.array().tolist()
+    traffic = list(env.traffic)
+    shared_rng: List[CPUCar] = []
+    for i in range(n_traffic):
+        cls = _TRAFFIC_TYPES[int(r.scalar())]
+        if i >= len(traffic) or type(traffic[i]) is not cls:
+            car = cls(x=0.0, y=0.0, rng=Random()) if cls is CPUCar else cls()
+            traffic[i:i + 1] = [car]
+        t = traffic[i]
+        r.fields(t, _CAR_FIELDS)
+        t.gear_max = r.array().tolist()
+        r.fields(t, _TRAFFIC_FIELDS)
+        if cls is CPUCar:
+            r.fields(t, _CPU_FIELDS)
+            t.state = r.text()
+            if r.scalar() == _ENV_RNG:
+                shared_rng.append(t)
+            else:
+                if t.rng is env.rng:
+                    t.rng = Random()
+                t.rng.setstate(r.random())
+    env.traffic = traffic[:n_traffic]
+    track = env.track
+    track.start_x = r.scalar()
+    obstacles = r.array().reshape(-1, 5)
+    current = [(o.x, o.y, o.width, o.height, o.billboard) for o in track.obstacles]
+    if not np.array_equal(obstacles, np.asarray(current, dtype=float).reshape(-1, 5)):
+        track.obstacles = [
+            Obstacle(x, y, w, h, bool(b)) for x, y, w, h, b in obstacles.tolist()
+        ]
+        track._hash = track._compute_hash()
+    env.rng.setstate(r.random())
+    for t in shared_rng:
+        t.rng = env.rng
+    r.generator(env.np_rng)
+    random.setstate(r.random())
+    keys = r.array().astype(np.uint32)
+    pos, has_gauss, cached = r.scalar(), r.scalar(), r.scalar()
+    np.random.set_state(("MT19937", keys, int(pos), int(has_gauss), cached))
+    env._sweep.update(env.traffic, track.width)
+
+
+def _copy_random(rng: Random) -> Random:
+    new = Random()
+    new.setstate(rng.getstate())
+    return new
+
+
+def _copy_generator(gen: np.random.Generator) -> np.random.Generator:
+    new = np.random.Generator(type(gen.bit_generator)())
+    new.bit_generator.state = gen.bit_generator.state
+    return new
+
+
+def clone_env(env: Any) -> Any:
+    """Return a headless copy of ``env`` that can be stepped independently.
+
+    Cars, traffic, RNGs and the mutable parts of the track are copied;
+    track geometry, configuration and the planner's model are shared, but
+    an :class:`AsyncPlanner` is replaced by a new one so the clone keeps
+    its own plans and worker. The clone has no window, audio, recorder or profiler, runs in training mode and
+    gets empty telemetry buffers. The global ``random``/``np.random``
+    state is shared with the original.
+    """
+
+    new = copy.copy(env)
+    new.rng = _copy_random(env.rng)
+    new.np_rng = _copy_generator(env.np_rng)
+    new.cars = [copy.copy(car) for car in env.cars]
+    new.traffic = []
+    for t in env.traffic:
+        t2 = copy.copy(t)
+        if isinstance(t, CPUCar):
+            t2.rng = new.rng if t.rng is env.rng else _copy_random(t.rng)
+        new.traffic.append(t2)
+    for old, car in zip((*env.cars, *env.traffic), (*new.cars, *new.traffic)):
+        car.gear_max = list(old.gear_max)
+
+    track = copy.copy(env.track)
+    track.obstacles = list(env.track.obstacles)
+    grids = dict(env.track._hazard_grids)
+    items, grid = grids["obstacles"]
+    if items is env.track.obstacles:
+        # Same bounds, so the clone can keep the existing grid
+        grids["obstacles"] = (track.obstacles, grid)
+    track._hazard_grids = grids
+    hints = env.track._progress_hints
+    track._progress_hints = {
+        id(car): hints[id(old)]
+        for old, car in zip(env.cars, new.cars)
+        if id(old) in hints
+    }
+    new.track = track
+
+    new.lap_times = list(env.lap_times)
+    new.grid_order = list(env.grid_order)
+    new._obs = env._obs.copy()
+    new._sweep = SweepAndPrune(track.width)
+    new._sweep.update(new.traffic, track.width)
+
+    # Headless: no window, audio or side-effect collectors
+    new.render_mode = None
+    new.training = True
+    new.screen = new.clock = new.renderer = None
+    new.engine_synth = new.audio_stream = None
+    new.recorder = new.profiler = None
+    if isinstance(env.planner, AsyncPlanner):
+        new.planner = AsyncPlanner(env.planner.planner, env.planner.initial_plan)
+    new._resources = ResourceHandles()
+    for name in env._AUDIO_WAVES:
+        setattr(new, name, None)
+    for name in ("step_log", "step_durations", "plan_durations", "plan_tokens"):
+        ring = getattr(env, name)
+        setattr(new, name, RingBuffer(ring.dtype, ring.capacity, name=ring.name))
+    return new
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 MIND INTERFACES, INC. All rights reserved.
+# Licensed under the MIT License.
+
+"""
+telemetry.py
+Description: Preallocated NumPy ring buffers for step telemetry.
+"""
+
+from __future__ import annotations
+
+import itertools
+from pathlib import Path
+from typing import Any, Iterator, List, Sequence
+
+import numpy as np
+
+#: Overflow policies accepted by :class:`RingBuffer`
+OVERFLOW_POLICIES = ("drop", "spill")
+
+#: Per-step record kept in ``PolePositionEnv.step_log``
+STEP_DTYPE = np.dtype(
+    [
+        ("step", np.int64),
+        ("car0_x", np.float64),
+        ("car0_y", np.float64),
+        ("car0_speed", np.float64),
+        ("car1_x", np.float64),
+        ("car1_y", np.float64),
+        ("car1_speed", np.float64),
+        ("reward", np.float64),
+        ("remaining_time", np.float64),
+        ("lap", np.int32),
+    ]
+)
+
+# Distinguishes spill files from buffers sharing a directory
+_SPILL_IDS = itertools.count()
+
+
+def experience_dtype(obs_shape: Sequence[int]) -> np.dtype:
+    """Return the record type for ``(prev_obs, action, reward, obs)``.
+
+    Actions are stored as ``(throttle, brake, steer, gear)``.
+    """
+
+    shape = tuple(obs_shape)
+    return np.dtype(
+        [
+            ("prev_obs", np.float32, shape),
+            ("action", np.float32, (4,)),
+            ("reward", np.float64),
+            ("obs", np.float32, shape),
+        ]
+    )
+
+
+class RingBuffer:
+    """Fixed-capacity array of records, oldest first.
+
+    Storage is one preallocated array of ``dtype``; :meth:`append` writes
+    a row in place. When full, ``overflow="drop"`` overwrites the oldest
+    row, while ``"spill"`` saves the full buffer to ``spill_dir`` as an
+    ``.npy`` chunk and starts again empty. Indexing, ``len`` and iteration
+    follow list semantics so existing readers keep working.
+    """
+
+    def __init__(
+        self,
+        dtype: Any,
+        capacity: int = 4096,
+        overflow: str = "drop",
+        spill_dir: str | Path | None = None,
+        name: str = "buffer",
+    ) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}")
+        if overflow == "spill" and spill_dir is None:
+            raise ValueError("spill_dir is required when overflow='spill'")
+        self.dtype = np.dtype(dtype)
+        self.capacity = int(capacity)
+        self.overflow = overflow
+        self.spill_dir = Path(spill_dir) if spill_dir is not None else None
+        self.name = name
+        self.spill_files: List[Path] = []
+        self.dropped = 0
+        self._data = np.zeros(self.capacity, dtype=self.dtype)
+        self._start = 0
+        self._len = 0
+        self._id = next(_SPILL_IDS)
+
+    # ------------------------------------------------------------------
+    def append(self, row: Any) -> None:
+        """Write ``row`` (a tuple for record dtypes) after the newest row."""
+
+        if self._len == self.capacity:
+            if self.overflow == "spill":
+                self._spill()
+            else:
+                self._data[self._start] = row
+                self._start = (self._start + 1) % self.capacity
+                self.dropped += 1
+                return
+        self._data[(self._start + self._len) % self.capacity] = row
+        self._len += 1
+
+    def _spill(self) -> None:
+        assert self.spill_dir is not None
+        self.spill_dir.mkdir(parents=True, exist_ok=True)
+        path = self.spill_dir / (
+            f"{self.name}-{self._id}-{len(self.spill_files):05d}.npy"
+        )
+        np.save(path, self.view())
+        self.spill_files.append(path)
+        self._start = 0
+        self._len = 0
+
+    def clear(self) -> None:
+        """Forget all rows; spilled chunks on disk are kept."""
+
+        self._start = 0
+        self._len = 0
+        self.dropped = 0
+
+    # ------------------------------------------------------------------
+    def segments(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return the stored rows as two zero-copy views, oldest first."""
+
+        end = self._start + self._len
+        if end <= self.capacity:
+            return self._data[self._start:end], self._data[:0]
+        return self._data[self._start:], self._data[: end - self.capacity]
+
+    def view(self) -> np.ndarray:
+        """Return rows oldest first.
+
+        This is a view of the storage unless the buffer has wrapped, in
+        which case the two :meth:`segments` are joined into a copy.
+        """
+
+        head, tail = self.segments()
+        return head if not len(tail) else np.concatenate((head, tail))
+
+    def to_dicts(self) -> List[dict]:
+        """Return rows as ``{field: value}`` dicts, e.g. for CSV export."""
+
+        rows = self.view().tolist()
+        if not self.dtype.names:
+            return [{"value": value} for value in rows]
+        return [dict(zip(self.dtype.names, row)) for row in rows]
+
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, index: int) -> Any:
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("RingBuffer index out of range")
+        return self._data[(self._start + index) % self.capacity]
+
+    def __iter__(self) -> Iterator[Any]:
+        head, tail = self.segments()
+        yield from head
+        yield from tail
+
+    def __array__(self, dtype: Any = None, copy: Any = None) -> np.ndarray:
+        data = self.view()
+        return data if dtype is None else data.astype(dtype)
@@ -11,14 +11,16 @@ Description: Module for Super Pole Position.
 
 import os
 import math
+from contextlib import contextmanager
 
 # Hide pygame's greeting for cleaner logs
 os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterator
 
 
-from ..config import load_parity_config
+from ..config import get_parity_config
+from ..resources import ResourceHandles
 from .sprites import (
     BILLBOARD_ART,
     CAR_ART,
@@ -28,54 +30,33 @@ from .sprites import (
 from ..evaluation.scores import load_scores
 
 
-_AUDIO_CFG = load_parity_config()
-AUDIO_VOLUME = float(_AUDIO_CFG.get("audio_volume", 0.8))
+PARITY = get_parity_config()
+AUDIO_VOLUME = PARITY.audio_volume
+SCANLINE_SPACING = PARITY.scanline_spacing
+SCANLINE_ALPHA = PARITY.scanline_alpha
 
+_HIGH_SCORE: int | None = None
 
-def _load_config() -> dict:
-    """Return arcade parity config from ``config.arcade_parity.yaml``.
 
-    Falls back to defaults when the file is missing or unreadable. A very
-    small built-in parser handles ``key: value`` pairs to avoid external
-    YAML dependencies.
-    """
-
-    default = {"scanline_spacing": 2, "scanline_alpha": 40}
-    cfg_path = Path(__file__).resolve().parents[1] / "config.arcade_parity.yaml"
-    if not cfg_path.exists():
-        return default
-    try:
-        import yaml  # type: ignore
+def _high_score() -> int:
+    """Return the best saved score, reading the scoreboard on first use."""
 
-        data = yaml.safe_load(cfg_path.read_text())
-        if isinstance(data, dict):
-            default.update(data)
-        return default
-    except Exception:
+    global _HIGH_SCORE
+    if _HIGH_SCORE is None:
         try:
-            for line in cfg_path.read_text().splitlines():
-                if ":" in line:
-                    key, val = line.split(":", 1)
-                    val = val.strip().strip("'\"")
-                    if val.replace(".", "", 1).isdigit():
-                        if "." in val:
-                            val = float(val)
-                        else:
-                            val = int(val)
-                    default[key.strip()] = val
-        except Exception:
-            pass
-        return default
-
-
-_PARITY_CFG = _load_config()
-SCANLINE_SPACING = int(_PARITY_CFG.get("scanline_spacing", 2))
-SCANLINE_ALPHA = int(_PARITY_CFG.get("scanline_alpha", 40))
+            _HIGH_SCORE = max((s["score"] for s in load_scores(None)), default=0)
+        except Exception:  # pragma: no cover - file may be missing
+            _HIGH_SCORE = 0
+    return _HIGH_SCORE
+
+
+def __getattr__(name: str) -> int:
+    """Resolve ``HIGH_SCORE`` lazily so importing the UI does no disk I/O."""
+
+    if name == "HIGH_SCORE":
+        return _high_score()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-try:
-    HIGH_SCORE = max((s["score"] for s in load_scores(None)), default=0)
-except Exception:  # pragma: no cover - file may be missing
-    HIGH_SCORE = 0
 
 try:
     import pygame  # type: ignore
@@ -96,29 +77,31 @@ def _load_sprite(name: str) -> "pygame.Surface | None":
         return None
 
 
+def _load_explosion_frames() -> "list[pygame.Surface] | None":
+    """Return the 16 frames of ``explosion_16f.png`` or ``None``."""
+
+    sheet = _load_sprite("explosion_16f.png")
+    if not sheet:
+        return None
+    frame_w = sheet.get_width() // 16
+    return [
+        sheet.subsurface((i * frame_w, 0, frame_w, sheet.get_height()))
+        for i in range(16)
+    ]
+
+
 def _load_arcade_config() -> Dict[str, float]:
-    """Return scanline configuration from ``config.arcade_parity.yaml``."""
+    """Return scanline and horizon settings from the shared parity config."""
 
-    cfg: Dict[str, float] = {"scanline_step": 2, "scanline_alpha": 60, "horizon_sway": 0.1}
-    path = Path(__file__).resolve().parents[2] / "config.arcade_parity.yaml"
-    try:
-        with open(path, "r", encoding="utf-8") as fh:
-            for line in fh:
-                if ":" not in line:
-                    continue
-                key, val = line.split(":", 1)
-                try:
-                    val = val.strip()
-                    cfg[key.strip()] = float(val) if "." in val else int(val)
-                except Exception:
-                    # Ignore non-numeric values and keep defaults
-                    continue
-    except Exception:
-        pass
-    return cfg
+    cfg = get_parity_config()
+    return {
+        "scanline_step": cfg.scanline_step,
+        "scanline_alpha": cfg.scanline_alpha,
+        "horizon_sway": cfg.horizon_sway,
+    }
 
 
-HORIZON_SWAY = float(_load_arcade_config().get("horizon_sway", 0.1))
+HORIZON_SWAY = PARITY.horizon_sway
 
 
 class Palette:
@@ -260,6 +243,33 @@ class ArcadeRenderer:
                 self.channels[2].play(self.crash_sound)
 
 
+@contextmanager
+def interpolated_poses(env, alpha: float | None) -> Iterator[None]:
+    """Move cars ``alpha`` of the way from their previous to current pose.
+
+    Uses the poses ``env`` saved before its latest fixed-timestep step;
+    ``x`` and the heading take the short way around. The simulated poses
+    are restored on exit. Does nothing without ``alpha`` or saved poses.
+    """
+
+    prev = getattr(env, "_prev_poses", None)
+    if alpha is None or prev is None:
+        yield
+        return
+    cars = [*env.cars, *env.traffic][: len(prev)]
+    saved = [(c.x, c.y, c.angle) for c in cars]
+    w = env.track.width
+    try:
+        for car, (px, py, pa), (x, y, a) in zip(cars, prev, saved):
+            car.x = (px + alpha * ((x - px + w / 2) % w - w / 2)) % w
+            car.y = py + alpha * (y - py)
+            car.angle = pa + alpha * ((a - pa + math.pi) % (2 * math.pi) - math.pi)
+        yield
+    finally:
+        for car, (x, y, a) in zip(cars, saved):
+            car.x, car.y, car.angle = x, y, a
+
+
 class Pseudo3DRenderer:
     """Renderer that simulates a pseudo-3D road with sprite scaling.
 
@@ -294,31 +304,27 @@ class Pseudo3DRenderer:
         self.sky_color = Palette.sky_blue
         self.ground_color = Palette.green
         self.car_color = Palette.red
-        self.player_car_sprite = _load_sprite("player_car.png") or ascii_surface(
+        # Decoded sprites are shared with other renderers via the pool
+        self._resources = ResourceHandles()
+        self.player_car_sprite = self._sprite("player_car.png") or ascii_surface(
             CAR_ART
         )
-        self.player_car_left = _load_sprite("player_car_bankL.png")
-        self.player_car_right = _load_sprite("player_car_bankR.png")
-        self.cpu_front_sprite = _load_sprite("cpu_car.png") or ascii_surface(CAR_ART)
+        self.player_car_left = self._sprite("player_car_bankL.png")
+        self.player_car_right = self._sprite("player_car_bankR.png")
+        self.cpu_front_sprite = self._sprite("cpu_car.png") or ascii_surface(CAR_ART)
         self.billboard_sprites = []
         for i in range(1, 9):
-            spr = _load_sprite(f"billboard_{i}.png")
+            spr = self._sprite(f"billboard_{i}.png")
             if spr:
                 self.billboard_sprites.append(spr)
         if not self.billboard_sprites:
             self.billboard_sprites = [ascii_surface(BILLBOARD_ART)]
-        self.mt_fuji = _load_sprite("mt_fuji.png")
-        self.clouds = _load_sprite("clouds.png")
+        self.mt_fuji = self._sprite("mt_fuji.png")
+        self.clouds = self._sprite("clouds.png")
         self.cloud_offset = 0.0
-        sheet = _load_sprite("explosion_16f.png")
-        if sheet:
-            frame_w = sheet.get_width() // 16
-            self.explosion_frames = [
-                sheet.subsurface((i * frame_w, 0, frame_w, sheet.get_height()))
-                for i in range(16)
-            ]
-        else:
-            self.explosion_frames = [ascii_surface(f) for f in EXPLOSION_FRAMES]
+        self.explosion_frames = self._resources.get(
+            ("sprite_frames", "explosion_16f.png", 16), _load_explosion_frames
+        ) or [ascii_surface(f) for f in EXPLOSION_FRAMES]
         self.scanline_spacing = SCANLINE_SPACING
         self.scanline_alpha = SCANLINE_ALPHA
 
@@ -335,6 +341,16 @@ class Pseudo3DRenderer:
             self.start_font = None
         self.dash_offset = 0.0
 
+    def _sprite(self, name: str) -> "pygame.Surface | None":
+        """Return sprite ``name`` from the shared resource pool."""
+
+        return self._resources.get(("sprite", name), lambda: _load_sprite(name))
+
+    def close(self) -> None:
+        """Return pooled sprites; the renderer should not draw afterwards."""
+
+        self._resources.release()
+
     def draw_explosion(self, env, pos) -> int:
         """Render the explosion frame at ``pos`` and return its index."""
 
@@ -411,11 +427,19 @@ class Pseudo3DRenderer:
             b = int(self.sky_top[2] * (1 - t) + self.sky_bottom[2] * t)
             pygame.draw.line(surface, (r, g, b), (0, y), (surface.get_width(), y))
 
-    def draw(self, env) -> None:
-        """Draw the environment from a front-facing perspective."""
+    def draw(self, env, alpha: float | None = None) -> None:
+        """Draw the environment from a front-facing perspective.
+
+        With ``alpha`` (see :meth:`PolePositionEnv.frame`) cars are drawn
+        between their previous and current fixed-timestep poses.
+        """
 
         if not pygame:
             return
+        with interpolated_poses(env, alpha):
+            self._draw(env)
+
+    def _draw(self, env) -> None:
 
         surface = self.canvas
         width = surface.get_width()
@@ -588,7 +612,7 @@ class Pseudo3DRenderer:
         # Player HUD text
         if pygame.font:
             font = pygame.font.SysFont(None, 24)
-            hi_score = max(HIGH_SCORE, int(env.score))
+            hi_score = max(_high_score(), int(env.score))
             hi_text = font.render(f"HI {hi_score:06d}", True, (0, 255, 0))
             score_text = font.render(f"SCORE {int(env.score):06d}", True, (0, 255, 0))
             surface.blit(hi_text, (10, 10))
@@ -633,6 +657,12 @@ class Pseudo3DRenderer:
                     perf_lines.append(f"plan {env.plan_durations[-1]*1000:.1f} ms")
                 if getattr(env, "plan_tokens", []):
                     perf_lines.append(f"tok {env.plan_tokens[-1]}")
+                stats = getattr(getattr(env, "planner", None), "stats", None)
+                if stats is not None:
+                    plan = stats()
+                    perf_lines.append(
+                        f"gen {plan['latency_ms']:.0f} ms, stale {plan['staleness_steps']}"
+                    )
         for i, line in enumerate(perf_lines):
             t = font.render(line, True, (255, 255, 255))
             surface.blit(t, (width - 160, 30 + 20 * i))
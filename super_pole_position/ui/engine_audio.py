@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 MIND INTERFACES, INC. All rights reserved.
+# Licensed under the MIT License.
+
+"""
+engine_audio.py
+Description: Wavetable engine sound with crossfaded pitch buckets.
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+import threading
+from collections import OrderedDict
+from typing import Any, Sequence
+
+import numpy as np
+
+try:
+    import pygame  # optional dependency for audio
+    from pygame import mixer as pg_mixer
+except Exception:  # pragma: no cover - optional dependency may be missing
+    pygame = None
+    pg_mixer = None
+
+# Seconds per loop: two periods of the 8 Hz wobble so tables loop cleanly
+LOOP_SECONDS = 0.25
+
+# Mixer channels held by engine voices of every EngineSynth in the process
+_channel_lock = threading.Lock()
+_claimed: set[int] = set()
+
+
+def _reserve() -> None:
+    """Keep every claimed channel out of pygame's automatic allocation."""
+
+    reserved = max(_claimed) + 1 if _claimed else 0
+    if pg_mixer.get_num_channels() < reserved + 8:
+        pg_mixer.set_num_channels(reserved + 8)
+    pg_mixer.set_reserved(reserved)
+
+
+def _claim_channel() -> int:
+    """Return the lowest mixer channel no engine voice holds."""
+
+    with _channel_lock:
+        index = next(i for i in itertools.count() if i not in _claimed)
+        _claimed.add(index)
+        try:
+            _reserve()
+        except Exception:
+            _claimed.discard(index)
+            raise
+        return index
+
+
+def _release_channel(index: int) -> None:
+    """Return mixer channel ``index`` to the shared set."""
+
+    with _channel_lock:
+        _claimed.discard(index)
+        try:
+            _reserve()
+        except Exception:
+            pass
+
+
+def engine_table(
+    freq: float, sample_rate: int = 44100, seed: int = 0, rumble: float = 0.05
+) -> np.ndarray:
+    """Return one seamless loop of engine tone at ``freq`` Hz.
+
+    The tone is a fundamental with a 2% 8 Hz vibrato, two harmonics and a
+    noise rumble of amplitude ``rumble``. ``freq`` should be a whole number
+    of cycles per loop; see :meth:`EngineSynth.bucket_freq`.
+    """
+
+    n = int(round(sample_rate * LOOP_SECONDS))
+    t = np.arange(n) / sample_rate
+    # Integrated phase of freq * (1 + 0.02 sin(2 pi 8 t)); zero drift per loop
+    phase = 2 * np.pi * freq * t + freq * 0.02 / 8 * (1.0 - np.cos(2 * np.pi * 8 * t))
+    wave = 0.3 * np.sin(phase) + 0.2 * np.sin(2 * phase) + 0.1 * np.sin(3 * phase)
+    wave += rumble * np.random.default_rng(seed).uniform(-1.0, 1.0, n)
+    return wave.astype(np.float32)
+
+
+class EngineSynth:
+    """Looping engine voices that crossfade between precomputed pitches.
+
+    Pitches are split into ``buckets_per_octave`` log-spaced buckets. Each
+    voice owns two mixer channels: one plays the even bucket and one the
+    odd bucket around the current pitch, and :meth:`update` only changes
+    their volumes. A channel switches table when its weight is zero, so
+    changing pitch never restarts audible sound. Tables are built lazily
+    and kept in an LRU of ``cache_size`` entries.
+
+    Channels are claimed from a process-wide set, so several synths never
+    share one, and :meth:`stop` hands them back.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 44100,
+        min_freq: float = 100.0,
+        max_freq: float = 8000.0,
+        buckets_per_octave: int = 12,
+        cache_size: int = 48,
+        seed: int = 0,
+    ) -> None:
+        self.sample_rate = int(sample_rate)
+        self.min_freq = float(min_freq)
+        self.buckets_per_octave = int(buckets_per_octave)
+        self.num_buckets = (
+            int(math.ceil(self.buckets_per_octave * math.log2(max_freq / min_freq))) + 1
+        )
+        self.cache_size = int(cache_size)
+        self.seed = seed
+        self._loop_len = int(round(self.sample_rate * LOOP_SECONDS))
+        self._tables: OrderedDict[int, Any] = OrderedDict()
+        # Per voice: [channel, bucket, mixer index] for the even and odd slot
+        self._slots: list[list[list[Any]]] = []
+
+    # ------------------------------------------------------------------
+    def bucket_pos(self, freq: float) -> float:
+        """Return the fractional bucket index for ``freq``."""
+
+        if freq <= self.min_freq:
+            return 0.0
+        pos = self.buckets_per_octave * math.log2(freq / self.min_freq)
+        return min(pos, float(self.num_buckets - 1))
+
+    def bucket_freq(self, idx: int) -> float:
+        """Return the pitch of bucket ``idx``, rounded to loop whole cycles."""
+
+        freq = self.min_freq * 2.0 ** (idx / self.buckets_per_octave)
+        cycles = max(1, round(freq * self._loop_len / self.sample_rate))
+        return cycles * self.sample_rate / self._loop_len
+
+    def weights(self, freq: float) -> tuple[tuple[int, float], tuple[int, float]]:
+        """Return ``(bucket, gain)`` for the even and odd slot at ``freq``.
+
+        Gains follow an equal-power crossfade between the two buckets that
+        bracket ``freq``.
+        """
+
+        pos = self.bucket_pos(freq)
+        lo = min(int(pos), self.num_buckets - 2) if self.num_buckets > 1 else 0
+        frac = pos - lo
+        hi = lo + 1
+        g_lo = math.cos(frac * math.pi / 2)
+        g_hi = math.sin(frac * math.pi / 2)
+        pair = ((lo, g_lo), (hi, g_hi))
+        return pair if lo % 2 == 0 else (pair[1], pair[0])
+
+    def table(self, idx: int) -> Any:
+        """Return the cached table (or mixer sound) for bucket ``idx``."""
+
+        cached = self._tables.get(idx)
+        if cached is not None:
+            self._tables.move_to_end(idx)
+            return cached
+        wave = engine_table(self.bucket_freq(idx), self.sample_rate, self.seed + idx)
+        cached = wave
+        if pg_mixer is not None and pygame is not None:
+            stereo = np.repeat(wave[:, None], 2, axis=1)
+            pcm = np.ascontiguousarray(stereo * 32767, dtype=np.int16)
+            try:
+                cached = pygame.sndarray.make_sound(pcm)
+            except Exception:
+                cached = wave
+        self._tables[idx] = cached
+        while len(self._tables) > self.cache_size:
+            self._tables.popitem(last=False)
+        return cached
+
+    def warm(self, freqs: Sequence[float]) -> None:
+        """Build the tables around each pitch in ``freqs`` ahead of time."""
+
+        for freq in freqs:
+            for idx, _ in self.weights(freq):
+                self.table(idx)
+
+    # ------------------------------------------------------------------
+    def update(self, voices: Sequence[tuple[float, float, float]], volume: float) -> None:
+        """Set pitch and stereo gains for each ``(freq, left, right)`` voice."""
+
+        if pg_mixer is None:
+            return
+        while len(self._slots) < len(voices):
+            self._slots.append([[None, None, None], [None, None, None]])
+        for v, (freq, left, right) in enumerate(voices):
+            for s, (idx, gain) in enumerate(self.weights(freq)):
+                slot = self._slots[v][s]
+                if slot[1] != idx or slot[0] is None:
+                    slot[0] = self._play(slot, self.table(idx))
+                    slot[1] = idx
+                if slot[0] is not None:
+                    try:
+                        slot[0].set_volume(volume * gain * left, volume * gain * right)
+                    except Exception:
+                        pass
+
+    def _play(self, slot: list[Any], sound: Any) -> Any:
+        """Loop ``sound`` on the slot's channel, claiming one if it has none."""
+
+        if isinstance(sound, np.ndarray):
+            return None
+        channel = slot[0]
+        if channel is None:
+            try:
+                if slot[2] is None:
+                    slot[2] = _claim_channel()
+                channel = pg_mixer.Channel(slot[2])
+            except Exception:
+                channel = None
+        if channel is not None:
+            try:
+                channel.play(sound, loops=-1)
+                return channel
+            except Exception:
+                pass
+        try:
+            return sound.play(loops=-1)
+        except Exception:
+            return None
+
+    def stop(self) -> None:
+        """Silence all voices."""
+
+        for slots in self._slots:
+            for slot in slots:
+                if slot[0] is not None:
+                    try:
+                        slot[0].stop()
+                    except Exception:
+                        pass
+                if slot[2] is not None:
+                    _release_channel(slot[2])
+                slot[0] = slot[1] = slot[2] = None
@@ -10,7 +10,8 @@ Description: Module for Super Pole Position.
 
 import os
 from pathlib import Path
-import importlib.util
+
+from ..asset_cache import cached_asset, source_hash
 
 # Hide pygame's greeting for cleaner logs
 os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
@@ -77,6 +78,17 @@ def ascii_surface(ascii_art: list[str], scale: int = 1) -> "pygame.Surface | Non
     return surf
 
 
+_SPRITE_ROOT = Path(__file__).resolve().parents[2] / "assets" / "sprites"
+
+
+def _build_sprite(mod, name: str, out: Path, specs: Path) -> None:
+    """Render placeholder sprite ``name`` to ``out`` with the generator ``mod``."""
+
+    if not pygame.font.get_init():
+        pygame.font.init()
+    mod.generate_sprite(name, out, mod._parse_sprite_specs(specs))
+
+
 def load_sprite(name: str, ascii_art: list[str] | None = None) -> "pygame.Surface | None":
     """Return a sprite loaded from ``assets/sprites`` or fallback to ASCII.
 
@@ -94,19 +106,19 @@ def load_sprite(name: str, ascii_art: list[str] | None = None) -> "pygame.Surfac
     if base:
         path = Path(base) / f"{name}.png"
     else:
-        path = Path(__file__).resolve().parents[2] / "assets" / "sprites" / f"{name}.png"
+        path = _SPRITE_ROOT / f"{name}.png"
 
     if not path.exists() or path.stat().st_size == 0:
-        gen_path = Path(__file__).resolve().parents[2] / "assets" / "sprites" / "generate_placeholders.py"
-        if gen_path.exists() and not pygame.display.get_init():
-            spec = importlib.util.spec_from_file_location("generate_placeholders", gen_path)
-            if spec and spec.loader:
-                mod = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(mod)
-                try:
-                    mod.generate_sprite(name, path)
-                except Exception:
-                    pass
+        gen_path = _SPRITE_ROOT / "generate_placeholders.py"
+        specs = _SPRITE_ROOT / "SPRITES.md"
+        cached = cached_asset(
+            gen_path,
+            f"{name}.png",
+            lambda mod, out: _build_sprite(mod, name, out, specs),
+            params=source_hash(specs),
+        )
+        if cached is not None:
+            path = cached
 
     surf: "pygame.Surface | None" = None
     if path.exists() and path.stat().st_size > 0:
@@ -114,28 +126,6 @@ def load_sprite(name: str, ascii_art: list[str] | None = None) -> "pygame.Surfac
             surf = pygame.image.load(str(path)).convert_alpha()
         except Exception:
             surf = None
-    else:
-        gen = path.parent / "generate_placeholders.py"
-        if gen.exists() and not pygame.display.get_init():
-            try:
-                spec = importlib.util.spec_from_file_location("placeholder_gen", gen)
-                if spec and spec.loader:
-                    mod = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(mod)
-                    if hasattr(mod, "generate_all"):
-                        mod.generate_all(path.parent)
-                    elif hasattr(mod, "generate_sprite"):
-                        size_map: dict[str, tuple[int, int]] = getattr(
-                            mod, "_parse_sprite_specs", lambda _: {}
-                        )(path.parent / "SPRITES.md")
-                        mod.generate_sprite(name, path, size_map)
-            except Exception:
-                pass
-            if path.exists() and path.stat().st_size > 0:
-                try:
-                    surf = pygame.image.load(str(path)).convert_alpha()
-                except Exception:
-                    surf = None
     if surf is None:
         surf = ascii_surface(ascii_art or [])
         if surf is None:
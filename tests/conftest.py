@@ -11,7 +11,7 @@ Description: Test suite for conftest.
 import sys
 from pathlib import Path
 
-import pytest  # noqa: F401
+import pytest
 
 # Ensure project root is on ``sys.path`` so the local gymnasium module is found
 sys.path.append(str(Path(__file__).resolve().parents[1]))
@@ -35,6 +35,21 @@ os.environ["ALLOW_NET"] = "0"
 os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_asset_cache(tmp_path_factory):
+    """Generate assets into a per-session directory, not ``~/.cache``."""
+
+    from super_pole_position.asset_cache import CACHE_ENV
+
+    old = os.environ.get(CACHE_ENV)
+    os.environ[CACHE_ENV] = str(tmp_path_factory.mktemp("asset_cache"))
+    yield
+    if old is None:
+        os.environ.pop(CACHE_ENV, None)
+    else:
+        os.environ[CACHE_ENV] = old
+
+
 class _DummyChannel:
     def stop(self):
         pass
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the generated-asset disk cache."""
+
+import pytest
+
+from super_pole_position import asset_cache
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setenv(asset_cache.CACHE_ENV, str(tmp_path / "cache"))
+    monkeypatch.setattr(asset_cache, "_RESOLVED", {})
+    monkeypatch.setattr(asset_cache, "_MODULES", {})
+    gen = tmp_path / "gen.py"
+    gen.write_text("def make(path):\n    path.write_bytes(b'v1')\n")
+    return gen
+
+
+def test_generates_once_and_reuses(cache, monkeypatch):
+    calls = []
+
+    def build(mod, out):
+        calls.append(out)
+        mod.make(out)
+
+    first = asset_cache.cached_asset(cache, "tone.wav", build, params=1)
+    assert first.read_bytes() == b"v1"
+    assert first.parent == asset_cache.cache_dir()
+    assert asset_cache.cached_asset(cache, "tone.wav", build, params=1) == first
+    # A fresh process finds the file on disk without running the generator
+    monkeypatch.setattr(asset_cache, "_RESOLVED", {})
+    monkeypatch.setattr(asset_cache, "_MODULES", {})
+    assert asset_cache.cached_asset(cache, "tone.wav", build, params=1) == first
+    assert len(calls) == 1
+    assert not asset_cache._MODULES
+    assert list(first.parent.iterdir()) == [first]
+
+
+def test_key_includes_params_and_source(cache):
+    build = lambda mod, out: mod.make(out)  # noqa: E731
+    a = asset_cache.cached_asset(cache, "tone.wav", build, params=1)
+    b = asset_cache.cached_asset(cache, "tone.wav", build, params=2)
+    assert a != b and a.suffix == ".wav"
+    cache.write_text("def make(path):\n    path.write_bytes(b'version-2')\n")
+    asset_cache._RESOLVED.clear()
+    c = asset_cache.cached_asset(cache, "tone.wav", build, params=1)
+    assert c != a and c.read_bytes() == b"version-2"
+
+
+def test_failed_build_returns_none(cache):
+    def build(mod, out):
+        raise RuntimeError("boom")
+
+    assert asset_cache.cached_asset(cache, "bad.png", build) is None
+    assert not any(asset_cache.cache_dir().iterdir())
+
+
+def test_concurrent_builds_use_separate_temp_files(cache):
+    import threading
+
+    barrier = threading.Barrier(2, timeout=5)
+    paths = []
+
+    def build(mod, out):
+        paths.append(out)
+        barrier.wait()
+        mod.make(out)
+
+    threads = [
+        threading.Thread(
+            target=asset_cache.cached_asset, args=(cache, "tone.wav", build)
+        )
+        for _ in range(2)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(5)
+    assert len(set(paths)) == 2
+    (out,) = asset_cache.cache_dir().iterdir()
+    assert out.read_bytes() == b"v1"
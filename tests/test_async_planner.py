@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the background GPT planner."""
+
+import threading
+import time
+
+import numpy as np
+
+from super_pole_position.agents.controllers import AsyncPlanner, GPTPlanner
+from super_pole_position.envs.pole_position import PolePositionEnv
+from super_pole_position.envs.vector_env import VectorPolePositionEnv
+
+
+class _SlowPlanner:
+    """Stands in for a loaded model; blocks until ``release`` is set."""
+
+    tokenizer = model = object()
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.seen = []
+
+    def generate_plan(self, state):
+        self.release.wait(5.0)
+        self.seen.append(state["speed"])
+        return f"target_speed {state['speed'] + 1}"
+
+
+def test_generate_plan_never_waits_for_the_model():
+    slow = _SlowPlanner()
+    planner = AsyncPlanner(slow)
+    start = time.perf_counter()
+    plans = [planner.generate_plan({"speed": s}) for s in range(5)]
+    assert time.perf_counter() - start < 0.5
+    assert plans == ["target_speed 10"] * 5
+    slow.release.set()
+    assert planner.wait(5.0)
+    # The worker skipped states replaced while it was busy
+    assert slow.seen[-1] == 4 and planner.dropped == 5 - len(slow.seen)
+    assert planner.generate_plan({"speed": 7}) == "target_speed 5"
+    planner.close(5.0)
+    assert planner._thread is None
+
+
+def test_stats_report_latency_and_staleness():
+    slow = _SlowPlanner()
+    slow.release.set()
+    planner = AsyncPlanner(slow)
+    planner.generate_plan({"speed": 1})
+    assert planner.wait(5.0)
+    slow.release.clear()
+    for _ in range(3):
+        planner.generate_plan({"speed": 2})
+    calls, seconds = planner.staleness()
+    assert calls == 3 and seconds > 0.0
+    slow.release.set()
+    assert planner.wait(5.0)
+    stats = planner.stats()
+    assert stats["completed"] >= 2 and stats["failed"] == 0
+    assert stats["latency_max_ms"] >= stats["latency_mean_ms"] > 0.0
+    assert stats["pending"] == 0 and stats["staleness_steps"] == 0
+    planner.close(5.0)
+
+
+def test_keys_keep_separate_plans():
+    slow = _SlowPlanner()
+    slow.release.set()
+    planner = AsyncPlanner(slow)
+    planner.generate_plan({"speed": 1}, key=0)
+    planner.generate_plan({"speed": 20}, key=1)
+    planner.wait(5.0)
+    assert planner.generate_plan({"speed": 1}, key=0) == "target_speed 2"
+    assert planner.generate_plan({"speed": 20}, key=1) == "target_speed 21"
+    planner.close(5.0)
+
+
+def test_unloaded_planner_runs_inline():
+    planner = AsyncPlanner(GPTPlanner())
+    assert planner.generate_plan({"speed": 3}) == "target_speed 10"
+    assert planner._thread is None and planner.staleness()[0] == 0
+
+
+def test_async_env_matches_sync_env():
+    action = (1.0, 0.0, 0.1, 0)
+    sync = PolePositionEnv(render_mode=None, seed=2)
+    sync.reset(seed=2)
+    env = PolePositionEnv(render_mode=None, seed=2, async_planner=True)
+    env.reset(seed=2)
+    for _ in range(5):
+        np.testing.assert_array_equal(env.step(action)[0], sync.step(action)[0])
+    assert isinstance(env.planner, AsyncPlanner)
+    env.close()
+
+    venv = VectorPolePositionEnv(num_envs=2, seed=2, async_planner=True)
+    venv.reset()
+    venv.step(np.tile([1.0, 0.0, 0.0, 0.0], (2, 1)))
+    venv.close()
+
+
+def test_clone_gets_its_own_async_planner():
+    slow = _SlowPlanner()
+    slow.release.set()
+    env = PolePositionEnv(render_mode=None, seed=2, async_planner=True)
+    env.reset(seed=2)
+    env.planner.planner = slow
+    env.step((1.0, 0.0, 0.0, 0))
+    assert env.planner.wait(5.0)
+    twin = env.clone()
+    assert isinstance(twin.planner, AsyncPlanner) and twin.planner is not env.planner
+    assert twin.planner.planner is slow
+    twin.step((1.0, 0.0, 0.0, 0))
+    twin.close()
+    # Closing the clone leaves the original's worker and counts alone
+    assert env.planner._thread is not None and env.planner.staleness()[0] == 0
+    env.step((1.0, 0.0, 0.0, 0))
+    assert env.planner.wait(5.0) and env.planner.completed == 2
+    env.close()
+
+
+def test_close_timeout_does_not_revive_old_worker():
+    slow = _SlowPlanner()
+    planner = AsyncPlanner(slow)
+    planner.generate_plan({"speed": 1})
+    # Wait until the worker is stuck inside generate_plan
+    deadline = time.monotonic() + 5.0
+    while not planner._busy and time.monotonic() < deadline:
+        time.sleep(0.001)
+    old = planner._thread
+    planner.close(0.01)
+    assert old.is_alive()
+    planner.generate_plan({"speed": 2})
+    assert planner._thread is not old
+    slow.release.set()
+    old.join(5.0)
+    assert not old.is_alive()
+    assert planner.wait(5.0)
+    # Only the new worker's plan is published
+    assert planner.completed == 1
+    assert planner.generate_plan({"speed": 3}) == "target_speed 3"
+    planner.close(5.0)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for sweep-and-prune traffic queries."""
+
+from random import Random
+
+import numpy as np
+
+from super_pole_position.envs import pole_position
+from super_pole_position.envs.pole_position import PolePositionEnv
+from super_pole_position.physics.broadphase import SweepAndPrune
+from super_pole_position.physics.car import Car
+from super_pole_position.physics.track import Track
+from super_pole_position.physics.traffic_car import TrafficCar
+
+
+def _cars(rng: Random, n: int, width: float) -> list[Car]:
+    return [Car(x=rng.uniform(-5, width + 5), y=rng.uniform(0, 10)) for _ in range(n)]
+
+
+def test_within_matches_wrapped_scan():
+    rng = Random(1)
+    width = 200.0
+    cars = _cars(rng, 80, width)
+    sweep = SweepAndPrune(width)
+    sweep.update(cars)
+    for _ in range(200):
+        x = rng.uniform(0, width)
+        lo, hi = sorted((rng.uniform(-6, 6), rng.uniform(-6, 6)))
+        got = set(sweep.within(x, lo, hi).tolist())
+        for i, c in enumerate(cars):
+            dx = (c.x - x + width / 2) % width - width / 2
+            if lo <= dx <= hi:
+                assert i in got
+
+
+def test_nearest_matches_stable_sort():
+    rng = Random(2)
+    for curve in (False, True):
+        track = Track(width=120.0, height=20.0)
+        if curve:
+            track.curve = object()  # distance() skips wrapping on curves
+        cars = _cars(rng, 60, track.width)
+        cars += [Car(x=cars[0].x, y=cars[0].y) for _ in range(3)]  # ties
+        sweep = SweepAndPrune(track.width)
+        sweep.update(cars)
+        for _ in range(50):
+            me = Car(x=rng.uniform(0, track.width), y=rng.uniform(0, 20))
+            dists = [track.distance(me, c) for c in cars]
+            expected = sorted(range(len(cars)), key=lambda i: dists[i])[:5]
+            got = sweep.nearest(me.x, 5, lambda c: track.distance(me, c))
+            assert got == expected
+
+
+def test_update_keeps_order_after_motion():
+    cars = [Car(x=float(i), y=0.0) for i in range(10)]
+    sweep = SweepAndPrune(10.0)
+    sweep.update(cars)
+    for c in cars:
+        c.x = (c.x + 3.5) % 10.0
+    sweep.update(cars)
+    assert sweep.within(0.0, 0.0, 0.6).tolist() == [7]
+    assert len(sweep) == 10
+
+
+def test_many_car_race_counts_overtakes(monkeypatch):
+    # FAST_TEST trims traffic to two cars
+    monkeypatch.setattr(pole_position, "FAST_TEST", False)
+    env = PolePositionEnv(render_mode=None, mode="race")
+    env.reset(seed=0)
+    env.start_timer = 0
+    far = env.track.height / 2 + 20
+    env.traffic = [TrafficCar(x=float(i * 3), y=far) for i in range(60)]
+    passed = env.traffic[30]
+    passed.y = env.cars[0].y
+    passed.x = passed.prev_x = env.cars[0].x - 1.0
+    env.prev_x = env.cars[0].x - 2.0
+    obs, *_ = env.step((0.0, 0.0, 0.0))
+    assert obs.shape == (17,)
+    assert env.overtakes == 1
+    nearest_dx, nearest_dy = obs[7], obs[8]
+    assert (nearest_dx, nearest_dy) == (
+        np.float32(passed.x - env.cars[0].x),
+        np.float32(passed.y - env.cars[0].y),
+    )
+    env.close()
@@ -0,0 +1,69 @@
+import sys
+
+import numpy as np
+import pytest
+
+from super_pole_position.envs.pole_position import PolePositionEnv
+from super_pole_position.evaluation import logger as bench_logger
+
+
+def _finished_env(steps: int = 5) -> PolePositionEnv:
+    env = PolePositionEnv(render_mode="human")
+    env.reset(seed=0)
+    for _ in range(steps):
+        env.step((1.0, 0.0, 0.0))
+    return env
+
+
+@pytest.mark.parametrize("fmt", ["npy", "npz"])
+def test_columnar_round_trip(tmp_path, monkeypatch, fmt):
+    monkeypatch.setattr(bench_logger, "BENCH_ROOT", tmp_path)
+    env = _finished_env()
+    expected = env.step_log.view().copy()
+    summary = bench_logger.log_episode(env, fmt=fmt)
+    env.close()
+    step_file = summary.with_name(f"{summary.stem}-steps.{fmt}")
+    cols = bench_logger.load_steps(step_file)
+    assert np.array_equal(cols["car0_x"], expected["car0_x"])
+    assert np.array_equal(cols["step"], expected["step"])
+
+
+def test_npy_logs_are_memory_mapped(tmp_path):
+    steps = np.zeros(4, dtype=[("step", np.int64), ("reward", np.float64)])
+    path = bench_logger.write_steps(steps, tmp_path / "a-steps.npy")
+    assert isinstance(bench_logger.load_steps(path), np.memmap)
+
+
+def test_concat_steps_across_runs(tmp_path):
+    for i, n in enumerate((3, 2)):
+        steps = np.zeros(n, dtype=[("step", np.int64), ("reward", np.float64)])
+        steps["reward"] = i + 1
+        bench_logger.write_steps(steps, tmp_path / f"{i}-steps.npz", "npz")
+    (tmp_path / "x-steps.csv").write_text("step,reward\n1,9\n")
+    cols = bench_logger.concat_steps(tmp_path, fields=["reward"])
+    assert cols["reward"].tolist() == [1, 1, 1, 2, 2]
+    totals = np.bincount(cols["episode"], weights=cols["reward"])
+    assert totals.tolist() == [3.0, 4.0]
+
+
+def test_format_from_environment(tmp_path, monkeypatch):
+    monkeypatch.setattr(bench_logger, "BENCH_ROOT", tmp_path)
+    monkeypatch.setenv("SPP_LOG_FORMAT", "npz")
+    env = _finished_env(2)
+    summary = bench_logger.log_episode(env)
+    env.close()
+    assert summary.with_name(f"{summary.stem}-steps.npz").exists()
+
+
+def test_list_step_logs_still_supported():
+    rows = [{"step": 1, "reward": 0.5}, {"step": 2, "reward": 1.5}]
+    arr = bench_logger.step_array(rows)
+    assert arr["reward"].tolist() == [0.5, 1.5]
+
+
+def test_parquet_falls_back_without_pyarrow(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    steps = np.zeros(2, dtype=[("step", np.int64)])
+    path = bench_logger.write_steps(steps, tmp_path / "a-steps.parquet", "parquet")
+    assert path.suffix == ".npz"
+    assert bench_logger.load_steps(path)["step"].tolist() == [0, 0]
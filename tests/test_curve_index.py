@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the CurveIndex nearest-point lookup."""
+
+import random
+
+import numpy as np
+
+from super_pole_position.physics.car import Car
+from super_pole_position.physics.track import Track
+from super_pole_position.physics.track_curve import CurveIndex, TrackCurve
+
+
+def _linear_nearest(points, x, y):
+    best_i, best_d = -1, float("inf")
+    for i, (px, py) in enumerate(points):
+        d = (x - px) ** 2 + (y - py) ** 2
+        if d < best_d:
+            best_i, best_d = i, d
+    return best_i
+
+
+def _long_curve():
+    return TrackCurve.from_tuples(
+        [
+            (0.0, 0.0, 0.0, 300.0),
+            (300.0, 0.0, 0.02, 160.0),
+            (300.0, 60.0, -0.01, 400.0),
+        ]
+    )
+
+
+def test_nearest_matches_linear_scan():
+    curve = _long_curve()
+    points = curve._points[1:]
+    rng = random.Random(0)
+    for _ in range(300):
+        px, py = rng.choice(points)
+        x = px + rng.uniform(-15, 15)
+        y = py + rng.uniform(-15, 15)
+        expected = _linear_nearest(points, x, y)
+        assert curve.index.nearest(x, y) == expected
+        assert curve.index.nearest(x, y, hint=rng.randrange(len(points))) == expected
+    assert curve.index.nearest(1e5, -1e5) == _linear_nearest(points, 1e5, -1e5)
+
+
+def test_nearest_prefers_first_of_equal_points():
+    index = CurveIndex([(0.0, 0.0), (2.0, 0.0), (0.0, 0.0)], cell_size=1.0)
+    assert index.nearest(0.0, 0.0, hint=2) == 0
+    assert index.nearest(1.0, 0.0) == 0
+    assert CurveIndex([]).nearest(0.0, 0.0) == -1
+
+
+def test_track_progress_follows_moving_car():
+    curve = _long_curve()
+    track = Track(width=800.0, height=400.0, road_width=12.0, curve=curve)
+    car = Car(x=0.0, y=0.0)
+    points = curve._points[1:]
+    for s in range(0, int(curve.total_length), 7):
+        car.x, car.y = curve.point_at(s)
+        car.y += 2.0
+        idx = _linear_nearest(points, car.x, car.y)
+        expected = curve._lengths[idx] / curve.total_length
+        assert track.progress(car) == expected
+        assert track.progress((car.x, car.y)) == expected
+
+
+def test_progress_array_matches_linear_scan():
+    curve = _long_curve()
+    track = Track(width=800.0, height=400.0, road_width=12.0, curve=curve)
+    points = curve._points[1:]
+    rng = random.Random(1)
+    xs, ys = [], []
+    for _ in range(60):
+        px, py = rng.choice(points)
+        xs.append(px + rng.uniform(-15, 15))
+        ys.append(py + rng.uniform(-15, 15))
+    expected = [
+        curve._lengths[_linear_nearest(points, x, y)] / curve.total_length
+        for x, y in zip(xs, ys)
+    ]
+    grid = np.array([xs, ys]).reshape(2, 6, 10)
+    assert track.progress_array(grid[0], grid[1]).ravel().tolist() == expected
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the wavetable engine synthesizer."""
+
+import math
+
+import numpy as np
+
+from super_pole_position.ui import engine_audio
+from super_pole_position.ui.engine_audio import EngineSynth, engine_table
+
+
+class _Channel:
+    def __init__(self):
+        self.plays = 0
+        self.volume = (0.0, 0.0)
+
+    def play(self, *_a, **_k):
+        self.plays += 1
+
+    def set_volume(self, left, right=None):
+        self.volume = (left, right)
+
+    def stop(self):
+        pass
+
+
+def test_tables_loop_without_a_jump():
+    synth = EngineSynth(sample_rate=8000)
+    for idx in (0, 20, 50):
+        freq = synth.bucket_freq(idx)
+        wave = engine_table(freq, 8000, rumble=0.0)
+        # Largest change between neighbouring samples inside the loop
+        step = np.abs(np.diff(wave)).max()
+        assert abs(float(wave[0]) - float(wave[-1])) <= step * 1.01
+        assert wave.dtype == np.float32
+
+
+def test_equal_power_crossfade():
+    synth = EngineSynth()
+    for freq in (100.0, 433.0, 1234.5, 7999.0):
+        (even, g_even), (odd, g_odd) = synth.weights(freq)
+        assert even % 2 == 0 and odd % 2 == 1
+        assert abs(even - odd) == 1
+        assert math.isclose(g_even**2 + g_odd**2, 1.0)
+
+
+def test_lru_bounds_table_cache():
+    synth = EngineSynth(sample_rate=4000, cache_size=4)
+    for idx in range(10):
+        synth.table(idx)
+    assert list(synth._tables) == [6, 7, 8, 9]
+
+
+def _fake_mixer(monkeypatch, channels, reserved=None):
+    mixer = type(
+        "Mixer",
+        (),
+        {
+            "get_num_channels": staticmethod(lambda: 8),
+            "set_num_channels": staticmethod(lambda n: None),
+            "set_reserved": staticmethod(
+                lambda n: reserved.append(n) if reserved is not None else None
+            ),
+            "Channel": staticmethod(lambda i: channels[i]),
+        },
+    )
+    monkeypatch.setattr(engine_audio, "pg_mixer", mixer)
+    monkeypatch.setattr(engine_audio, "_claimed", set())
+    monkeypatch.setattr(engine_audio.pygame.sndarray, "make_sound", lambda a: object())
+
+
+def test_steady_pitch_only_changes_volume(monkeypatch):
+    channels = [_Channel() for _ in range(4)]
+    _fake_mixer(monkeypatch, channels)
+    synth = EngineSynth(sample_rate=4000)
+    for _ in range(5):
+        synth.update([(400.0, 0.9, 0.1), (410.0, 0.1, 0.9)], 0.8)
+    assert [c.plays for c in channels] == [1, 1, 1, 1]
+    synth.update([(400.0 * 2 ** (1 / 12), 0.9, 0.1), (410.0, 0.1, 0.9)], 0.8)
+    assert sum(c.plays for c in channels) == 5
+    synth.stop()
+
+
+def test_synths_claim_separate_channels(monkeypatch):
+    channels = [_Channel() for _ in range(6)]
+    reserved = []
+    _fake_mixer(monkeypatch, channels, reserved)
+    first, second = EngineSynth(sample_rate=4000), EngineSynth(sample_rate=4000)
+    first.update([(400.0, 1.0, 1.0)], 1.0)
+    second.update([(400.0, 1.0, 1.0)], 1.0)
+    assert [c.plays for c in channels] == [1, 1, 1, 1, 0, 0]
+    assert reserved[-1] == 4
+    first.stop()
+    # Freed channels are reused before new ones are reserved
+    EngineSynth(sample_rate=4000).update([(400.0, 1.0, 1.0)], 1.0)
+    assert [c.plays for c in channels] == [2, 2, 1, 1, 0, 0]
+    second.stop()
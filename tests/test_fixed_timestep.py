@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the fixed-timestep loop and render interpolation."""
+
+import numpy as np
+import pytest
+
+from super_pole_position.envs.pole_position import PolePositionEnv
+from super_pole_position.ui.arcade import interpolated_poses
+
+DT = 0.05
+ACTION = (1.0, 0.0, 0.1, 0)
+
+
+class _SlowClock:
+    def get_time(self) -> int:
+        return 500  # a 0.5 s frame
+
+
+def _env(**kwargs):
+    env = PolePositionEnv(render_mode=None, seed=4, fixed_dt=DT, **kwargs)
+    env.reset(seed=4)
+    return env
+
+
+def test_step_ignores_frame_time():
+    env = _env()
+    env.clock = _SlowClock()
+    before = env.remaining_time
+    env.step(ACTION)
+    assert env.remaining_time == pytest.approx(before - DT)
+
+
+def test_frame_runs_whole_substeps():
+    env = _env()
+    *_, info = env.frame(ACTION, elapsed=2.5 * DT)
+    assert info["substeps"] == 2 and env.render_alpha == pytest.approx(0.5)
+    *_, info = env.frame(ACTION, elapsed=0.5 * DT)
+    assert info["substeps"] == 1 and env.render_alpha == pytest.approx(0.0)
+    *_, info = env.frame(ACTION, elapsed=10.0, max_substeps=3)
+    assert info["substeps"] == 3
+
+
+def test_frame_rate_does_not_change_simulation():
+    steady = _env()
+    for _ in range(12):
+        obs_steady, *_ = steady.step(ACTION)
+    jittery = _env()
+    for elapsed in (DT, 3 * DT, 0.5 * DT, 2.5 * DT, 4 * DT, DT):
+        obs_jitter, *_ = jittery.frame(ACTION, elapsed=elapsed)
+    assert jittery.current_step == 12
+    np.testing.assert_array_equal(obs_jitter, obs_steady)
+
+
+def test_interpolated_poses_restore_state():
+    env = _env()
+    car = env.cars[0]
+    env._prev_poses = [(env.track.width - 1.0, 10.0, 0.0)]
+    car.x, car.y, car.angle = 1.0, 20.0, 0.5
+    with interpolated_poses(env, 0.25):
+        assert car.x == pytest.approx(env.track.width - 0.5)
+        assert (car.y, car.angle) == pytest.approx((12.5, 0.125))
+    assert (car.x, car.y, car.angle) == (1.0, 20.0, 0.5)
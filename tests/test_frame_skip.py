@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for frame skip (action repeat) inside the envs."""
+
+import numpy as np
+import pytest
+
+from super_pole_position.envs.pole_position import PolePositionEnv
+from super_pole_position.envs.vector_env import VectorPolePositionEnv
+
+ACTION = (1.0, 0.0, 0.2, 0)
+
+
+def _env(**kwargs):
+    env = PolePositionEnv(seed=6, **kwargs)
+    env.reset(seed=6)
+    return env
+
+
+def test_frame_skip_matches_repeated_steps():
+    single = _env(render_mode=None)
+    total = 0.0
+    for _ in range(2):
+        obs_single, reward, *_ = single.step(ACTION)
+        total += reward
+    skipped = _env(render_mode=None, frame_skip=2)
+    obs, reward, done, _, _ = skipped.step(ACTION)
+    assert skipped.current_step == single.current_step == 2
+    np.testing.assert_array_equal(obs, obs_single)
+    assert reward == pytest.approx(total) and not done
+
+
+def test_frame_skip_stops_when_done():
+    single = _env(render_mode=None)
+    total, done = 0.0, False
+    while not done:
+        _, reward, done, _, _ = single.step(ACTION)
+        total += reward
+    skipped = _env(render_mode=None, frame_skip=single.current_step + 5)
+    _, reward, done, _, _ = skipped.step(ACTION)
+    assert done and skipped.current_step == single.current_step
+    assert reward == pytest.approx(total)
+    assert skipped.score == single.score
+
+
+def test_frame_skip_logs_once_per_call():
+    env = _env(render_mode="human", frame_skip=3)
+    env.step(ACTION)
+    assert len(env.step_log) == 1 and env.current_step == 3
+    env.close()
+
+
+def test_frame_skip_rejects_zero():
+    with pytest.raises(ValueError):
+        PolePositionEnv(render_mode=None, frame_skip=0)
+    with pytest.raises(ValueError):
+        VectorPolePositionEnv(num_envs=2, frame_skip=0)
+
+
+def test_vector_frame_skip_matches_single_env():
+    seed, skip = 3, 3
+    venv = VectorPolePositionEnv(num_envs=2, frame_skip=skip)
+    venv.reset(seed=seed)
+    envs = []
+    for i in range(2):
+        env = PolePositionEnv(render_mode="human", seed=seed + i, frame_skip=skip)
+        env.reset(seed=seed + i)
+        envs.append(env)
+    rng = np.random.default_rng(1)
+    for _ in range(20):
+        actions = np.column_stack(
+            [rng.random(2) < 0.8, rng.random(2) < 0.1, rng.uniform(-1, 1, 2)]
+        ).astype(float)
+        vobs, vrew, vdone, _, info = venv.step(actions)
+        for i, env in enumerate(envs):
+            obs, reward, done, _, _ = env.step(tuple(actions[i]))
+            expected = info["final_observation"][i] if vdone[i] else vobs[i]
+            np.testing.assert_allclose(obs, expected, rtol=1e-6, atol=1e-6)
+            assert reward == pytest.approx(vrew[i])
+            assert done == vdone[i]
+        if vdone.any():
+            break
+    for env in envs:
+        env.close()
+
+
+def test_vector_frame_skip_holds_finished_races():
+    actions = np.tile([1.0, 0.0, 0.1, 0.0], (2, 1))
+    ref = VectorPolePositionEnv(num_envs=2, seed=8)
+    venv = VectorPolePositionEnv(num_envs=2, seed=8, frame_skip=2)
+    for env in (ref, venv):
+        env.reset()
+        env.remaining_time[0] = 0.5
+    _, first, done, _, info = ref.step(actions)
+    assert done.tolist() == [True, False]
+    final = info["final_observation"][0]
+    _, second, _, _, _ = ref.step(actions)
+
+    obs, reward, done, _, info = venv.step(actions)
+    assert done.tolist() == [True, False]
+    np.testing.assert_array_equal(info["final_observation"][0], final)
+    np.testing.assert_array_equal(obs[1], ref._get_obs()[1])
+    assert reward == pytest.approx([first[0], first[1] + second[1]])
+    assert venv.current_step.tolist() == [0, 2]
+
+
+def test_vector_frame_skip_crash_matches_single_env():
+    env = PolePositionEnv(render_mode=None, seed=3, frame_skip=2)
+    env.reset(seed=3)
+    # A second race keeps running so race 0 is held for the second frame
+    venv = VectorPolePositionEnv(num_envs=2, frame_skip=2)
+    venv.reset(seed=3)
+    # Park the CPU car on the player so the first frame crashes
+    player, cpu = env.cars[0], env.traffic[0]
+    cpu.x, cpu.y = player.x, player.y
+    venv.x[0, 2], venv.y[0, 2] = venv.x[0, 0], venv.y[0, 0]
+    obs, reward, done, _, _ = env.step(ACTION)
+    vobs, vrew, vdone, _, _ = venv.step(np.array([ACTION, ACTION], dtype=float))
+    assert venv.current_step.tolist() == [1, 2]
+    assert env.crashes == venv.crashes[0] == 1 and env.current_step == 1
+    assert reward == pytest.approx(vrew[0]) == -10.0 and done == vdone[0]
+    assert venv.remaining_time[0] == pytest.approx(env.remaining_time)
+    assert venv.lap_timer[0] == pytest.approx(env.lap_timer)
+    np.testing.assert_allclose(obs, vobs[0], rtol=1e-6, atol=1e-6)
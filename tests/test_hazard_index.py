@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the Track hazard spatial hash."""
+
+from random import Random
+
+import numpy as np
+
+from super_pole_position.physics.car import Car
+from super_pole_position.physics.hazard_index import HazardGrid
+from super_pole_position.physics.track import (
+    IcyPatch,
+    Obstacle,
+    Puddle,
+    SurfaceZone,
+    Track,
+)
+
+
+def _random_track(rng: Random, n: int = 200) -> Track:
+    def pos():
+        return rng.uniform(0, 200), rng.uniform(0, 200)
+
+    return Track(
+        puddles=[Puddle(*pos(), radius=rng.uniform(1, 8)) for _ in range(n)],
+        icy_patches=[
+            IcyPatch(*pos(), radius=rng.uniform(1, 8), drift=rng.uniform(0, 1))
+            for _ in range(n)
+        ],
+        surfaces=[
+            SurfaceZone(*pos(), rng.uniform(1, 20), rng.uniform(1, 20), rng.random())
+            for _ in range(n)
+        ],
+        obstacles=[
+            Obstacle(*pos(), rng.uniform(1, 6), rng.uniform(1, 6), billboard=True)
+            for _ in range(n)
+        ],
+    )
+
+
+def _scan_patch(track, x, y):
+    for patch in track.icy_patches:
+        if (x - patch.x) ** 2 + (y - patch.y) ** 2 <= patch.radius**2:
+            return patch
+    return None
+
+
+def test_queries_match_linear_scan():
+    rng = Random(3)
+    track = _random_track(rng)
+    for _ in range(500):
+        car = Car(x=rng.uniform(-10, 210), y=rng.uniform(-10, 210))
+        expected_puddle = any(
+            (car.x - p.x) ** 2 + (car.y - p.y) ** 2 <= p.radius**2
+            for p in track.puddles
+        )
+        assert track.in_puddle(car) == expected_puddle
+        assert track.in_icy_patch(car) is _scan_patch(track, car.x, car.y)
+        zone = next(
+            (
+                z.friction
+                for z in track.surfaces
+                if z.x <= car.x <= z.x + z.width and z.y <= car.y <= z.y + z.height
+            ),
+            1.0,
+        )
+        puddle = track.get_puddle_factor() if expected_puddle else 1.0
+        assert track.base_friction_factor(car) == puddle * zone
+
+
+def test_array_queries_match_scalar():
+    rng = Random(5)
+    track = _random_track(rng, n=50)
+    xs = np.array([rng.uniform(0, 200) for _ in range(64)])
+    ys = np.array([rng.uniform(0, 200) for _ in range(64)])
+    cars = [Car(x=x, y=y) for x, y in zip(xs, ys)]
+    assert track.in_puddle_array(xs, ys).tolist() == [track.in_puddle(c) for c in cars]
+    assert np.allclose(
+        track.friction_factor_array(xs, ys), [track.friction_factor(c) for c in cars]
+    )
+    assert np.allclose(
+        track.slip_angle_array(xs, ys), [track.slip_angle(c) for c in cars]
+    )
+
+
+def test_billboard_removal_reindexes():
+    track = Track(
+        obstacles=[
+            Obstacle(x=10.0, y=10.0, width=4.0, height=4.0, billboard=True),
+            Obstacle(x=50.0, y=50.0, width=4.0, height=4.0, billboard=True),
+        ]
+    )
+    assert track.billboard_hit(Car(x=10.0, y=10.0))
+    assert not track.billboard_hit(Car(x=10.0, y=10.0))
+    assert track.billboard_hit(Car(x=51.0, y=49.0))
+    assert not track.obstacles
+
+
+def test_list_changes_are_picked_up():
+    track = Track()
+    car = Car(x=30.0, y=30.0)
+    assert not track.in_puddle(car)
+    track.puddles.append(Puddle(x=30.0, y=30.0, radius=2.0))
+    assert track.in_puddle(car)
+    track.puddles[0].x = 80.0
+    track.rebuild_hazards()
+    assert not track.in_puddle(car)
+
+
+def test_large_hazards_always_candidates():
+    grid = HazardGrid([(0.0, 0.0, 1.0, 1.0), (-1e6, -1e6, 1e6, 1e6)], cell_size=1.0)
+    assert list(grid.query(0.5, 0.5)) == [0, 1]
+    assert list(grid.query(500.0, -500.0)) == [1]
+    assert grid.query_many(np.array([0.5, 9.0]), np.array([0.5, 9.0])) == [0, 1]
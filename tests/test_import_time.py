@@ -0,0 +1,43 @@
+import subprocess
+import sys
+from pathlib import Path
+
+BENCH = Path(__file__).resolve().parents[1] / "tools" / "bench_import_time.py"
+
+
+def _bench(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, str(BENCH), "--runs", "1", *args],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        timeout=60,
+    )
+
+
+def test_package_import_is_lazy() -> None:
+    result = _bench(
+        "--budget-ms", "100",
+        "--forbid", "numpy",
+        "--forbid", "pygame",
+        "--forbid", "super_pole_position.envs.pole_position",
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+
+
+def test_env_import_skips_pygame_and_ui() -> None:
+    result = _bench(
+        "--module", "super_pole_position.envs.pole_position",
+        "--budget-ms", "1000",
+        "--forbid", "pygame",
+        "--forbid", "super_pole_position.ui.arcade",
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+
+
+def test_lazy_attributes_resolve() -> None:
+    import super_pole_position as spp
+    from super_pole_position.envs.pole_position import PolePositionEnv
+
+    assert spp.PolePositionEnv is PolePositionEnv
+    assert "PolePositionEnv" in dir(spp)
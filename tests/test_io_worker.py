@@ -0,0 +1,91 @@
+import threading
+import time
+
+from super_pole_position.envs.pole_position import PolePositionEnv
+from super_pole_position.evaluation import batching, logger as bench_logger
+from super_pole_position.io_worker import IOWorker
+
+
+def test_jobs_run_in_order_and_flush():
+    worker = IOWorker()
+    seen = []
+    for i in range(50):
+        assert worker.submit(seen.append, i)
+    assert worker.flush(timeout=5)
+    assert seen == list(range(50))
+    assert worker.stats()["completed"] == 50 and worker.stats()["pending"] == 0
+    assert worker.close(timeout=5)
+    assert worker._thread is None
+
+
+def test_full_queue_drops_and_counts():
+    worker = IOWorker(maxsize=2)
+    gate = threading.Event()
+    started = threading.Event()
+
+    def block():
+        started.set()
+        gate.wait(5)
+
+    worker.submit(block)
+    started.wait(5)
+    results = [worker.submit(lambda: None) for _ in range(4)]
+    assert results == [True, True, False, False]
+    assert worker.dropped == 2
+    gate.set()
+    assert worker.close(timeout=5)
+
+
+def test_close_honours_timeout_with_full_queue():
+    worker = IOWorker(maxsize=2)
+    gate = threading.Event()
+    started = threading.Event()
+
+    def block():
+        started.set()
+        gate.wait(5)
+
+    worker.submit(block)
+    started.wait(5)
+    assert worker.submit(lambda: None) and worker.submit(lambda: None)
+    thread = worker._thread
+    start = time.monotonic()
+    assert not worker.close(timeout=0.2)
+    assert time.monotonic() - start < 1.0
+    # The stuck thread exits after its batch, leaving the queued jobs
+    gate.set()
+    thread.join(5)
+    assert not thread.is_alive() and worker.completed == 1
+    # The next submission starts a fresh thread that drains them
+    worker.submit(lambda: None)
+    assert worker.close(timeout=5) and worker.completed >= 3
+
+
+def test_failed_jobs_are_counted():
+    worker = IOWorker(sync=True)
+    worker.submit(lambda: 1 / 0)
+    assert worker.stats()["failed"] == 1
+
+
+def test_slow_submission_does_not_block_step(monkeypatch, tmp_path):
+    worker = IOWorker()
+    sent = []
+
+    def slow_submit(entries, host, port):
+        time.sleep(0.3)
+        sent.extend(entries)
+
+    monkeypatch.setattr(batching, "submit_scores_http", slow_submit)
+    monkeypatch.setattr(bench_logger, "BENCH_ROOT", tmp_path)
+    env = PolePositionEnv(render_mode="human")
+    env._io = worker
+    env._batcher = batching.SubmissionBatcher(max_batch=1, worker=worker)
+    env.reset(seed=0)
+    env.remaining_time = 0
+    start = time.perf_counter()
+    _, _, done, _, _ = env.step((0, 0, 0.0))
+    assert done and time.perf_counter() - start < 0.3
+    env.close()
+    assert sent == [("PLAYER", int(env.score))]
+    assert list(tmp_path.rglob("*.json"))
+    worker.close(timeout=5)
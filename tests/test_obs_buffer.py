@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the preallocated observation buffers."""
+
+import numpy as np
+
+from super_pole_position.envs.pole_position import PolePositionEnv
+from super_pole_position.envs.vector_env import VectorPolePositionEnv, _k_smallest
+
+
+def test_copy_obs_flag_controls_aliasing():
+    env = PolePositionEnv(render_mode=None)
+    first, _ = env.reset(seed=0)
+    second, *_ = env.step((1.0, 0.0, 0.0))
+    assert first is not second and first.dtype == np.float32
+    assert not np.shares_memory(second, env._obs)
+    np.testing.assert_array_equal(second, env._obs)
+
+    env.copy_obs = False
+    view, *_ = env.step((1.0, 0.0, 0.0))
+    obs, *_ = env.step((1.0, 0.0, 0.0))
+    assert obs is view
+    assert obs[0] == np.float32(env.cars[0].x)
+
+
+def test_experience_does_not_alias_obs_buffer():
+    env = PolePositionEnv(render_mode="human", seed=0, copy_obs=False)
+    env.reset(seed=0)
+    seen = []
+    for _ in range(3):
+        obs, *_ = env.step((1.0, 0.0, 0.0))
+        seen.append(obs.copy())
+    buffer = env.learning_agent.buffer
+    assert len(buffer) == 3
+    for row, expected in zip(buffer, seen):
+        assert not np.shares_memory(row["obs"], env._obs)
+        np.testing.assert_array_equal(row["obs"], expected)
+    np.testing.assert_array_equal(buffer[1]["prev_obs"], seen[0])
+    env.close()
+
+
+def test_vector_copy_obs_flag():
+    env = VectorPolePositionEnv(num_envs=3, seed=1, copy_obs=False)
+    obs, _ = env.reset(seed=1)
+    nxt, *_ = env.step(np.zeros((3, 4)))
+    assert nxt is obs
+    ref = VectorPolePositionEnv(num_envs=3, seed=1)
+    ref.reset(seed=1)
+    expected, *_ = ref.step(np.zeros((3, 4)))
+    np.testing.assert_array_equal(nxt, expected)
+
+
+def test_k_smallest_matches_stable_argsort():
+    rng = np.random.default_rng(0)
+    dist = rng.integers(0, 4, size=(50, 9)).astype(float)
+    for k in (0, 1, 5, 9, 12):
+        expected = np.argsort(dist, axis=1, kind="stable")[:, :k]
+        np.testing.assert_array_equal(_k_smallest(dist, k), expected)
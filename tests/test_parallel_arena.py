@@ -0,0 +1,63 @@
+"""Tests for the multiprocess ParallelArena runner."""
+
+import numpy as np
+import pytest
+
+from super_pole_position.agents.base_llm_agent import NullAgent
+from super_pole_position.envs.pole_position import PolePositionEnv
+from super_pole_position.matchmaking.arena import (
+    EpisodeSpec,
+    ParallelArena,
+    run_episode,
+)
+
+
+def test_parallel_arena_matches_serial_runs():
+    specs = [
+        EpisodeSpec(seed=1),
+        EpisodeSpec(seed=2, track_name="fuji"),
+        EpisodeSpec(seed=3, agent="null"),
+    ]
+    arena = ParallelArena(processes=2)
+    results = arena.run(specs)
+    assert [r["seed"] for r in results] == [1, 2, 3]
+
+    for spec, result, obs, rewards in zip(
+        specs, results, arena.observations, arena.rewards
+    ):
+        env = PolePositionEnv(render_mode=None, track_name=spec.track_name, seed=spec.seed)
+        seen = []
+        total = run_episode(
+            env, (NullAgent(), NullAgent()), seed=spec.seed,
+            on_step=lambda o, r: seen.append((o, r)),
+        )
+        assert result["reward"] == pytest.approx(total)
+        assert result["steps"] == len(seen) == len(rewards)
+        np.testing.assert_allclose(rewards, [r for _, r in seen], rtol=1e-6)
+        np.testing.assert_array_equal(obs[-1], seen[-1][0])
+
+
+def test_parallel_arena_ring_keeps_latest_steps():
+    arena = ParallelArena(processes=1, ring_size=2)
+    (result,) = arena.run([EpisodeSpec(seed=0)])
+    assert result["steps"] > 2
+    env = PolePositionEnv(render_mode=None, seed=0)
+    assert arena.obs_dim == env.observation_space.shape[0]
+    seen = []
+    run_episode(env, (NullAgent(), NullAgent()), seed=0,
+                on_step=lambda o, r: seen.append(o))
+    np.testing.assert_array_equal(arena.observations[0], np.array(seen[-2:]))
+    assert arena.run([]) == []
+
+
+class _FullThrottle(NullAgent):
+    def act(self, observation):
+        return {"throttle": 1, "brake": 0, "steer": 0.0}
+
+
+def test_parallel_arena_reports_episode_reward():
+    (result,) = ParallelArena(processes=1).run([EpisodeSpec(seed=4, agent=_FullThrottle)])
+    env = PolePositionEnv(render_mode=None, seed=4)
+    total = run_episode(env, (_FullThrottle(), _FullThrottle()), seed=4)
+    assert total > 0.0 and result["reward"] == pytest.approx(total)
+    assert not {"avg_plan_ms", "avg_step_ms", "tokens"} & result.keys()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the shared, memoized parity config."""
+
+import os
+
+import pytest
+
+from super_pole_position import config
+from super_pole_position.config import get_parity_config, load_parity_config
+from super_pole_position.envs.pole_position import PolePositionEnv
+from super_pole_position.physics.track import Track
+
+
+@pytest.fixture
+def parity_file(tmp_path, monkeypatch):
+    path = tmp_path / "config.arcade_parity.yaml"
+    path.write_text("puddle:\n  speed_factor: 0.5\nturn_rate: 3.0\n")
+    monkeypatch.setattr(config, "CONFIG_PATH", path)
+    yield path
+    monkeypatch.undo()
+    get_parity_config().reload()
+
+
+def test_shared_instance_and_typed_values(parity_file):
+    cfg = get_parity_config()
+    assert cfg is get_parity_config()
+    assert cfg.puddle_speed_factor == 0.5
+    assert cfg.puddle_angle_jitter == 0.2
+    assert cfg.turn_rate == 3.0
+    assert Track.get_puddle_factor() == 0.5
+    assert load_parity_config()["puddle"]["speed_factor"] == 0.5
+
+
+def test_mtime_invalidation(parity_file):
+    cfg = get_parity_config()
+    assert cfg.refresh() is False
+    parity_file.write_text("puddle:\n  speed_factor: 0.3\n")
+    stat = parity_file.stat()
+    os.utime(parity_file, (stat.st_atime, stat.st_mtime + 5))
+    assert get_parity_config().puddle_speed_factor == 0.3
+    assert cfg.turn_rate == 2.5
+
+
+def test_invalid_values_fall_back_to_defaults(parity_file):
+    parity_file.write_text("audio_volume: loud\n")
+    cfg = get_parity_config().reload()
+    assert cfg.audio_volume == 0.8
+    assert load_parity_config()["audio_volume"] == 0.8
+
+
+def test_step_does_not_read_config(monkeypatch):
+    env = PolePositionEnv(render_mode=None)
+    env.reset(seed=0)
+
+    def _fail(*_a, **_k):
+        raise AssertionError("config read during step()")
+
+    monkeypatch.setattr(config, "_read_parity_file", _fail)
+    monkeypatch.setattr(config, "_mtime", _fail)
+    for _ in range(20):
+        env.step((1.0, 0.0, 0.0))
+    env.close()
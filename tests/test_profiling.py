@@ -0,0 +1,51 @@
+import json
+
+import pytest
+
+from super_pole_position.envs.pole_position import PolePositionEnv
+from super_pole_position.profiling import PHASES, FrameProfiler
+
+
+def test_ring_buffer_is_bounded():
+    prof = FrameProfiler(capacity=4)
+    for i in range(10):
+        prof.start()
+        prof.add("physics", i / 1000)
+        perf = prof.end_frame()
+    assert perf["physics"] == pytest.approx(9.0)
+    assert prof.count == 4
+    assert prof.samples()[:, 0] * 1000 == pytest.approx([6, 7, 8, 9])
+    pct = prof.percentiles()
+    assert pct["physics"]["p50"] == pytest.approx(7.5)
+    assert pct["total"]["p99"] >= pct["physics"]["p99"]
+
+
+def test_env_reports_perf(tmp_path):
+    env = PolePositionEnv(render_mode=None, profile=True)
+    env.reset(seed=0)
+    for _ in range(5):
+        _, _, _, _, info = env.step({"throttle": 1.0, "brake": 0.0, "steer": 0.0})
+    assert set(PHASES) < set(info["perf"])
+    assert info["perf"]["total"] >= info["perf"]["physics"] >= 0.0
+    assert env.profiler.count == 5
+    data = json.loads(env.profiler.dump(tmp_path / "perf.json").read_text())
+    assert data["frames"] == 5 and "p95" in data["percentiles_ms"]["planning"]
+    assert "p99" in env.profiler.summary()
+
+
+def test_profiling_is_opt_in():
+    env = PolePositionEnv(render_mode=None)
+    env.reset(seed=0)
+    _, _, _, _, info = env.step(2)
+    assert env.profiler is None and "perf" not in info
+
+
+def test_frame_bookkeeping_has_its_own_phase():
+    env = PolePositionEnv(render_mode=None, profile=True)
+    env.reset(seed=0)
+    laps = []
+    lap = env.profiler.lap
+    env.profiler.lap = lambda phase: (laps.append(phase), lap(phase))
+    env.step({"throttle": 1.0, "brake": 0.0, "steer": 0.0})
+    assert laps.count("timers") == 1
+    assert laps.index("timers") < laps.index("collisions")
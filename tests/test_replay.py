@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for action trace recording and replay."""
+
+import numpy as np
+import pytest
+
+from super_pole_position.envs.pole_position import PolePositionEnv
+from super_pole_position.replay import ReplayError, Trace, replay, state_hash
+
+
+def _record(seed: int = 7):
+    env = PolePositionEnv(render_mode=None, seed=seed)
+    env.start_recording(checkpoint_every=5)
+    env.reset(seed=seed)
+    rng = np.random.default_rng(seed)
+    done = False
+    obs = None
+    while not done:
+        action = (rng.random(), rng.random() * 0.2, rng.uniform(-1, 1), 0)
+        obs, _, done, _, _ = env.step(action)
+    return env, env.stop_recording(), obs
+
+
+def test_record_replay_roundtrip(tmp_path):
+    env, trace, obs = _record()
+    assert len(trace) == env.current_step
+    assert trace.checkpoints["hash"][-1] == state_hash(env)
+    path = trace.save(tmp_path / "ep.trace")
+    loaded = Trace.load(path)
+    assert loaded.header == trace.header
+    seen = []
+    replayed = replay(loaded, on_step=lambda e, result: seen.append(result[0]))
+    assert replayed.current_step == env.current_step
+    np.testing.assert_array_equal(seen[-1], obs)
+
+
+def test_replay_detects_divergence():
+    _, trace, _ = _record()
+    step = int(trace.checkpoints["step"][1])
+    trace.checkpoints["hash"][1] ^= 1
+    with pytest.raises(ReplayError, match=f"before step {step}$"):
+        replay(trace)
+
+
+def test_reset_without_seed_is_replayable():
+    env = PolePositionEnv(render_mode=None, seed=3)
+    recorder = env.start_recording()
+    env.reset()
+    for _ in range(4):
+        env.step(0)
+    env.reset()
+    assert len(recorder.traces) == 1
+    trace = recorder.traces[0]
+    assert len(trace) == 4 and isinstance(trace.seed, int)
+    replay(trace)
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"frame_skip": 4}, {"fixed_dt": 0.05}])
+def test_later_episodes_replay_without_snapshot(kwargs):
+    env = PolePositionEnv(render_mode=None, seed=5, **kwargs)
+    recorder = env.start_recording(checkpoint_every=5)
+    rng = np.random.default_rng(5)
+    for seed in (5, 6, 5):
+        env.reset(seed=seed)
+        done = False
+        while not done:
+            gear = int(rng.integers(-1, 2))
+            action = (rng.random(), rng.random() * 0.2, rng.uniform(-1, 1), gear)
+            _, _, done, _, _ = env.step(action)
+    env.reset(seed=5)
+    assert len(recorder.traces) == 3
+    for trace in recorder.traces:
+        assert trace.state is None
+        replay(trace)
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the shared resource pool."""
+
+import threading
+
+import pytest
+
+from super_pole_position.envs.pole_position import PolePositionEnv
+from super_pole_position.resources import POOL, ResourceHandles, ResourcePool
+
+pygame = pytest.importorskip("pygame")
+
+
+def test_pool_refcounts_and_loads_once():
+    pool = ResourcePool()
+    loads = []
+    a, b = ResourceHandles(pool), ResourceHandles(pool)
+    first = a.get("k", lambda: loads.append(1) or object())
+    assert b.get("k", lambda: loads.append(1) or object()) is first
+    assert loads == [1] and pool.refcount("k") == 2
+    a.release()
+    assert pool.refcount("k") == 1
+    b.release()
+    b.release()
+    assert len(pool) == 0
+
+
+def test_pool_reads_take_the_lock():
+    pool = ResourcePool()
+    pool.acquire(("sound", "a"), object)
+    seen = []
+
+    def read():
+        seen.append(pool.refcount(("sound", "a")))
+        seen.append(len(pool))
+        seen.append(pool.in_use("sound"))
+
+    reader = threading.Thread(target=read)
+    with pool._lock:
+        reader.start()
+        reader.join(0.1)
+        # Blocked until the writer lets go of the lock
+        assert reader.is_alive() and not seen
+    reader.join(5.0)
+    assert seen == [1, 1, True]
+
+
+def test_envs_share_sounds():
+    env1 = PolePositionEnv(render_mode="human")
+    env2 = PolePositionEnv(render_mode="human")
+    assert env1.crash_wave is env2.crash_wave
+    key = next(k for k in env1._resources._keys if k[1] == "crash.wav")
+    held = POOL.refcount(key)
+    assert held >= 2
+    env1.close()
+    assert POOL.refcount(key) == held - 1
+    env2.close()
+    assert POOL.refcount(key) == held - 2
+
+
+def test_renderers_share_sprites():
+    from super_pole_position.ui.arcade import Pseudo3DRenderer
+
+    pygame.display.init()
+    screen = pygame.display.set_mode((64, 64))
+    key = ("sprite", "player_car.png")
+    before = POOL.refcount(key)
+    r1 = Pseudo3DRenderer(screen)
+    r2 = Pseudo3DRenderer(screen)
+    assert POOL.refcount(key) == before + 2
+    assert r1.mt_fuji is r2.mt_fuji
+    r1.close()
+    r2.close()
+    assert POOL.refcount(key) == before
+    pygame.display.quit()
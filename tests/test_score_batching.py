@@ -0,0 +1,92 @@
+import importlib
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from super_pole_position.evaluation import lap_times, scores
+from super_pole_position.evaluation.batching import SubmissionBatcher
+from super_pole_position.io_worker import IOWorker
+
+
+def test_merge_scores_reads_and_writes_once(tmp_path, monkeypatch):
+    path = tmp_path / "scores.json"
+    writes = []
+    original = Path.write_text
+
+    def counting_write(self, *args, **kwargs):
+        writes.append(self)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "write_text", counting_write)
+    scores.merge_scores(path, [(f"p{i}", i) for i in range(50)])
+    lap_times.merge_lap_times(tmp_path / "laps.json", [("a", 3), ("b", 1)])
+    assert len(writes) == 2
+    top = scores.load_scores(path)
+    assert [s["score"] for s in top] == list(range(49, 39, -1))
+    assert [e["name"] for e in lap_times.load_lap_times(tmp_path / "laps.json")] == ["b", "a"]
+
+
+def test_batcher_coalesces_entries(monkeypatch):
+    from super_pole_position.evaluation import batching
+
+    calls = []
+    monkeypatch.setattr(batching, "submit_scores_http", lambda e, h, p: calls.append(("s", e)))
+    monkeypatch.setattr(batching, "submit_lap_times_http", lambda e, h, p: calls.append(("l", e)))
+    batcher = SubmissionBatcher(max_batch=3, max_delay=60, worker=IOWorker(sync=True))
+    batcher.add_score("a", 1)
+    batcher.add_lap("a", 900)
+    assert calls == [] and batcher.pending() == 2
+    batcher.add_score("b", 2)
+    assert calls == [("s", [("a", 1), ("b", 2)]), ("l", [("a", 900)])]
+    batcher.add_score("c", 3)
+    batcher.flush()
+    assert calls[-1] == ("s", [("c", 3)]) and batcher.pending() == 0
+
+
+def test_batcher_sends_lone_entry_after_max_delay(monkeypatch):
+    from super_pole_position.evaluation import batching
+
+    sent = threading.Event()
+    calls = []
+
+    def submit(entries, host, port):
+        calls.append(entries)
+        sent.set()
+
+    monkeypatch.setattr(batching, "submit_scores_http", submit)
+    batcher = SubmissionBatcher(max_delay=0.05, worker=IOWorker(sync=True))
+    batcher.add_score("solo", 7)
+    assert sent.wait(5.0)
+    assert calls == [[("solo", 7)]] and batcher.pending() == 0
+    batcher.flush()
+    assert calls == [[("solo", 7)]]
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("fastapi") is None, reason="fastapi not installed"
+)
+def test_batch_endpoints(tmp_path, monkeypatch):
+    monkeypatch.setenv("SPP_SCORES", str(tmp_path / "scores.json"))
+    monkeypatch.setenv("SPP_LAPS", str(tmp_path / "laps.json"))
+    from super_pole_position.server import api
+
+    importlib.reload(api)
+    from fastapi.testclient import TestClient
+
+    client = TestClient(api.build_app())
+    resp = client.post(
+        "/scores/batch", json=[{"name": "a", "score": 5}, {"name": "b", "score": 7}]
+    )
+    assert resp.status_code == 200 and resp.json()["count"] == 2
+    resp = client.post("/laps/batch", json=[{"name": "a", "lap_ms": 42000}])
+    assert resp.status_code == 200
+    client.app.state.scores.flush()
+    data = json.loads((tmp_path / "scores.json").read_text())
+    assert [s["name"] for s in data["scores"]] == ["b", "a"]
+    assert client.get("/laps").json()["laps"][0]["lap_ms"] == 42000
+    monkeypatch.setattr(api, "MAX_BATCH", 1)
+    resp = client.post(
+        "/scores/batch", json=[{"name": "a", "score": 5}, {"name": "b", "score": 7}]
+    )
+    assert resp.status_code == 413
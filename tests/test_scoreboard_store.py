@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the in-memory scoreboard store."""
+
+import json
+import sys
+import threading
+from pathlib import Path
+
+BASE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BASE))
+
+from super_pole_position.server.store import Board, ScoreboardStore
+
+
+def test_board_keeps_top_entries_in_order():
+    board = Board("score", limit=3)
+    for name, score in [("a", 5), ("b", 9), ("c", 5), ("d", 1), ("e", 7)]:
+        board.add({"name": name, "score": score})
+    assert [e["name"] for e in board.entries] == ["b", "e", "a"]
+    laps = Board("lap_ms", limit=2, descending=False)
+    laps.extend([{"lap_ms": 900}, {"lap_ms": 800}, {"lap_ms": 950}])
+    assert [e["lap_ms"] for e in laps.entries] == [800, 900]
+
+
+def test_write_behind_flush(tmp_path):
+    path = tmp_path / "scores.json"
+    store = ScoreboardStore(path, "scores", "score", flush_interval=60)
+    store.add({"name": "a", "score": 3})
+    store.add_many([{"name": "b", "score": 8}])
+    assert [e["name"] for e in store.entries()] == ["b", "a"]
+    assert not path.exists()
+    store.flush()
+    data = json.loads(path.read_text())
+    assert [e["name"] for e in data["scores"]] == ["b", "a"]
+    assert not list(tmp_path.glob(".*.tmp"))  # no stray temp files
+
+
+def test_two_writers_do_not_lose_entries(tmp_path):
+    path = tmp_path / "scores.json"
+    one = ScoreboardStore(path, "scores", "score", flush_interval=60)
+    two = ScoreboardStore(path, "scores", "score", flush_interval=60)
+    one.add({"name": "one", "score": 1})
+    two.add({"name": "two", "score": 2})
+    one.flush()
+    two.flush()
+    names = [e["name"] for e in json.loads(path.read_text())["scores"]]
+    assert names == ["two", "one"]
+    # A reader notices the other writer's file on its next check
+    one.reload_interval = 0
+    assert [e["name"] for e in one.entries()] == ["two", "one"]
+
+
+def test_concurrent_adds(tmp_path):
+    store = ScoreboardStore(
+        tmp_path / "scores.json", "scores", "score", limit=50, flush_interval=0.01
+    )
+
+    def worker(base: int) -> None:
+        for i in range(10):
+            store.add({"name": f"t{base}", "score": base * 10 + i})
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    store.flush()
+    data = json.loads((tmp_path / "scores.json").read_text())["scores"]
+    assert [e["score"] for e in data] == list(range(49, -1, -1))
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for env state snapshots and clones."""
+
+import random
+
+import numpy as np
+
+from super_pole_position.envs.pole_position import PolePositionEnv
+from super_pole_position.physics.car import Car
+from super_pole_position.physics.track import Obstacle, Track
+from super_pole_position.replay import replay
+
+
+def _rollout(env, steps=20):
+    out = []
+    for i in range(steps):
+        obs, reward, done, _, _ = env.step((1.0, 0.0, np.sin(i / 3), 0))
+        out.append(np.append(obs, reward))
+        if done:
+            break
+    return np.array(out)
+
+
+def _env(seed=5):
+    env = PolePositionEnv(render_mode=None, seed=seed)
+    env.reset(seed=seed)
+    for _ in range(5):
+        env.step((1.0, 0.0, 0.2, 1))
+    return env
+
+
+def test_set_state_rewinds_simulation():
+    env = _env()
+    state = env.get_state()
+    assert state.dtype == np.float64 and state.ndim == 1
+    first = _rollout(env)
+    env.set_state(state)
+    np.testing.assert_array_equal(_rollout(env), first)
+    env.set_state(state)
+    np.testing.assert_array_equal(env.get_state(), state)
+
+
+def test_state_covers_rngs_and_obstacles():
+    env = _env()
+    env.track.obstacles = [Obstacle(60.0, 100.0, 2.0, 2.0, billboard=True)]
+    track_hash = env.track.track_hash
+    state = env.get_state()
+    expected = (random.random(), np.random.random(), env.rng.random())
+    del env.track.obstacles[0]
+    env.set_state(state)
+    assert env.track.track_hash == track_hash
+    assert (random.random(), np.random.random(), env.rng.random()) == expected
+
+
+def test_clone_is_independent():
+    env = _env()
+    state = env.get_state()
+    twin = env.clone()
+    assert twin.training and twin.screen is None
+    branch = _rollout(twin)
+    np.testing.assert_array_equal(env.get_state(), state)
+    np.testing.assert_array_equal(_rollout(env), branch)
+
+
+def test_snapshot_traces_replay_later_episodes():
+    env = PolePositionEnv(render_mode=None, seed=2)
+    recorder = env.start_recording(snapshot=True)
+    for seed in (11, 12):
+        env.reset(seed=seed)
+        _rollout(env, 15)
+    trace = env.stop_recording()
+    assert len(recorder.traces) == 2 and trace.state is not None
+    replay(trace)
+
+
+def test_reset_matches_a_fresh_env():
+    envs = []
+    for _ in range(2):
+        env = PolePositionEnv(render_mode=None, seed=9)
+        env.track = Track(200.0, 200.0, obstacles=[Obstacle(60.0, 100.0, 2.0, 2.0, billboard=True)])
+        envs.append(env)
+    used, fresh = envs
+    used.reset(seed=3)
+    _rollout(used)
+    assert used.track.billboard_hit(Car(x=60.0, y=100.0))
+    used.traffic[0].state = "BLOCK"
+    for env in envs:
+        env.reset(seed=9)
+        env.step((1.0, 0.0, 0.0, 0))
+    np.testing.assert_array_equal(used.get_state(), fresh.get_state())
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from super_pole_position.agents.controllers import LearningAgent
+from super_pole_position.envs.pole_position import PolePositionEnv
+from super_pole_position.telemetry import STEP_DTYPE, RingBuffer
+
+
+def test_ring_drops_oldest():
+    buf = RingBuffer(np.float64, capacity=3)
+    for v in range(5):
+        buf.append(v)
+    assert len(buf) == 3 and buf.dropped == 2
+    assert list(buf) == [2, 3, 4] and buf[-1] == 4 and buf[0] == 2
+    head, tail = buf.segments()
+    assert np.shares_memory(head, buf._data) and np.shares_memory(tail, buf._data)
+    assert buf.view().tolist() == [2.0, 3.0, 4.0]
+    with pytest.raises(IndexError):
+        buf[3]
+
+
+def test_view_is_zero_copy_until_wrap():
+    buf = RingBuffer(STEP_DTYPE, capacity=4)
+    buf.append((1, 0.5, 0, 0, 0, 0, 0, 0.1, 9.0, 1))
+    view = buf.view()
+    assert np.shares_memory(view, buf._data)
+    assert view["car0_x"][0] == 0.5
+    assert buf.to_dicts()[0]["lap"] == 1
+
+
+def test_ring_spills_to_disk(tmp_path):
+    buf = RingBuffer(np.int32, capacity=2, overflow="spill", spill_dir=tmp_path)
+    for v in range(5):
+        buf.append(v)
+    assert list(buf) == [4]
+    chunks = [np.load(p).tolist() for p in buf.spill_files]
+    assert chunks == [[0, 1], [2, 3]]
+
+
+def test_env_telemetry_is_bounded():
+    env = PolePositionEnv(render_mode="human", telemetry_capacity=8)
+    env.reset(seed=0)
+    for _ in range(20):
+        env.step((1.0, 0.0, 0.0))
+    assert len(env.step_log) == len(env.step_durations) == 8
+    assert env.step_log[-1]["step"] == env.current_step
+    buf = env.learning_agent.buffer
+    assert len(buf) == 8 and buf.view()["action"][-1].tolist() == [1, 0, 0, 0]
+    env.close()
+
+
+def test_learning_agent_tracks_average():
+    agent = LearningAgent(capacity=2)
+    obs = np.zeros(3)
+    agent.update_on_experience([(obs, 0, 1.0, obs), (obs, 2, 2.0, obs), (obs, 1, 3.0, obs)])
+    assert len(agent.buffer) == 2
+    assert agent.avg_reward == pytest.approx(2.0)
+    assert agent.buffer.view()["action"][-1].tolist() == [0, 1, 0, 0]
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for Track lookup tables."""
+
+import math
+
+import numpy as np
+import pytest
+
+from super_pole_position.physics.car import Car
+from super_pole_position.physics.track import Obstacle, Track
+from super_pole_position.physics.track_curve import TrackCurve
+
+
+def _away_from_joints(track, xs, margin):
+    n = len(track.segments) - 1
+    joints = np.arange(n + 1) * track.width / n
+    dist = np.abs((xs % track.width)[:, None] - joints[None, :]).min(axis=1)
+    return xs[dist > margin]
+
+
+def test_lut_nearest_matches_exact_at_bin_centres():
+    track = Track.load("snow_mountain")
+    lut = track.lut(resolution=0.5)
+    xs = (np.arange(len(lut.y)) + 0.5) * lut.step
+    assert np.array_equal(lut.y_at(xs), [track.y_at(x) for x in xs])
+    assert np.array_equal(lut.angle_at(xs), [track.angle_at(x) for x in xs])
+    assert lut.y_at(xs[3] + track.width) == track.y_at(xs[3])
+    assert isinstance(lut.curvature_at(1.0), float)
+
+
+@pytest.mark.parametrize("name", ["fuji", "snow_mountain"])
+def test_lut_interpolation_within_tolerance(name):
+    track = Track.load(name)
+    lut = track.lut(resolution=0.25, interpolate=True)
+    rng = np.random.default_rng(0)
+    xs = _away_from_joints(track, rng.uniform(-50.0, 3 * track.width, 2000), 0.5)
+    exact_y = np.array([track.y_at(x) for x in xs])
+    exact_angle = np.array([track.angle_at(x) for x in xs])
+    np.testing.assert_allclose(lut.y_at(xs), exact_y, atol=1e-6)
+    err = (lut.angle_at(xs) - exact_angle + math.pi) % (2 * math.pi) - math.pi
+    assert np.abs(err).max() < 1e-6
+
+
+def test_lut_on_curve_track():
+    curve = TrackCurve.from_tuples([(0.0, 0.0, 0.01, 120.0)])
+    track = Track(width=200.0, height=200.0, curve=curve)
+    lut = track.lut(resolution=1.0)
+    xs = (np.arange(len(lut.y)) + 0.5) * lut.step
+    assert np.array_equal(lut.y_at(xs), [track.y_at(x) for x in xs])
+    assert lut.y_at(-5.0) == lut.y[0]
+    assert lut.y_at(500.0) == lut.y[-1]
+    assert lut.curvature_at(10.0) == pytest.approx(0.01)
+
+
+def test_lut_cached_by_track_hash():
+    track = Track.load("fuji")
+    track.obstacles.append(Obstacle(x=10.0, y=10.0, width=2.0, height=2.0, billboard=True))
+    track._hash = track._compute_hash()
+    lut = track.lut()
+    assert track.lut() is lut
+    assert track.lut(interpolate=True) is not lut
+    assert track.billboard_hit(Car(x=10.0, y=10.0))
+    assert track.lut() is not lut
+    with pytest.raises(ValueError):
+        track.lut(resolution=0.0)
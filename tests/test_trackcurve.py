@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 """Tests for TrackCurve helper."""
 
+import numpy as np
 import pytest
 
 from super_pole_position.physics.track_curve import TrackCurve
@@ -27,3 +28,21 @@ def test_curve_in_track_on_road():
     assert track.on_road(car)
     car.y = 2.1
     assert not track.on_road(car)
+
+
+def test_batched_sampling_matches_scalar():
+    curve = TrackCurve.from_tuples(
+        [(0.0, 0.0, 0.0, 20.0), (20.0, 0.0, 0.1, 15.5), (30.0, 10.0, -0.05, 12.0)]
+    )
+    assert curve.points.shape == (len(curve._points), 2)
+    assert curve.lengths.shape == (len(curve._points),)
+    assert curve.tangents.shape == curve.normals.shape == (len(curve._points) - 1, 2)
+    s = np.linspace(-2.0, curve.total_length + 2.0, 97)
+    pts = curve.points_at(s)
+    tangents = curve.tangents_at(s)
+    normals = curve.normals_at(s)
+    for i, si in enumerate(s):
+        assert tuple(pts[i]) == curve.point_at(si)
+        assert tuple(tangents[i]) == curve.tangent_at(si)
+        assert tuple(normals[i]) == curve.normal_at(si)
+    assert curve.points_at(s.reshape(1, -1)).shape == (1, 97, 2)
@@ -0,0 +1,56 @@
+"""Tests for the headless training mode of PolePositionEnv."""
+
+import numpy as np
+import pytest
+
+from super_pole_position.envs.pole_position import PolePositionEnv
+
+
+def test_training_mode_skips_side_effects(monkeypatch, capsys):
+    def fail(*_a, **_k):
+        raise AssertionError("training env must not load audio")
+
+    monkeypatch.setattr(PolePositionEnv, "_load_audio_assets", fail)
+    env = PolePositionEnv(render_mode=None)
+    assert env.training
+    assert env.crash_wave is None and env.bgm_wave is None
+    env.reset(seed=1)
+    done = False
+    while not done:
+        _, _, done, _, info = env.step((1, 0, 0.0))
+        assert info["track_hash"] == env.track.track_hash
+    env.close()
+    assert len(env.step_log) == 0
+    assert len(env.step_durations) == 0
+    assert len(env.learning_agent.buffer) == 0
+    assert "[ENV]" not in capsys.readouterr().out
+
+
+def test_training_mode_matches_default_dynamics():
+    seed = 5
+    fast = PolePositionEnv(render_mode="human", training=True, seed=seed)
+    slow = PolePositionEnv(render_mode="human", seed=seed)
+    obs_fast, _ = fast.reset(seed=seed)
+    obs_slow, _ = slow.reset(seed=seed)
+    rng = np.random.default_rng(0)
+    for _ in range(40):
+        action = (rng.random() < 0.8, rng.random() < 0.1, rng.uniform(-1, 1))
+        obs_fast, r_fast, d_fast, _, _ = fast.step(action)
+        obs_slow, r_slow, d_slow, _, _ = slow.step(action)
+        assert np.array_equal(obs_fast, obs_slow)
+        assert r_fast == r_slow and d_fast == d_slow
+        if d_fast:
+            break
+    assert fast.score == slow.score
+    fast.close()
+    slow.close()
+
+
+def test_training_mode_close_tears_down_window():
+    env = PolePositionEnv(render_mode="human", training=True, seed=1)
+    env.reset(seed=1)
+    env.render()
+    if env.screen is None:
+        pytest.skip("pygame display unavailable")
+    env.close()
+    assert env.screen is None and env.renderer is None
@@ -0,0 +1,60 @@
+"""Tests for the batched VectorPolePositionEnv."""
+
+import numpy as np
+import pytest
+
+from super_pole_position.envs.pole_position import PolePositionEnv
+from super_pole_position.envs.vector_env import VectorPolePositionEnv
+
+
+@pytest.mark.parametrize("track", [None, "fuji_namco", "snow_mountain"])
+def test_vector_matches_single_env(track):
+    seed = 3
+    venv = VectorPolePositionEnv(num_envs=2, track_name=track)
+    vobs, _ = venv.reset(seed=seed)
+    envs = []
+    for i in range(2):
+        env = PolePositionEnv(render_mode="human", track_name=track, seed=seed + i)
+        obs, _ = env.reset(seed=seed + i)
+        assert np.array_equal(obs, vobs[i])
+        envs.append(env)
+
+    rng = np.random.default_rng(0)
+    for _ in range(30):
+        actions = np.column_stack(
+            [rng.random(2) < 0.8, rng.random(2) < 0.1, rng.uniform(-1, 1, 2)]
+        ).astype(float)
+        vobs, vrew, vdone, _, info = venv.step(actions)
+        for i, env in enumerate(envs):
+            obs, reward, done, _, _ = env.step(tuple(actions[i]))
+            expected = info["final_observation"][i] if vdone[i] else vobs[i]
+            np.testing.assert_allclose(obs, expected, rtol=1e-6, atol=1e-6)
+            assert reward == pytest.approx(vrew[i])
+            assert done == vdone[i]
+        if vdone.any():
+            break
+    for env in envs:
+        env.close()
+
+
+def test_vector_shapes_and_autoreset():
+    venv = VectorPolePositionEnv(num_envs=4, seed=0)
+    obs, _ = venv.reset()
+    assert obs.shape == (4, 17)
+    assert obs.dtype == np.float32
+    done_seen = False
+    for _ in range(venv.max_steps):
+        obs, rew, done, trunc, info = venv.step(np.tile([1.0, 0.0, 0.0, 0.0], (4, 1)))
+        assert rew.shape == (4,)
+        if done.any():
+            done_seen = True
+            assert info["final_observation"].shape == (4, 17)
+            assert np.all(venv.current_step[done] == 0)
+            break
+    assert done_seen
+
+
+def test_vector_rejects_wrong_seed_count():
+    venv = VectorPolePositionEnv(num_envs=3)
+    with pytest.raises(ValueError):
+        venv.reset(seed=[1, 2])
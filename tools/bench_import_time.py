@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Measure ``python -X importtime`` for a module and enforce a budget."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def parse_args() -> argparse.Namespace:
+    """Return CLI arguments."""
+
+    parser = argparse.ArgumentParser(description="Benchmark import time")
+    parser.add_argument("--module", default="super_pole_position")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument(
+        "--budget-ms", type=float, default=None, help="fail if the best run is slower"
+    )
+    parser.add_argument(
+        "--forbid",
+        action="append",
+        default=[],
+        help="fail if this module is imported (repeatable)",
+    )
+    return parser.parse_args()
+
+
+def import_times(module: str) -> dict[str, tuple[int, int]]:
+    """Return ``{name: (self_us, cumulative_us)}`` for one fresh import."""
+
+    env = {**os.environ, "PYTHONPATH": str(ROOT)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env,
+        cwd=ROOT,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    times: dict[str, tuple[int, int]] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        try:
+            self_us, cum_us = int(parts[0]), int(parts[1])
+        except ValueError:  # header row
+            continue
+        times[parts[2].strip()] = (self_us, cum_us)
+    return times
+
+
+def main() -> int:
+    args = parse_args()
+    runs = [import_times(args.module) for _ in range(max(1, args.runs))]
+    best = min(runs, key=lambda t: t.get(args.module, (0, 0))[1])
+    total_ms = best.get(args.module, (0, 0))[1] / 1000
+    print(f"import {args.module}: {total_ms:.1f} ms ({len(best)} modules)")
+    for name, (self_us, _) in sorted(best.items(), key=lambda kv: -kv[1][0])[: args.top]:
+        print(f"  {self_us / 1000:8.2f} ms  {name}")
+
+    failed = False
+    for name in args.forbid:
+        if name in best:
+            print(f"FAIL: {args.module} imports {name}")
+            failed = True
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        print(f"FAIL: {total_ms:.1f} ms exceeds budget of {args.budget_ms:.1f} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Benchmark ``Track.progress`` on a long curved track."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from super_pole_position.physics.car import Car
+from super_pole_position.physics.track import Track
+from super_pole_position.physics.track_curve import TrackCurve
+
+
+def parse_args() -> argparse.Namespace:
+    """Return CLI arguments."""
+
+    parser = argparse.ArgumentParser(description="Benchmark curve projection")
+    parser.add_argument("--length", type=float, default=12000.0)
+    parser.add_argument("--queries", type=int, default=5000)
+    parser.add_argument(
+        "--speed", type=float, default=85.0, help="car speed in m/s (top gear)"
+    )
+    parser.add_argument("--fps", type=float, default=60.0, help="frames per second")
+    parser.add_argument(
+        "--batch", type=int, default=8, help="cars per progress_array call"
+    )
+    return parser.parse_args()
+
+
+def build_track(length: float) -> Track:
+    """Return a winding track with roughly ``length`` one-meter points."""
+
+    segs = []
+    x = 0.0
+    for i in range(int(length // 200)):
+        segs.append((x, 0.0, 0.01 if i % 2 else -0.01, 200.0))
+        x += 200.0
+    curve = TrackCurve.from_tuples(segs)
+    return Track(width=x, height=x, road_width=12.0, curve=curve)
+
+
+def linear_progress(track: Track, x: float, y: float) -> float:
+    """Reference implementation scanning every polyline point."""
+
+    best = 0.0
+    best_dist = float("inf")
+    for d, p in zip(track._curve_lengths, track.curve._points[1:]):
+        dx = x - p[0]
+        dy = y - p[1]
+        dist = dx * dx + dy * dy
+        if dist < best_dist:
+            best_dist = dist
+            best = d
+    return best / track.curve.total_length
+
+
+def main() -> None:
+    args = parse_args()
+    track = build_track(args.length)
+    curve = track.curve
+    # Consecutive queries are one frame of driving apart, as in the env
+    step = args.speed / args.fps
+    path = [
+        (x, y + 3.0)
+        for x, y in (
+            curve.point_at((i * step) % curve.total_length)
+            for i in range(args.queries)
+        )
+    ]
+    print(f"points  : {len(curve._points)}")
+    print(f"step    : {step:.2f} m/query")
+
+    start = time.perf_counter()
+    track.curve.index
+    print(f"index   : built in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    sample = path[:: max(1, args.queries // 200)]
+    start = time.perf_counter()
+    for x, y in sample:
+        linear_progress(track, x, y)
+    linear = (time.perf_counter() - start) / len(sample)
+
+    start = time.perf_counter()
+    for x, y in path:
+        track.progress((x, y))
+    grid = (time.perf_counter() - start) / len(path)
+
+    car = Car(x=0.0, y=0.0)
+    start = time.perf_counter()
+    for x, y in path:
+        car.x, car.y = x, y
+        track.progress(car)
+    hinted = (time.perf_counter() - start) / len(path)
+
+    xs = np.array([p[0] for p in path])
+    ys = np.array([p[1] for p in path])
+    n = len(path) - len(path) % args.batch
+    start = time.perf_counter()
+    for i in range(0, n, args.batch):
+        track.progress_array(xs[i : i + args.batch], ys[i : i + args.batch])
+    batched = (time.perf_counter() - start) / max(n, 1)
+
+    print(f"linear   : {linear * 1e6:9.1f} us/query")
+    print(f"grid     : {grid * 1e6:9.1f} us/query")
+    print(f"grid+hint: {hinted * 1e6:9.1f} us/query ({grid / hinted:.2f}x grid)")
+    print(f"array    : {batched * 1e6:9.1f} us/query (batches of {args.batch})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Compare step throughput of the default env against ``training=True``."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("ALLOW_NET", "0")
+
+from super_pole_position.envs.pole_position import PolePositionEnv
+
+
+def parse_args() -> argparse.Namespace:
+    """Return CLI arguments."""
+
+    parser = argparse.ArgumentParser(description="Benchmark training mode")
+    parser.add_argument("--steps", type=int, default=2000)
+    parser.add_argument("--track", default="fuji")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--profile", action="store_true", help="print per-phase p50/p95/p99"
+    )
+    return parser.parse_args()
+
+
+def run(
+    training: bool, steps: int, track: str, seed: int, profile: bool = False
+) -> tuple[float, float]:
+    """Return ``(construct_seconds, steps_per_second)`` for one configuration."""
+
+    start = time.perf_counter()
+    env = PolePositionEnv(
+        render_mode="human", track_name=track, training=training, profile=profile
+    )
+    construct = time.perf_counter() - start
+    env.reset(seed=seed)
+    action = {"throttle": True, "brake": False, "steer": 0.0}
+    start = time.perf_counter()
+    for _ in range(steps):
+        _, _, done, _, _ = env.step(action)
+        if done:
+            env.reset(seed=seed)
+    elapsed = time.perf_counter() - start
+    if env.profiler is not None:
+        print(f"{'training' if training else 'default'} phases:")
+        print(env.profiler.summary())
+    env.close()
+    return construct, steps / elapsed
+
+
+def main() -> None:
+    args = parse_args()
+    base_init, base_sps = run(False, args.steps, args.track, args.seed, args.profile)
+    fast_init, fast_sps = run(True, args.steps, args.track, args.seed, args.profile)
+    print(f"default : init {base_init * 1000:8.1f} ms  {base_sps:10.0f} steps/s")
+    print(f"training: init {fast_init * 1000:8.1f} ms  {fast_sps:10.0f} steps/s")
+    print(f"speedup : {fast_sps / base_sps:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Replay recorded action traces headlessly and verify their state hashes."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("ALLOW_NET", "0")
+
+from super_pole_position.replay import ReplayError, Trace, replay
+
+
+def parse_args() -> argparse.Namespace:
+    """Return CLI arguments."""
+
+    parser = argparse.ArgumentParser(description="Replay action traces")
+    parser.add_argument("traces", nargs="+", type=Path, help="trace files or dirs")
+    parser.add_argument(
+        "--no-verify", action="store_true", help="skip state hash checks"
+    )
+    return parser.parse_args()
+
+
+def trace_files(paths: list[Path]) -> list[Path]:
+    """Expand directories to the trace files they contain."""
+
+    files: list[Path] = []
+    for path in paths:
+        files.extend(sorted(path.rglob("*.trace")) if path.is_dir() else [path])
+    return files
+
+
+def main() -> int:
+    args = parse_args()
+    failed = steps = 0
+    start = time.perf_counter()
+    files = trace_files(args.traces)
+    for path in files:
+        trace = Trace.load(path)
+        try:
+            replay(trace, verify=not args.no_verify)
+        except ReplayError as exc:
+            failed += 1
+            print(f"{path}: {exc}")
+        steps += len(trace)
+    elapsed = time.perf_counter() - start
+    rate = steps / elapsed if elapsed else 0.0
+    print(f"{len(files)} traces, {steps} steps, {rate:.0f} steps/s, {failed} failed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())